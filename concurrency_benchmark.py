@@ -0,0 +1,95 @@
+import sys
+import threading
+import time
+
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.concurrent import ConcurrentInteractionManager
+
+#İş parçacığı sayısına göre okuma/yazma hızını ölçen stres benchmark
+#Yazmalar tek kilitle sıralanır: yazıcı sayısı arttıkça yazma/sn artmaz, kilit yarışıyla düşer.
+#Kullanım: python concurrency_benchmark.py [süre_saniye] [başlangıç_adedi]
+
+VIDEO_POOL = 100
+
+
+def build_manager(count: int) -> ConcurrentInteractionManager:
+    manager = ConcurrentInteractionManager()
+    for n in range(count):
+        manager.add_interaction(
+            CommentInteraction(f"c{n}", f"user_{n % 500}", f"video_{n % VIDEO_POOL}", f"Yorum {n}")
+        )
+    return manager
+
+
+def writer(manager: ConcurrentInteractionManager, worker: int, count: int, stop: threading.Event, ops: list) -> None:
+    n = 0
+    while not stop.is_set():
+        manager.add_interaction(
+            LikeInteraction(f"l{worker}-{n}", f"user_{n % 500}", f"video_{n % VIDEO_POOL}", "video", "like")
+        )
+        manager.mutate(f"c{(n * 31 + worker) % count}", CommentInteraction.add_like)
+        n += 1
+    ops[worker] = n * 2
+
+
+def reader(manager: ConcurrentInteractionManager, worker: int, stop: threading.Event, ops: list) -> None:
+    n = 0
+    while not stop.is_set():
+        snapshot = manager.snapshot()
+        snapshot.count_by_status()
+        snapshot.report().general_overview()
+        n += 1
+    ops[worker] = n
+
+
+def run_round(threads: int, duration: float, count: int) -> dict:
+    manager = build_manager(count)
+    stop = threading.Event()
+    writers = max(1, threads // 2)
+    readers = max(1, threads - writers)
+    write_ops = [0] * writers
+    read_ops = [0] * readers
+    workers = [
+        threading.Thread(target=writer, args=(manager, k, count, stop, write_ops)) for k in range(writers)
+    ] + [
+        threading.Thread(target=reader, args=(manager, k, stop, read_ops)) for k in range(readers)
+    ]
+    for t in workers:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in workers:
+        t.join()
+
+    #Son durum tutarlılık kontrolü
+    snapshot = manager.snapshot()
+    counted = {"active": 0, "deleted": 0, "flagged": 0}
+    for i in snapshot.interactions:
+        counted[i.status] += 1
+    consistent = counted == snapshot.count_by_status()
+    return {
+        "writers": writers,
+        "readers": readers,
+        "writes_per_second": sum(write_ops) / duration,
+        "reports_per_second": sum(read_ops) / duration,
+        "consistent": consistent,
+    }
+
+
+def run_benchmark(duration: float = 2.0, count: int = 20_000) -> None:
+    print(f" === EŞZAMANLILIK BENCHMARK ({duration} sn / tur, {count} başlangıç kaydı) ===")
+    for threads in (2, 4, 8, 16):
+        r = run_round(threads, duration, count)
+        print(
+            f" {threads} thread ({r['writers']} yazar / {r['readers']} okuyucu): "
+            f"{r['writes_per_second']:.0f} yazma/sn, {r['reports_per_second']:.1f} rapor/sn, "
+            f"tutarlı={r['consistent']}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 2.0,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20_000,
+    )
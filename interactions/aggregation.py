@@ -0,0 +1,108 @@
+from typing import Dict, Any, Iterable
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+#Özet istatistikleri tek geçişte toplayan, birleştirilebilir sınıf
+class SummaryAccumulator:
+    def __init__(self):
+        self.total = 0
+        self.by_type: Dict[str, int] = {}
+        self.by_status: Dict[str, int] = {"active": 0, "deleted": 0, "flagged": 0}
+
+        self.comment_total = 0
+        self.comment_flagged = 0
+        self.comment_popular = 0
+        self.comment_length_sum = 0
+        self.comment_score_sum = 0.0
+
+        self.likes = 0
+        self.dislikes = 0
+
+        self.subscription_total = 0
+        self.subscription_active = 0
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase]) -> "SummaryAccumulator":
+        acc = cls()
+        acc.add_all(interactions)
+        return acc
+
+#Tek bir interaction ekleme
+    def add(self, interaction: InteractionBase) -> None:
+        self.total += 1
+        name = interaction.get_class_name()
+        self.by_type[name] = self.by_type.get(name, 0) + 1
+        status = interaction.status
+        if status in self.by_status:
+            self.by_status[status] += 1
+
+        if isinstance(interaction, CommentInteraction):
+            self.comment_total += 1
+            if interaction.is_flagged():
+                self.comment_flagged += 1
+            if interaction.is_popular():
+                self.comment_popular += 1
+            self.comment_length_sum += len(interaction.comment_text)
+            self.comment_score_sum += interaction.calculate_score()
+        elif isinstance(interaction, LikeInteraction):
+            if interaction.is_like():
+                self.likes += 1
+            elif interaction.is_dislike():
+                self.dislikes += 1
+        elif isinstance(interaction, SubscriptionInteraction):
+            self.subscription_total += 1
+            if interaction.is_subscribed():
+                self.subscription_active += 1
+
+    def add_all(self, interactions: Iterable[InteractionBase]) -> None:
+        for i in interactions:
+            self.add(i)
+
+#İki parçalı sonucu birleştirme (shard / zaman dilimi)
+    def merge(self, other: "SummaryAccumulator") -> "SummaryAccumulator":
+        self.total += other.total
+        for name, count in other.by_type.items():
+            self.by_type[name] = self.by_type.get(name, 0) + count
+        for status, count in other.by_status.items():
+            self.by_status[status] = self.by_status.get(status, 0) + count
+
+        self.comment_total += other.comment_total
+        self.comment_flagged += other.comment_flagged
+        self.comment_popular += other.comment_popular
+        self.comment_length_sum += other.comment_length_sum
+        self.comment_score_sum += other.comment_score_sum
+
+        self.likes += other.likes
+        self.dislikes += other.dislikes
+
+        self.subscription_total += other.subscription_total
+        self.subscription_active += other.subscription_active
+        return self
+
+#Türetilmiş değerler
+    def average_comment_length(self) -> float:
+        if self.comment_total == 0:
+            return 0.0
+        return self.comment_length_sum / self.comment_total
+
+    def average_comment_score(self) -> float:
+        if self.comment_total == 0:
+            return 0.0
+        return self.comment_score_sum / self.comment_total
+
+    def like_ratio(self) -> float:
+        total = self.likes + self.dislikes
+        if total == 0:
+            return 0.0
+        return (self.likes / total) * 100
+
+    def subscription_ratio(self) -> float:
+        if self.subscription_total == 0:
+            return 0.0
+        return (self.subscription_active / self.subscription_total) * 100
+
+    def __str__(self) -> str:
+        return f"SummaryAccumulator(total={self.total})"
@@ -1,13 +1,135 @@
+import sys
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Tuple, List
+
+#Tekrarlanan id'leri tek kopya olarak tutma
+def intern_id(value: Any) -> Any:
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+#Sabit değer kümelerini küçük tam sayılarla saklayan tablo
+#Kümede olmayan değer kaydedilmez ve olduğu gibi saklanır (doğrulama validate() içinde yapılır);
+#böylece tablo yalnızca tanımlı değerlerle sınırlı kalır. extendable tablolar (ör. id sözlükleri)
+#her yeni değere kod verir.
+class CodeTable:
+    def __init__(self, *values: str, extendable: bool = False):
+        self._codes: Dict[str, int] = {}
+        self._values: List[str] = []
+        self.extendable = extendable
+        for v in values:
+            self._register(v)
+
+    def _register(self, value: str) -> int:
+        code = len(self._values)
+        self._codes[value] = code
+        self._values.append(value)
+        return code
+
+    def code(self, value: str) -> int | str:
+        code = self._codes.get(value)
+        if code is None:
+            if not self.extendable:
+                return value
+            code = self._register(value)
+        return code
+
+    #Kodu olmayan değer için -1 (sayısal kolonlar için)
+    def find(self, value: str) -> int:
+        return self._codes.get(value, -1)
+
+    def value(self, code: int | str) -> str:
+        if type(code) is int:
+            return self._values[code]
+        return code
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+STATUS = CodeTable("active", "deleted", "flagged", "inactive")
+
+#Sınıf başına kopyalanan slot adları (gözlemciler hariç)
+_STATE_SLOTS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _state_slots(cls: type) -> Tuple[str, ...]:
+    names = _STATE_SLOTS.get(cls)
+    if names is None:
+        names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("__slots__", ())
+            if name != "_observers"
+        )
+        _STATE_SLOTS[cls] = names
+    return names
 
 class InteractionBase(ABC):
+    __slots__ = ("_observers", "interaction_id", "user_id", "_created_ts", "_status")
+
     def __init__(self, interaction_id: str, user_id: str):
+        #Değişiklikleri dinleyen manager vb. (interaction, alan, eski, yeni)
+        self._observers: Tuple[Callable[..., None], ...] = ()
         self.interaction_id = interaction_id
-        self.user_id = user_id
-        self.created_at = datetime.now()
-        self.status = "active"
+        self.user_id = intern_id(user_id)
+        self._created_ts = time.time()
+        self._status = 0
+
+    @property
+    def status(self) -> str:
+        return STATUS.value(self._status)
+
+    @status.setter
+    def status(self, value: str) -> None:
+        old = self._status
+        self._status = STATUS.code(value)
+        if old != self._status:
+            self._notify("status", STATUS.value(old), value)
+
+#Oluşturulma zamanı epoch saniye olarak saklanır
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self._created_ts)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        old = self._created_ts
+        self._created_ts = value.timestamp()
+        if old != self._created_ts:
+            self._notify("created_at", old, self._created_ts)
+
+    @property
+    def created_ts(self) -> float:
+        return self._created_ts
+
+#Gözlemci işlemleri
+    def add_observer(self, observer: Callable[..., None]) -> None:
+        self._observers = self._observers + (observer,)
+
+    def remove_observer(self, observer: Callable[..., None]) -> None:
+        self._observers = tuple(o for o in self._observers if o != observer)
+
+    def _notify(self, field: str, old: Any, new: Any) -> None:
+        for observer in self._observers:
+            observer(self, field, old, new)
+
+#Kopyalama ve süreçler arası taşıma: gözlemciler (manager vb.) nesneyle birlikte taşınmaz
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        state = {}
+        for name in _state_slots(type(self)):
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return None, state
+
+    def __setstate__(self, state: Tuple[None, Dict[str, Any]]) -> None:
+        self._observers = ()
+        for name, value in state[1].items():
+            setattr(self, name, value)
 
     def is_active(self) -> bool:
         return self.status == "active"
@@ -29,8 +151,7 @@ class InteractionBase(ABC):
 
 
     def get_age_in_seconds(self) -> float:
-        delta = datetime.now() - self.created_at
-        return delta.total_seconds()
+        return time.time() - self._created_ts
     
     def  get_age_in_minutes(self) -> float:
         return self.get_age_in_seconds() / 60
@@ -64,6 +185,12 @@ class InteractionBase(ABC):
     @classmethod
     def get_class_name(cls) -> str:
         return cls.__name__
+
+#to_dict çıktısından ortak alanları geri yükleme
+    def _load_common(self, data: Dict[str, Any]) -> None:
+        self._status = STATUS.code(data.get("status", "active"))
+        if data.get("created_at"):
+            self._created_ts = datetime.fromisoformat(data["created_at"]).timestamp()
     
     @staticmethod
     def format_datetime(dt: datetime) -> str:
@@ -1,8 +1,21 @@
+import re
 from typing import Dict, Any, List, Optional
-from interactions.base import InteractionBase
+from interactions.base import InteractionBase, intern_id
+from interactions.spam import is_spam
+
+#Etiket ve bahsetme: kelime içinde olmayan # / @ ve ardından gelen kelime karakterleri
+#("#Python," -> "Python", "mail@site.com" bahsetme sayılmaz)
+HASHTAG_PATTERN = re.compile(r"(?<!\w)#(\w+)")
+MENTION_PATTERN = re.compile(r"(?<!\w)@(\w+)")
 
 #Yorum etkileşimlerini yöneten sınıf
 class CommentInteraction(InteractionBase):
+    __slots__ = (
+        "video_id", "comment_text", "parent_comment_id",
+        "like_count", "dislike_count", "reply_count",
+        "is_edited", "is_pinned", "_flags"
+    )
+
     def __init__(
             self,
             interaction_id: str,
@@ -12,9 +25,9 @@ class CommentInteraction(InteractionBase):
             parent_comment_id: Optional[str] = None
     ):
         super().__init__(interaction_id, user_id)
-        self.video_id = video_id
+        self.video_id = intern_id(video_id)
         self.comment_text = comment_text
-        self.parent_comment_id = parent_comment_id
+        self.parent_comment_id = intern_id(parent_comment_id)
 
         self.like_count = 0
         self.dislike_count = 0
@@ -23,14 +36,27 @@ class CommentInteraction(InteractionBase):
         self.is_edited = False
         self.is_pinned = False
 
-        self.flags: List[str] = []
-     
+        #Bayrak listesi ilk ihtiyaçta oluşturulur
+        self._flags: Optional[List[str]] = None
+
+    #Kopya döner; değişiklikler add_flag / clear_flags / atama ile yapılır ve bildirilir
+    @property
+    def flags(self) -> List[str]:
+        return list(self._flags or ())
+
+    @flags.setter
+    def flags(self, value: List[str]) -> None:
+        old = tuple(self._flags or ())
+        self._flags = list(value) or None
+        if old != tuple(value):
+            self._notify("flags", old, tuple(value))
+
     #Yorumu işleme
     def process(self) -> bool:
         if not self.validate():
             return False
         if self.detect_basic_spam():
-            self.flags.append("spam")
+            self.add_flag("spam")
             self.set_status("flagged")
             return False
         return True
@@ -51,41 +77,53 @@ class CommentInteraction(InteractionBase):
     def edit_comment(self, new_text: str) -> None:
         if not new_text or len(new_text.strip()) == 0:
             raise ValueError("Yorum metni boş olamaz.")
+        old = self.comment_text
         self.comment_text = new_text
         self.is_edited = True
+        self._notify("comment_text", old, new_text)
 
     def pin(self) -> None:
-        self.is_pinned = True
+        if not self.is_pinned:
+            self.is_pinned = True
+            self._notify("is_pinned", False, True)
 
     def unpin(self) -> None:
-        self.is_pinned = False
+        if self.is_pinned:
+            self.is_pinned = False
+            self._notify("is_pinned", True, False)
+
+    #Sayaç değişikliklerini gözlemcilere bildirme
+    def _set_count(self, field: str, value: int) -> None:
+        old = getattr(self, field)
+        setattr(self, field, value)
+        self._notify(field, old, value)
 
     def add_like(self) -> None:
-        self.like_count += 1
+        self._set_count("like_count", self.like_count + 1)
 
     def remove_like(self) -> None:
         if self.like_count > 0:
-            self.like_count -= 1
+            self._set_count("like_count", self.like_count - 1)
 
     def add_dislike(self) -> None:
-        self.dislike_count += 1
+        self._set_count("dislike_count", self.dislike_count + 1)
 
     def remove_dislike(self) -> None:
         if self.dislike_count > 0:
-            self.dislike_count -= 1
+            self._set_count("dislike_count", self.dislike_count - 1)
 
     def toggle_like(self) -> None:
         if self.like_count > 0:
-            self.like_count -= 1
-            self.dislike_count += 1
+            self._set_count("like_count", self.like_count - 1)
+            self._set_count("dislike_count", self.dislike_count + 1)
         else:
-            self.like_count += 1
+            self._set_count("like_count", self.like_count + 1)
 
     def is_reply(self) -> bool:
         return self.parent_comment_id is not None
     
     def add_reply(self) -> None:
-        self.reply_count += 1
+        self._set_count("reply_count", self.reply_count + 1)
 
     def get_word_count(self) -> int:
         return len(self.comment_text.split())
@@ -128,44 +166,52 @@ class CommentInteraction(InteractionBase):
     
     #Basit spam tespiti
     def detect_basic_spam(self) -> bool:
-        text = self.comment_text.lower()
-
-        if text.count("http") > 2:
-            return True
-        
-        if self.get_character_count() > 100 and self.get_word_count() < 5:
-            return True
-        
-        repeated = 0
-        last_char = " "
-        
-        for c in text:
-            if c == last_char:
-                repeated += 1
-                if repeated > 6:
-                    return True
-            else:
-                repeated = 0
-                last_char = c
-
-        return False
+        return is_spam(self.comment_text)
     
     def find_mentions(self) -> List[str]:
-        return [w[1:] for w in self.comment_text.split() if w.startswith("@")]
+        return MENTION_PATTERN.findall(self.comment_text)
     
     def find_hashtags(self) -> List[str]:
-        return [w[1:] for w in self.comment_text.split() if w.startswith("#")]
+        return HASHTAG_PATTERN.findall(self.comment_text)
     
     def add_flag(self, reason: str) -> None:
-        if reason not in self.flags:
-            self.flags.append(reason)
+        flags = self._flags
+        if flags is None:
+            flags = self._flags = []
+        if reason not in flags:
+            old = tuple(flags)
+            flags.append(reason)
+            self._notify("flags", old, tuple(flags))
 
     def clear_flags(self) -> None:
-        self.flags.clear()
+        if self._flags:
+            old = tuple(self._flags)
+            self._flags.clear()
+            self._notify("flags", old, ())
 
     def is_flagged(self) -> bool:
-        return len(self.flags) > 0 or self.status == "flagged"
-    
+        return bool(self._flags) or self.status == "flagged"
+    
+    #Dictionary formatından nesne oluşturma
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CommentInteraction":
+        comment = cls(
+            data["interaction_id"],
+            data["user_id"],
+            data["video_id"],
+            data["comment_text"],
+            data.get("parent_comment_id")
+        )
+        comment.like_count = data.get("like_count", 0)
+        comment.dislike_count = data.get("dislike_count", 0)
+        comment.reply_count = data.get("reply_count", 0)
+        comment.is_edited = data.get("is_edited", False)
+        comment.is_pinned = data.get("is_pinned", False)
+        if data.get("flags"):
+            comment._flags = list(data["flags"])
+        comment._load_common(data)
+        return comment
+
     #Dictionary formatına çevirme
     def to_dict(self) -> Dict[str, Any]:
         return{
@@ -179,7 +225,7 @@ class CommentInteraction(InteractionBase):
             "reply_count": self.reply_count,
             "is_edited": self.is_edited,
             "is_pinned": self.is_pinned,
-            "flags": self.flags,
+            "flags": list(self._flags or ()),
             "status": self.status,
             "created_at": self.created_at.isoformat()
         }
@@ -0,0 +1,349 @@
+import copy
+import threading
+from collections.abc import Sequence
+from contextlib import ExitStack
+from itertools import chain
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Tuple
+
+from interactions.base import InteractionBase
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.statistics import InteractionStatistics
+
+#Snapshot kopyası: gözlemcisiz ve değişebilir alanları paylaşmayan kopya
+def _freeze(interaction: InteractionBase) -> InteractionBase:
+    clone = copy.copy(interaction)
+    clone._observers = ()
+    flags = getattr(clone, "_flags", None)
+    if flags is not None:
+        clone._flags = list(flags)
+    return clone
+
+#Snapshot parça boyutu: bir nesne değişince yalnızca onun parçası yeniden kopyalanır
+SNAPSHOT_CHUNK = 1024
+
+#Değişmez parçalı dizi: sabit boyutlu tuple parçaları
+#Yeni snapshot değişmeyen parçaları bir öncekiyle paylaşır; yalnızca değişen parçalar ve
+#son parçadan sonra eklenen nesneler kopyalanır.
+class FrozenSequence(Sequence):
+    __slots__ = ("_chunks", "_length")
+
+    def __init__(self, chunks: Tuple[Tuple[InteractionBase, ...], ...] = ()):
+        self._chunks = chunks
+        self._length = sum(len(chunk) for chunk in chunks)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[k] for k in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Snapshot dizini aralık dışında")
+        return self._chunks[index // SNAPSHOT_CHUNK][index % SNAPSHOT_CHUNK]
+
+    def __iter__(self) -> Iterator[InteractionBase]:
+        return chain.from_iterable(self._chunks)
+
+#Değişen konumlar ve yeni nesnelerle türetilmiş dizi (maliyet: parça sayısı + değişen parçalar)
+    def derive(self, changes: Dict[int, InteractionBase], added: List[InteractionBase]) -> "FrozenSequence":
+        chunks = list(self._chunks)
+        by_chunk: Dict[int, List[Tuple[int, InteractionBase]]] = {}
+        for pos, interaction in changes.items():
+            by_chunk.setdefault(pos // SNAPSHOT_CHUNK, []).append((pos % SNAPSHOT_CHUNK, interaction))
+        for k, entries in by_chunk.items():
+            chunk = list(chunks[k])
+            for offset, interaction in entries:
+                chunk[offset] = interaction
+            chunks[k] = tuple(chunk)
+        if added:
+            start = 0
+            if chunks and len(chunks[-1]) < SNAPSHOT_CHUNK:
+                start = SNAPSHOT_CHUNK - len(chunks[-1])
+                chunks[-1] = chunks[-1] + tuple(added[:start])
+            for k in range(start, len(added), SNAPSHOT_CHUNK):
+                chunks.append(tuple(added[k:k + SNAPSHOT_CHUNK]))
+        return FrozenSequence(tuple(chunks))
+
+#Değişmez okuma görünümü: snapshot anındaki nesnelerin kopyaları ve sayaçları
+#Yazmalar bu kopyalara hiçbir zaman dokunmaz, raporlar kilitsiz çalışır
+class InteractionSnapshot:
+    __slots__ = ("epoch", "interactions", "_type_counts", "_status_counts")
+
+    def __init__(
+            self,
+            epoch: int,
+            interactions: FrozenSequence,
+            type_counts: Dict[str, int],
+            status_counts: Dict[str, int]
+    ):
+        self.epoch = epoch
+        self.interactions = interactions
+        self._type_counts = type_counts
+        self._status_counts = status_counts
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def get_total_count(self) -> int:
+        return len(self.interactions)
+
+    def count_by_type(self) -> Dict[str, int]:
+        return {name: count for name, count in self._type_counts.items() if count > 0}
+
+    def count_by_status(self) -> Dict[str, int]:
+        return {s: self._status_counts.get(s, 0) for s in ("active", "deleted", "flagged")}
+
+    def get_by_type(self, interaction_type: type) -> List[InteractionBase]:
+        return [i for i in self.interactions if isinstance(i, interaction_type)]
+
+    def get_by_user(self, user_id: str) -> List[InteractionBase]:
+        return [i for i in self.interactions if i.user_id == user_id]
+
+#Rapor ve istatistik nesneleri snapshot dizisi üzerinde kopyalanmadan oluşturulur
+    def report(self, **kwargs) -> InteractionReport:
+        return InteractionReport(self.interactions, **kwargs)
+
+    def statistics(self, **kwargs) -> InteractionStatistics:
+        return InteractionStatistics(self.interactions, **kwargs)
+
+    def __str__(self) -> str:
+        return f"InteractionSnapshot(epoch={self.epoch}, interactions={len(self.interactions)})"
+
+#Parça sayaçlarında tutulan alanlar ve ortak indekslere dokunan alanlar
+COUNTED_FIELDS = ("status", "like_type", "action_type")
+INDEXED_FIELDS = ("created_at", "comment_text", "target_type")
+
+#Çok iş parçacıklı kullanım için manager
+#Yapısal değişiklikler (ekleme, vacuum, temizleme) yazma kilidiyle sıralanır.
+#Nesne değişiklikleri mutate() ile id'ye göre parçalanmış kilitlerle yapılır; değişiklik bildirimi de
+#nesnenin parça kilidi altında işlenir: sayaç farkları, değişen nesneler ve epoch parçaya yazılır.
+#Yazma kilidi yalnızca ortak yapılara (zaman / arama indeksi, beğeni kovaları, kolon tablosu, bağlı
+#bileşenler) yayılması gereken değişikliklerde alınır; bu yapılar iş parçacığı güvenli değildir.
+#Okuyucular snapshot() ile epoch'a bağlı değişmez görünüm alır. Snapshot bir öncekinden türetilir:
+#yazma kilidi altında yalnızca yeni nesnelerin referansları alınır, kopyalama parça parça ve yalnızca
+#o parçanın kilidi altında yapılır. Sayımlar kopyalardan artımlı hesaplanır.
+#Vacuum / temizleme sonrası ilk snapshot tüm nesneleri (yine parça parça) kopyalar.
+class ConcurrentInteractionManager(InteractionManager):
+    def __init__(self, lock_stripes: int = 16, **kwargs):
+        if lock_stripes <= 0:
+            raise ValueError("Kilit sayısı pozitif olmalıdır.")
+        self._write_lock = threading.RLock()
+        #Bildirimler mutate içindeyken aynı parça kilidini yeniden alır
+        self._stripes = [threading.RLock() for _ in range(lock_stripes)]
+        #Parça başına: sayaç farkları ((alan, değer) -> fark), son snapshot'tan beri değişen nesneler, epoch
+        self._deltas: List[Dict[Tuple[str, Any], int]] = [{} for _ in range(lock_stripes)]
+        self._dirty: List[Dict[int, InteractionBase]] = [{} for _ in range(lock_stripes)]
+        self._ticks = [0] * lock_stripes
+        #Yapısal epoch ve vacuum / temizleme sayısı (yazma kilidi altında artar)
+        self._structure_epoch = 0
+        self._generation = 0
+        #Snapshot üretimi tek iş parçacığında yapılır; taban durumu bu kilitle korunur
+        self._snapshot_lock = threading.Lock()
+        self._snapshot: InteractionSnapshot | None = None
+        self._snapshot_generation = -1
+        #Snapshot'taki nesneler ve konumları (id(nesne) -> sıra)
+        self._live: List[InteractionBase] = []
+        self._positions: Dict[int, int] = {}
+        super().__init__(**kwargs)
+
+    def _stripe_index(self, interaction_id: str) -> int:
+        return hash(interaction_id) % len(self._stripes)
+
+    def _stripe(self, interaction_id: str) -> threading.RLock:
+        return self._stripes[self._stripe_index(interaction_id)]
+
+#Yazma işlemleri
+    def add_interaction(self, interaction: InteractionBase) -> None:
+        with self._write_lock:
+            super().add_interaction(interaction)
+            self._structure_epoch += 1
+
+    def commit_batch(self, batch: List[Any], prepared=None, offset: int = 0, scorer=None) -> Dict[str, Any]:
+        with self._write_lock:
+            report = super().commit_batch(batch, prepared, offset, scorer)
+            self._structure_epoch += 1
+        return report
+
+    def remove_interaction(self, interaction_id: str) -> bool:
+        with self._stripe(interaction_id):
+            return super().remove_interaction(interaction_id)
+
+#Nesne değişikliği: aynı id'ye yapılan değişiklikler sıralanır,
+#snapshot alınırken parçasındaki hiçbir değişiklik yarım kalmaz
+#ör. manager.mutate("c1", CommentInteraction.add_like)
+    def mutate(self, interaction_id: str, action: Callable[..., Any], *args) -> Any:
+        with self._stripe(interaction_id):
+            interaction = self.get_by_id(interaction_id)
+            if interaction is None:
+                return None
+            return action(interaction, *args)
+
+#Kilit sırası her yerde parça kilidi, sonra yazma kilidi; bu yüzden yapısal yazmalar (yazma kilidi
+#tutulurken) manager'daki nesneleri değiştirmemelidir
+    def _on_interaction_changed(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        k = self._stripe_index(interaction.interaction_id)
+        with self._stripes[k]:
+            if field in COUNTED_FIELDS:
+                deltas = self._deltas[k]
+                deltas[(field, old)] = deltas.get((field, old), 0) - 1
+                deltas[(field, new)] = deltas.get((field, new), 0) + 1
+            if field in INDEXED_FIELDS or self.table is not None or self._attached:
+                with self._write_lock:
+                    self._apply_change(interaction, field, old, new)
+            self._dirty[k][id(interaction)] = interaction
+            self._ticks[k] += 1
+
+#Parça sayaç farklarını manager sayaçlarına aktarma
+    def _fold_counts(self) -> None:
+        counters = {
+            "status": self._status_counts,
+            "like_type": self._like_type_counts,
+            "action_type": self._action_type_counts,
+        }
+        for k, lock in enumerate(self._stripes):
+            with lock:
+                deltas = self._deltas[k]
+                if not deltas:
+                    continue
+                self._deltas[k] = {}
+                with self._write_lock:
+                    for (field, value), delta in deltas.items():
+                        counters[field][value] += delta
+
+    def count_by_status(self) -> Dict[str, int]:
+        self._fold_counts()
+        return super().count_by_status()
+
+    def count_likes(self) -> int:
+        self._fold_counts()
+        return super().count_likes()
+
+    def count_dislikes(self) -> int:
+        self._fold_counts()
+        return super().count_dislikes()
+
+    def count_subscriptions(self) -> int:
+        self._fold_counts()
+        return super().count_subscriptions()
+
+    def count_unsubscriptions(self) -> int:
+        self._fold_counts()
+        return super().count_unsubscriptions()
+
+    def vacuum(self, *args, **kwargs) -> Dict[str, Any]:
+        with self._write_lock:
+            return super().vacuum(*args, **kwargs)
+
+    def vacuum_all(self, *args, **kwargs) -> Dict[str, Any]:
+        with self._write_lock:
+            return super().vacuum_all(*args, **kwargs)
+
+    def purge(self, interaction_ids: Iterable[str]) -> int:
+        with self._write_lock:
+            return super().purge(interaction_ids)
+
+    def _drop(self, dropped: List[InteractionBase], components: List[Any] | None = None) -> None:
+        super()._drop(dropped, components)
+        #Konumlar kaydı, sonraki snapshot baştan kurulur
+        self._reset_snapshot_base()
+
+    def clear_all(self) -> None:
+        with ExitStack() as stack:
+            #Bekleyen sayaç farkları da atılır
+            for lock in self._stripes:
+                stack.enter_context(lock)
+            stack.enter_context(self._write_lock)
+            super().clear_all()
+            for k in range(len(self._stripes)):
+                self._deltas[k] = {}
+                self._dirty[k] = {}
+            self._reset_snapshot_base()
+
+    def attach(self, component: Any) -> None:
+        with self._write_lock:
+            super().attach(component)
+
+    def detach(self, component: Any) -> None:
+        with self._write_lock:
+            super().detach(component)
+
+#Okuma görünümü (aynı epoch için önbellekten döner)
+    def snapshot(self) -> InteractionSnapshot:
+        current = self._snapshot
+        if current is not None and current.epoch == self.epoch:
+            return current
+        with self._snapshot_lock:
+            current = self._snapshot
+            if current is not None and current.epoch == self.epoch:
+                return current
+            #Yazma kilidi altında yalnızca yapısal durum ve yeni nesnelerin referansları alınır
+            with self._write_lock:
+                generation = self._generation
+                structure = self._structure_epoch
+                if current is None or self._snapshot_generation != generation:
+                    current = None
+                    self._live = []
+                    self._positions = {}
+                start = len(self._live)
+                new_items = self.interactions[start:]
+            base = current.interactions if current is not None else FrozenSequence()
+            type_counts = dict(current._type_counts) if current is not None else {}
+            status_counts = dict(current._status_counts) if current is not None else {}
+            live = self._live
+            positions = self._positions
+
+            by_stripe: Dict[int, List[int]] = {}
+            for offset, interaction in enumerate(new_items):
+                by_stripe.setdefault(self._stripe_index(interaction.interaction_id), []).append(offset)
+            live.extend(new_items)
+            added: List[InteractionBase] = [None] * len(new_items)
+            changes: Dict[int, InteractionBase] = {}
+            ticks = 0
+            #Her parça yalnızca kendi kilidi altında kopyalanır; parçadaki değişiklikler ya tamamen
+            #bu snapshot'a girer ya da bir sonrakine kalır
+            for k, lock in enumerate(self._stripes):
+                with lock:
+                    dirty = self._dirty[k]
+                    self._dirty[k] = {}
+                    ticks += self._ticks[k]
+                    for offset in by_stripe.get(k, ()):
+                        interaction = new_items[offset]
+                        positions[id(interaction)] = start + offset
+                        added[offset] = _freeze(interaction)
+                    for key, interaction in dirty.items():
+                        pos = positions.get(key)
+                        #Snapshot sonrası eklenenler sonraki snapshot'ta yeni nesne olarak kopyalanır
+                        if pos is not None and pos < start and live[pos] is interaction:
+                            changes[pos] = _freeze(interaction)
+
+            for pos, frozen in changes.items():
+                status_counts[base[pos].status] -= 1
+                status_counts[frozen.status] = status_counts.get(frozen.status, 0) + 1
+            for frozen in added:
+                name = frozen.get_class_name()
+                type_counts[name] = type_counts.get(name, 0) + 1
+                status_counts[frozen.status] = status_counts.get(frozen.status, 0) + 1
+
+            self._snapshot = InteractionSnapshot(
+                structure + ticks,
+                base.derive(changes, added),
+                type_counts,
+                status_counts,
+            )
+            self._snapshot_generation = generation
+            return self._snapshot
+
+    def _reset_snapshot_base(self) -> None:
+        #Yazma kilidi altında çağrılır; konumlar eskidiği için sonraki snapshot baştan kurulur
+        self._generation += 1
+        self._structure_epoch += 1
+
+    @property
+    def epoch(self) -> int:
+        return self._structure_epoch + sum(self._ticks)
+
+    def __str__(self) -> str:
+        return f"ConcurrentInteractionManager(total={len(self.interactions)}, epoch={self.epoch})"
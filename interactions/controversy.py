@@ -0,0 +1,168 @@
+import heapq
+from typing import Dict, Any, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  #numpy opsiyonel bağımlılık
+    np = None
+
+from interactions.base import InteractionBase
+from interactions.like import LikeInteraction, MIN_REACTIONS, MIN_BALANCE_RATIO
+from interactions.reactions import ReactionStore
+
+
+#Tartışma puanı: tepki sayısı ** (az olan / çok olan); tartışmalı olmayan hedef 0 alır
+def controversy_score(likes: int, dislikes: int) -> float:
+    if not LikeInteraction.is_controversial(likes, dislikes):
+        return 0.0
+    return float(likes + dislikes) ** (min(likes, dislikes) / max(likes, dislikes))
+
+#Vektörel değerlendirme: numpy varsa dizilerle, yoksa LikeInteraction metotlarıyla
+def controversial_mask(likes: Sequence[int], dislikes: Sequence[int]) -> Any:
+    if np is None:
+        return [LikeInteraction.is_controversial(l, d) for l, d in zip(likes, dislikes)]
+    likes = np.asarray(likes, dtype=np.int64)
+    dislikes = np.asarray(dislikes, dtype=np.int64)
+    total = likes + dislikes
+    ratio = np.minimum(likes, dislikes) / np.maximum(total, 1)
+    return (total >= MIN_REACTIONS) & (ratio >= MIN_BALANCE_RATIO)
+
+
+def sentiments(likes: Sequence[int], dislikes: Sequence[int]) -> Any:
+    if np is None:
+        return [LikeInteraction.calculate_sentiment(l, d) for l, d in zip(likes, dislikes)]
+    likes = np.asarray(likes, dtype=np.float64)
+    dislikes = np.asarray(dislikes, dtype=np.float64)
+    total = likes + dislikes
+    return np.where(total > 0, (likes - dislikes) / np.maximum(total, 1) * 100.0, 0.0)
+
+
+def controversy_scores(likes: Sequence[int], dislikes: Sequence[int]) -> Any:
+    if np is None:
+        return [controversy_score(l, d) for l, d in zip(likes, dislikes)]
+    mask = controversial_mask(likes, dislikes)
+    likes = np.asarray(likes, dtype=np.float64)
+    dislikes = np.asarray(dislikes, dtype=np.float64)
+    balance = np.minimum(likes, dislikes) / np.maximum(np.maximum(likes, dislikes), 1)
+    return np.where(mask, (likes + dislikes) ** balance, 0.0)
+
+#Tartışmalı içerik indeksi
+#Hedef başına like / dislike sayıları ReactionStore'dan okunur; depo her sayaç değişikliğinde
+#haber verir ve yalnızca o hedefin puanı yenilenir. Tartışmalı hedefler tür başına tembel
+#silmeli heap'te tutulur, "en tartışmalı" sorgusu ilk N girişi okur.
+#Manager'a attach() ile bağlanabilir (olaylar depoya iletilir) veya bağlı bir depo verilebilir.
+class ControversyIndex:
+    def __init__(self, reactions: ReactionStore | None = None):
+        self.reactions = reactions if reactions is not None else ReactionStore()
+        #(target_type, target_id) -> puan; yalnızca tartışmalı hedefler
+        self._scores: Dict[Tuple[str, str], float] = {}
+        #target_type -> (-puan, target_id) heap'i
+        self._heaps: Dict[str, List[Tuple[float, str]]] = {}
+        for key, (likes, dislikes) in self.reactions.tallies().items():
+            self._refresh(key, likes, dislikes)
+        self.reactions.add_watcher(self._refresh)
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase]) -> "ControversyIndex":
+        return cls(ReactionStore.from_interactions(interactions))
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+#Tek hedefin puanını yenileme (depo dinleyicisi)
+    def _refresh(self, key: Tuple[str, str], likes: int, dislikes: int) -> None:
+        score = controversy_score(likes, dislikes)
+        if not score:
+            self._scores.pop(key, None)
+            return
+        if self._scores.get(key) == score:
+            return
+        self._scores[key] = score
+        heap = self._heaps.get(key[0])
+        if heap is None:
+            heap = self._heaps[key[0]] = []
+        heapq.heappush(heap, (-score, key[1]))
+        if len(heap) > 2 * len(self._scores) + 64:
+            self._compact(key[0])
+
+    def _compact(self, target_type: str) -> None:
+        scores = self._scores
+        heap = [entry for entry in self._heaps[target_type] if scores.get((target_type, entry[1])) == -entry[0]]
+        heapq.heapify(heap)
+        self._heaps[target_type] = heap
+
+#Manager olayları (attach ile bağlanır; sayaçlar depoda tutulur)
+    def add(self, interaction: InteractionBase) -> None:
+        self.reactions.add(interaction)
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        self.reactions.update(interaction, field, old, new)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        self.reactions.remove(interaction)
+
+    def clear(self) -> None:
+        self.reactions.clear()
+        self._scores.clear()
+        self._heaps.clear()
+
+#Sorgular
+    def _describe(self, target_type: str, target_id: str) -> Dict[str, Any]:
+        counts = self.reactions.counts(target_id, target_type)
+        likes, dislikes = counts["likes"], counts["dislikes"]
+        return {
+            "target_id": target_id,
+            "target_type": target_type,
+            "likes": likes,
+            "dislikes": dislikes,
+            "score": self._scores.get((target_type, target_id), 0.0),
+            "sentiment": LikeInteraction.calculate_sentiment(likes, dislikes),
+        }
+
+#En tartışmalı N hedef: geçerli girişler çekilir ve geri konur (O(N log n))
+    def most_controversial(self, target_type: str = "video", limit: int = 10) -> List[Dict[str, Any]]:
+        heap = self._heaps.get(target_type, [])
+        scores = self._scores
+        taken: List[Tuple[float, str]] = []
+        seen = set()
+        while heap and len(taken) < limit:
+            entry = heapq.heappop(heap)
+            if scores.get((target_type, entry[1])) != -entry[0] or entry[1] in seen:
+                continue
+            seen.add(entry[1])
+            taken.append(entry)
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        return [self._describe(target_type, target_id) for _, target_id in taken]
+
+    def most_controversial_videos(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return self.most_controversial("video", limit)
+
+    def most_controversial_comments(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return self.most_controversial("comment", limit)
+
+    def is_controversial(self, target_id: str, target_type: str = "video") -> bool:
+        return (target_type, target_id) in self._scores
+
+    def count(self, target_type: str | None = None) -> int:
+        if target_type is None:
+            return len(self._scores)
+        return sum(1 for kind, _ in self._scores if kind == target_type)
+
+#Tüm hedeflerin tek geçişte vektörel değerlendirmesi
+    def evaluate(self, target_type: str | None = None) -> Dict[str, Any]:
+        tallies = self.reactions.tallies(target_type)
+        keys = list(tallies)
+        likes = [tally[0] for tally in tallies.values()]
+        dislikes = [tally[1] for tally in tallies.values()]
+        return {
+            "targets": keys,
+            "likes": likes,
+            "dislikes": dislikes,
+            "controversial": controversial_mask(likes, dislikes),
+            "sentiment": sentiments(likes, dislikes),
+            "score": controversy_scores(likes, dislikes),
+        }
+
+    def __str__(self) -> str:
+        return f"ControversyIndex(controversial={len(self._scores)}, reactions={len(self.reactions)})"
@@ -0,0 +1,260 @@
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, Any, Callable, Deque, Iterable, List, Optional, Tuple
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+from interactions.sketches import hash64
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+#MinHash (tek permütasyon): karakter parçacıkları (shingle) bir kez hash'lenip kutulara
+#dağıtılır, her kutunun en küçük değeri tutulur; boş kutular sağdaki dolu kutudan doldurulur.
+#Kutular 16 bitlik şeritler halinde tek bir tamsayıda paketlenir.
+#Parçacıklar hash64 ile hash'lenir; imzalar süreçler ve PYTHONHASHSEED değerleri arasında aynıdır.
+LANE_BITS = 16
+LANE_MASK = (1 << LANE_BITS) - 1
+
+
+def minhash(text: str, bins: int = 32, shingle: int = 4) -> int:
+    text = normalize_text(text)
+    parts = {text[k:k + shingle] for k in range(max(1, len(text) - shingle + 1))}
+    mins: List[int | None] = [None] * bins
+    for part in parts:
+        h = hash64(part)
+        b = h % bins
+        v = h // bins
+        current = mins[b]
+        if current is None or v < current:
+            mins[b] = v
+    #Yoğunlaştırma: boş kutu, sağındaki ilk dolu kutunun değerini uzaklığa göre kaydırarak alır
+    dense = list(mins)
+    source = None
+    for k in range(2 * bins - 1, -1, -1):
+        b = k % bins
+        if mins[b] is not None:
+            source = b
+        elif k < bins:
+            dense[b] = mins[source] + ((source - b) % bins) * 0x9E3779B1
+    signature = 0
+    for v in dense:
+        signature = (signature << LANE_BITS) | (v & LANE_MASK)
+    return signature
+
+#Eşit şerit sayısı: sıfır olan 16 bitlik şeritler bit hileleriyle sayılır
+def lane_pattern(lanes: int, value: int) -> int:
+    pattern = 0
+    for _ in range(lanes):
+        pattern = (pattern << LANE_BITS) | value
+    return pattern
+
+
+def matching_lanes(a: int, b: int, lanes: int, low: int, high: int) -> int:
+    x = a ^ b
+    nonzero = (((x & low) + low) | x) & high
+    return lanes - nonzero.bit_count()
+
+#LSH bantları: (kaydırma, maske); her bant rows şeritten oluşur
+def band_layout(bands: int, rows: int) -> List[Tuple[int, int]]:
+    if bands <= 0 or rows <= 0:
+        raise ValueError("Bant ve satır sayısı pozitif olmalıdır.")
+    width = rows * LANE_BITS
+    return [(k * width, (1 << width) - 1) for k in range(bands)]
+
+#Yakın kopya yorum dedektörü (kopyala-yapıştır seli)
+#Son yorumların MinHash imzaları LSH bantlarına bölünerek kovalarda tutulur; yeni yorum yalnızca
+#bantlarından birini paylaşan adaylarla karşılaştırılır. İmzalar ekleme sırasıyla tutulur,
+#pencere dışına çıkan veya kapasiteyi aşan en eski imzalar her eklemede atılır.
+#Düzenlenen yorumun eski imzası kovalardan çıkarılır; sıradaki yeri -1 ile işaretlenir ve
+#en eski imza olarak atıldığında yok sayılır.
+#Manager'a attach() ile bağlanır; threshold kadar yakın yorum bulunursa add_flag çağrılır.
+class NearDuplicateDetector:
+    def __init__(
+            self,
+            threshold: int = 3,
+            similarity: float = 0.6,
+            bands: int = 5,
+            rows: int = 3,
+            window: timedelta = timedelta(hours=6),
+            max_entries: int = 2000000,
+            min_length: int = 20,
+            shingle: int = 4,
+            reason: str = "near_duplicate",
+            clock: Optional[Callable[[], datetime]] = None
+    ):
+        if threshold <= 0 or max_entries <= 0:
+            raise ValueError("Eşik ve kapasite pozitif olmalıdır.")
+        if not 0.0 < similarity <= 1.0:
+            raise ValueError("Benzerlik 0 ile 1 arasında olmalıdır.")
+        self.threshold = threshold
+        self.similarity = similarity
+        self.window = window
+        self.max_entries = max_entries
+        self.min_length = min_length
+        self.shingle = shingle
+        self.reason = reason
+        self.clock = clock or datetime.now
+        self._layout = band_layout(bands, rows)
+        self._lanes = bands * rows
+        self._low = lane_pattern(self._lanes, LANE_MASK >> 1)
+        self._high = lane_pattern(self._lanes, 1 << (LANE_BITS - 1))
+        #Yakın sayılmak için gereken en az eşit şerit sayısı
+        self._min_lanes = max(1, int(similarity * self._lanes + 0.5))
+
+        #Ekleme sırasıyla zaman damgaları ve imzalar (-1: düzenlenmiş yorumun çıkarılmış imzası)
+        self._stamps: Deque[float] = deque()
+        self._signatures: Deque[int] = deque()
+        self._removed = 0
+        #yorum -> imzasının sıra numarası; en eski imzanın numarası _next_entry - len(_signatures)
+        self._entries: Dict[CommentInteraction, int] = {}
+        self._next_entry = 0
+        #bant -> bant değeri -> imzalar (ekleme sırasıyla; en eski başta)
+        #Çoğu kovada tek imza bulunur; bellek için tek imza deque yerine doğrudan saklanır.
+        self._buckets: List[Dict[int, int | Deque[int]]] = [{} for _ in self._layout]
+        self.checked = 0
+        self.flagged = 0
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase], **kwargs) -> "NearDuplicateDetector":
+        detector = cls(**kwargs)
+        for i in interactions:
+            detector.add(i)
+        return detector
+
+    def __len__(self) -> int:
+        return len(self._signatures) - self._removed
+
+    def signature(self, text: str) -> int:
+        return minhash(text, self._lanes, self.shingle)
+
+#İmzayı kovalarından çıkarma; eşit imzalar birbirinin yerine geçer, ilk eşit değer silinir
+    def _unlink(self, signature: int) -> None:
+        for (shift, mask), buckets in zip(self._layout, self._buckets):
+            key = (signature >> shift) & mask
+            bucket = buckets[key]
+            if type(bucket) is int:
+                del buckets[key]
+            else:
+                bucket.remove(signature)
+                if len(bucket) == 1:
+                    buckets[key] = bucket[0]
+
+#Eskiyen imzaları atma: en eski imza genellikle kovasının başındadır
+    def _drop_oldest(self) -> None:
+        self._stamps.popleft()
+        signature = self._signatures.popleft()
+        if signature < 0:
+            self._removed -= 1
+        else:
+            self._unlink(signature)
+        if len(self._entries) > 2 * len(self._signatures) + 1024:
+            first = self._next_entry - len(self._signatures)
+            self._entries = {c: entry for c, entry in self._entries.items() if entry >= first}
+
+    def _evict(self) -> None:
+        cutoff = self.clock().timestamp() - self.window.total_seconds()
+        stamps = self._stamps
+        while stamps and stamps[0] < cutoff:
+            self._drop_oldest()
+
+    def _insert(self, signature: int, stamp: float) -> None:
+        self._stamps.append(stamp)
+        self._signatures.append(signature)
+        for (shift, mask), buckets in zip(self._layout, self._buckets):
+            key = (signature >> shift) & mask
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = signature
+            elif type(bucket) is int:
+                buckets[key] = deque((bucket, signature))
+            else:
+                bucket.append(signature)
+        self._next_entry += 1
+        if len(self._signatures) > self.max_entries:
+            self._drop_oldest()
+
+#Yorumun indeksteki imzasını çıkarma (metin düzenlenince)
+    def _discard(self, comment: CommentInteraction) -> None:
+        entry = self._entries.pop(comment, None)
+        if entry is None:
+            return
+        position = entry - (self._next_entry - len(self._signatures))
+        if position < 0:
+            return
+        signature = self._signatures[position]
+        self._signatures[position] = -1
+        self._removed += 1
+        self._unlink(signature)
+
+#Yakın imza sayımı; limit'e ulaşınca durur (en yeni adaylardan başlanır)
+#Birden fazla bantta eşleşen imza yalnızca eşleştiği ilk bantta sayılır.
+    def _count_similar(self, signature: int, limit: int) -> int:
+        lanes, low, high, min_lanes = self._lanes, self._low, self._high, self._min_lanes
+        found = 0
+        earlier: List[Tuple[int, int, int]] = []
+        for (shift, mask), buckets in zip(self._layout, self._buckets):
+            key = (signature >> shift) & mask
+            bucket = buckets.get(key)
+            if bucket is not None:
+                for other in reversed(bucket) if type(bucket) is not int else (bucket,):
+                    if matching_lanes(signature, other, lanes, low, high) < min_lanes:
+                        continue
+                    if any((other >> s) & m == k for s, m, k in earlier):
+                        continue
+                    found += 1
+                    if found >= limit:
+                        return found
+            earlier.append((shift, mask, key))
+        return found
+
+    def count_similar(self, text: str, limit: int | None = None) -> int:
+        self._evict()
+        return self._count_similar(self.signature(text), limit or len(self._signatures) + 1)
+
+    def is_near_duplicate(self, text: str) -> bool:
+        if len(text) < self.min_length:
+            return False
+        return self.count_similar(text, self.threshold) >= self.threshold
+
+#Yorum kontrolü: önce mevcut imzalarla karşılaştırılır, sonra indekse eklenir
+    def check(self, comment: CommentInteraction) -> bool:
+        text = comment.comment_text
+        if len(text) < self.min_length:
+            return False
+        self._evict()
+        self.checked += 1
+        signature = self.signature(text)
+        duplicate = self._count_similar(signature, self.threshold) >= self.threshold
+        self._insert(signature, comment.created_ts)
+        self._entries[comment] = self._next_entry - 1
+        if duplicate:
+            self.flagged += 1
+            comment.add_flag(self.reason)
+        return duplicate
+
+#Manager olayları (attach ile bağlanır)
+    def add(self, interaction: InteractionBase) -> None:
+        if isinstance(interaction, CommentInteraction):
+            self.check(interaction)
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        #Düzenlenen metin eski imzanın yerine yeni bir gönderi gibi kontrol edilir
+        if field == "comment_text" and isinstance(interaction, CommentInteraction):
+            self._discard(interaction)
+            self.check(interaction)
+
+    def clear(self) -> None:
+        self._stamps.clear()
+        self._signatures.clear()
+        self._removed = 0
+        self._entries.clear()
+        self._next_entry = 0
+        self._buckets = [{} for _ in self._layout]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"signatures": len(self), "checked": self.checked, "flagged": self.flagged}
+
+    def __str__(self) -> str:
+        return f"NearDuplicateDetector(signatures={len(self)}, flagged={self.flagged})"
@@ -0,0 +1,106 @@
+import csv
+import gzip
+import json
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Union
+
+from interactions.base import InteractionBase
+
+#Kolon seçimi: tüm türler için tek liste ya da sınıf adı -> kolon listesi
+Columns = Union[List[str], Dict[str, List[str]], None]
+
+#CSV başlığı için varsayılan kolon sırası (tüm türlerin alanları)
+CSV_COLUMNS = [
+    "interaction_id", "user_id", "status", "created_at",
+    "video_id", "parent_comment_id", "comment_text",
+    "like_count", "dislike_count", "reply_count",
+    "is_edited", "is_pinned", "flags",
+    "target_id", "target_type", "like_type",
+    "channel_id", "action_type", "notification_level", "tier",
+]
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _project(data: Dict[str, Any], interaction: InteractionBase, columns: Columns) -> Dict[str, Any]:
+    if columns is None:
+        return data
+    if isinstance(columns, dict):
+        selected = columns.get(interaction.get_class_name())
+        if selected is None:
+            return data
+    else:
+        selected = columns
+    return {k: data[k] for k in selected if k in data}
+
+#Interactionları tek tek sözlüğe çeviren üreteç
+def iter_dicts(interactions: Iterable[InteractionBase], columns: Columns = None) -> Iterator[Dict[str, Any]]:
+    for i in interactions:
+        yield _project(i.to_dict(), i, columns)
+
+#Dosya açma (.gz uzantısında gzip)
+def open_export(path: str, compress: Optional[bool] = None) -> TextIO:
+    if compress is None:
+        compress = path.endswith(".gz")
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+#NDJSON yazma (her satır bir JSON nesnesi)
+def write_ndjson(
+        interactions: Iterable[InteractionBase],
+        fh: TextIO,
+        columns: Columns = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    count = 0
+    chunk: List[str] = []
+    for data in iter_dicts(interactions, columns):
+        chunk.append(json.dumps(data, ensure_ascii=False))
+        count += 1
+        if len(chunk) >= chunk_size:
+            fh.write("\n".join(chunk) + "\n")
+            chunk.clear()
+    if chunk:
+        fh.write("\n".join(chunk) + "\n")
+    return count
+
+#CSV yazma (listeler "|" ile birleştirilir)
+def write_csv(
+        interactions: Iterable[InteractionBase],
+        fh: TextIO,
+        columns: Optional[List[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    header = columns or CSV_COLUMNS
+    writer = csv.DictWriter(fh, fieldnames=header, restval="", extrasaction="ignore")
+    writer.writeheader()
+
+    count = 0
+    chunk: List[Dict[str, Any]] = []
+    for data in iter_dicts(interactions):
+        for key, value in data.items():
+            if isinstance(value, list):
+                data[key] = "|".join(value)
+        chunk.append(data)
+        count += 1
+        if len(chunk) >= chunk_size:
+            writer.writerows(chunk)
+            chunk.clear()
+    if chunk:
+        writer.writerows(chunk)
+    return count
+
+#Format adına göre yazma
+def write_export(
+        interactions: Iterable[InteractionBase],
+        fh: TextIO,
+        fmt: str = "ndjson",
+        columns: Columns = None
+) -> int:
+    if fmt == "ndjson":
+        return write_ndjson(interactions, fh, columns)
+    if fmt == "csv":
+        if isinstance(columns, dict):
+            raise ValueError("CSV için tür bazlı kolon seçimi desteklenmez.")
+        return write_csv(interactions, fh, columns)
+    raise ValueError("Geçersiz export formatı")
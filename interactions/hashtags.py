@@ -0,0 +1,231 @@
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+
+#Varsayılan trend pencereleri
+TREND_WINDOWS: Dict[str, timedelta] = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+}
+
+#Kayan pencere sayacı: pencere slots dilime bölünür, her dilim kendi sayımlarını tutar
+#Zaman ilerledikçe yalnızca süresi dolan dilimler toplamdan düşülür (yorumlar yeniden taranmaz).
+#Pencere sınırı dilim hassasiyetindedir (1 saatlik pencere ve 60 dilim için 1 dakika).
+class SlidingWindowCounter:
+    def __init__(self, window: timedelta, slots: int = 60):
+        if window.total_seconds() <= 0 or slots <= 0:
+            raise ValueError("Pencere süresi ve dilim sayısı pozitif olmalıdır.")
+        self.window = window
+        self.slots = slots
+        self._width = window.total_seconds() / slots
+        #dilim numarası -> anahtar -> sayı
+        self._buckets: Dict[int, Dict[str, int]] = {}
+        self._totals: Dict[str, int] = {}
+        #Bu numaraya kadar (hariç) olan dilimler düşülmüştür
+        self._floor: int | None = None
+
+    def _slot(self, ts: float) -> int:
+        return int(ts // self._width)
+
+    def add(self, key: str, ts: float, count: int = 1) -> None:
+        slot = self._slot(ts)
+        if self._floor is not None and slot < self._floor:
+            return
+        bucket = self._buckets.get(slot)
+        if bucket is None:
+            bucket = self._buckets[slot] = {}
+        value = bucket.get(key, 0) + count
+        if value:
+            bucket[key] = value
+        else:
+            del bucket[key]
+            if not bucket:
+                del self._buckets[slot]
+        total = self._totals.get(key, 0) + count
+        if total:
+            self._totals[key] = total
+        else:
+            del self._totals[key]
+
+    def discard(self, key: str, ts: float, count: int = 1) -> None:
+        #Süresi dolmuş dilimdeki kayıt zaten toplamda değildir
+        bucket = self._buckets.get(self._slot(ts))
+        if bucket is not None and bucket.get(key, 0) >= count:
+            self.add(key, ts, -count)
+
+#Pencereyi ilerletme: yalnızca yeni süresi dolan dilimler işlenir
+    def advance(self, now: float) -> None:
+        floor = self._slot(now) - self.slots + 1
+        if self._floor is not None and floor <= self._floor:
+            return
+        start = self._floor if self._floor is not None else floor
+        if self._floor is None or floor - start > len(self._buckets):
+            expired = [slot for slot in self._buckets if slot < floor]
+        else:
+            expired = range(start, floor)
+        totals = self._totals
+        for slot in expired:
+            bucket = self._buckets.pop(slot, None)
+            if bucket is None:
+                continue
+            for key, count in bucket.items():
+                total = totals[key] - count
+                if total:
+                    totals[key] = total
+                else:
+                    del totals[key]
+        self._floor = floor
+
+    def count(self, key: str) -> int:
+        return self._totals.get(key, 0)
+
+    def top(self, limit: int) -> List[Tuple[str, int]]:
+        return heapq.nlargest(limit, self._totals.items(), key=lambda item: item[1])
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._totals.clear()
+        self._floor = None
+
+    def __str__(self) -> str:
+        return f"SlidingWindowCounter(window={self.window}, keys={len(self._totals)})"
+
+#Hashtag ve bahsetme indeksi
+#Etiketler yorum eklenirken bir kez ayrıştırılır; etiket -> yorumlar, kullanıcı -> bahseden yorumlar
+#tutulur ve her pencere için kayan sayaçlar güncellenir. Hashtag'ler küçük harfe çevrilir.
+#Silinen yorumlar sayımdan çıkar, düzenlenen yorumların etiketleri yeniden ayrıştırılır.
+#Manager'a attach() ile bağlanır.
+class HashtagIndex:
+    def __init__(
+            self,
+            windows: Optional[Dict[str, timedelta]] = None,
+            slots: int = 60,
+            clock: Optional[Callable[[], datetime]] = None
+    ):
+        self.windows = dict(windows if windows is not None else TREND_WINDOWS)
+        self.slots = slots
+        self.clock = clock or datetime.now
+        self._tag_windows = {name: SlidingWindowCounter(w, slots) for name, w in self.windows.items()}
+        self._mention_windows = {name: SlidingWindowCounter(w, slots) for name, w in self.windows.items()}
+        #etiket / kullanıcı -> {id(yorum): yorum} (ekleme sırasıyla)
+        self._by_tag: Dict[str, Dict[int, CommentInteraction]] = {}
+        self._by_mention: Dict[str, Dict[int, CommentInteraction]] = {}
+        #id(yorum) -> (hashtag'ler, bahsetmeler, sayıldığı zaman damgası); yalnızca silinmemiş yorumlar
+        self._entries: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...], float]] = {}
+        self._known: Dict[int, CommentInteraction] = {}
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase], **kwargs) -> "HashtagIndex":
+        index = cls(**kwargs)
+        for i in interactions:
+            index.add(i)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def extract(comment: CommentInteraction) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        #Ayrıştırma CommentInteraction ile aynıdır; etiketler küçük harfe çevrilir
+        tags = dict.fromkeys(tag.lower() for tag in comment.find_hashtags())
+        mentions = dict.fromkeys(comment.find_mentions())
+        return tuple(tags), tuple(mentions)
+
+    def _link(self, comment: CommentInteraction) -> None:
+        tags, mentions = self.extract(comment)
+        key = id(comment)
+        ts = comment.created_ts
+        self._entries[key] = (tags, mentions, ts)
+        for tag in tags:
+            self._by_tag.setdefault(tag, {})[key] = comment
+            for counter in self._tag_windows.values():
+                counter.add(tag, ts)
+        for user_id in mentions:
+            self._by_mention.setdefault(user_id, {})[key] = comment
+            for counter in self._mention_windows.values():
+                counter.add(user_id, ts)
+
+    def _unlink(self, comment: CommentInteraction) -> None:
+        entry = self._entries.pop(id(comment), None)
+        if entry is None:
+            return
+        tags, mentions, ts = entry
+        for names, index, windows in ((tags, self._by_tag, self._tag_windows),
+                                      (mentions, self._by_mention, self._mention_windows)):
+            for name in names:
+                comments = index.get(name)
+                if comments is not None:
+                    comments.pop(id(comment), None)
+                    if not comments:
+                        del index[name]
+                for counter in windows.values():
+                    counter.discard(name, ts)
+
+#Manager olayları (attach ile bağlanır)
+    def add(self, interaction: InteractionBase) -> None:
+        if not isinstance(interaction, CommentInteraction) or id(interaction) in self._known:
+            return
+        self._known[id(interaction)] = interaction
+        if interaction.status != "deleted":
+            self._link(interaction)
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if id(interaction) not in self._known:
+            return
+        if field == "status" and (old == "deleted") != (new == "deleted"):
+            if new == "deleted":
+                self._unlink(interaction)
+            else:
+                self._link(interaction)
+        elif field in ("comment_text", "created_at") and id(interaction) in self._entries:
+            #Eski etiketler sayıldıkları zaman damgasıyla düşülür, yenileri eklenir
+            self._unlink(interaction)
+            self._link(interaction)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        if self._known.pop(id(interaction), None) is not None:
+            self._unlink(interaction)
+
+    def clear(self) -> None:
+        self._by_tag.clear()
+        self._by_mention.clear()
+        self._entries.clear()
+        self._known.clear()
+        for counter in (*self._tag_windows.values(), *self._mention_windows.values()):
+            counter.clear()
+
+#Sorgular
+    def comments_with_tag(self, tag: str) -> List[CommentInteraction]:
+        return list(self._by_tag.get(tag.lstrip("#").lower(), {}).values())
+
+    def mentions_of(self, user_id: str) -> List[CommentInteraction]:
+        return list(self._by_mention.get(user_id.lstrip("@"), {}).values())
+
+    def _window(self, windows: Dict[str, SlidingWindowCounter], window: str) -> SlidingWindowCounter:
+        counter = windows.get(window)
+        if counter is None:
+            raise ValueError(f"Geçersiz pencere: {window}")
+        counter.advance(self.clock().timestamp())
+        return counter
+
+    def trending_hashtags(self, window: str = "24h", limit: int = 10) -> List[Tuple[str, int]]:
+        return self._window(self._tag_windows, window).top(limit)
+
+    def most_mentioned(self, window: str = "24h", limit: int = 10) -> List[Tuple[str, int]]:
+        return self._window(self._mention_windows, window).top(limit)
+
+    def tag_count(self, tag: str, window: str = "24h") -> int:
+        return self._window(self._tag_windows, window).count(tag.lstrip("#").lower())
+
+    def mention_count(self, user_id: str, window: str = "24h") -> int:
+        return self._window(self._mention_windows, window).count(user_id.lstrip("@"))
+
+    def __str__(self) -> str:
+        return f"HashtagIndex(comments={len(self._entries)}, tags={len(self._by_tag)}, users={len(self._by_mention)})"
@@ -0,0 +1,161 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple, Iterable, Iterator
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+from interactions.storage import INTERACTION_CLASSES
+from interactions.spam import SpamScorer
+
+#Kayıt türü adları (kısa ad veya sınıf adı)
+RECORD_TYPES = dict(INTERACTION_CLASSES)
+RECORD_TYPES.update({
+    "comment": CommentInteraction,
+    "like": LikeInteraction,
+    "subscription": SubscriptionInteraction,
+})
+
+#Ham kaydı (dict veya tuple) interaction nesnesine çevirme
+#dict: {"type": "comment", ...to_dict alanları}
+#tuple: ("comment", interaction_id, user_id, video_id, comment_text, ...)
+def record_to_interaction(record: Any) -> InteractionBase:
+    if isinstance(record, InteractionBase):
+        return record
+    if isinstance(record, dict):
+        cls = RECORD_TYPES.get(record.get("type") or _infer_type(record))
+        if cls is None:
+            raise ValueError("Kayıt türü belirlenemedi")
+        return cls.from_dict(record)
+    if isinstance(record, (tuple, list)) and record:
+        cls = RECORD_TYPES.get(record[0])
+        if cls is None:
+            raise ValueError(f"Bilinmeyen kayıt türü: {record[0]}")
+        return cls(*record[1:])
+    raise ValueError("Geçersiz kayıt formatı")
+
+
+def _infer_type(record: Dict[str, Any]) -> str:
+    if "comment_text" in record:
+        return "comment"
+    if "target_id" in record:
+        return "like"
+    if "channel_id" in record:
+        return "subscription"
+    return ""
+
+#Doğrulama ve spam kontrolü: (geçerli mi, spam mı)
+def check_interaction(interaction: InteractionBase) -> Tuple[bool, bool]:
+    if not interaction.validate():
+        return False, False
+    if isinstance(interaction, CommentInteraction):
+        return True, interaction.detect_basic_spam()
+    return True, False
+
+#Parti kontrolü: doğrulama tek tek, spam kuralları geçerli yorumların tümüne birlikte uygulanır
+#Kural istatistikleri verilen puanlayıcıda birikir (verilmezse geçici puanlayıcı kullanılır).
+def check_interactions(
+        interactions: List[InteractionBase],
+        scorer: SpamScorer | None = None
+) -> List[Tuple[bool, bool]]:
+    if scorer is None:
+        scorer = SpamScorer()
+    result = [(i.validate(), False) for i in interactions]
+    comments = [
+        k for k, i in enumerate(interactions)
+        if result[k][0] and isinstance(i, CommentInteraction)
+    ]
+    if comments:
+        verdicts = scorer.score([interactions[k].comment_text for k in comments])
+        for k, spam in zip(comments, verdicts):
+            if spam:
+                result[k] = (True, True)
+    return result
+
+#İşçi süreçte çalışan dönüştürme ve kontrol: kayıt başına (nesne, geçerli mi, spam mı)
+#Dönüştürülemeyen kayıt için nesne None'dır. Nesneler ana sürece geri taşınır, orada yeniden kurulmaz.
+def check_records(
+        records: List[Any],
+        scorer: SpamScorer | None = None
+) -> List[Tuple[InteractionBase | None, bool, bool]]:
+    result: List[Tuple[InteractionBase | None, bool, bool]] = [(None, False, False)] * len(records)
+    converted = []
+    positions = []
+    for pos, record in enumerate(records):
+        try:
+            converted.append(record_to_interaction(record))
+            positions.append(pos)
+        except (ValueError, KeyError, TypeError):
+            pass
+    for pos, i, (valid, spam) in zip(positions, converted, check_interactions(converted, scorer)):
+        result[pos] = (i, valid, spam)
+    return result
+
+#İşçi süreç girişi: sonuçlar ve işçinin kural istatistikleri birlikte döner
+def _check_chunk(records: List[Any]) -> Tuple[List[Tuple[InteractionBase | None, bool, bool]], Dict[str, Any]]:
+    scorer = SpamScorer()
+    return check_records(records, scorer), scorer.stats()
+
+#Kontrol sonucunu process() ile aynı şekilde nesneye uygulama
+def apply_verdict(interaction: InteractionBase, valid: bool, spam: bool) -> None:
+    if not valid:
+        if not isinstance(interaction, CommentInteraction):
+            interaction.set_status("flagged")
+        return
+    if spam:
+        interaction.add_flag("spam")
+        interaction.set_status("flagged")
+    elif isinstance(interaction, SubscriptionInteraction):
+        if interaction.action_type == "subscribe":
+            interaction._handle_subscription()
+        else:
+            interaction._unhandle_subscription()
+
+#Büyük partilerde dönüştürme ve kontrolleri süreç havuzuna dağıtma
+#İşçilere yalnızca ham kayıtlar gönderilir ve oluşturulan nesneler geri alınır. Zaten nesne olan
+#kayıtlar süreçlere taşınmaz; ana süreçte doğrulanır ve yalnızca yorum metinleri puanlanır.
+#İşçilerin kural istatistikleri scorer'a eklenir.
+def check_batch(
+        records: List[Any],
+        pool: ProcessPoolExecutor,
+        workers: int,
+        scorer: SpamScorer
+) -> List[Tuple[InteractionBase | None, bool, bool]]:
+    prepared: List[Tuple[InteractionBase | None, bool, bool]] = [(None, False, False)] * len(records)
+    raw = [pos for pos, record in enumerate(records) if not isinstance(record, InteractionBase)]
+    if raw:
+        chunk_size = max(1, -(-len(raw) // workers))
+        chunks = [[records[pos] for pos in raw[k:k + chunk_size]] for k in range(0, len(raw), chunk_size)]
+        positions = iter(raw)
+        for part, stats in pool.map(_check_chunk, chunks):
+            for entry in part:
+                prepared[next(positions)] = entry
+            scorer.merge_stats(stats)
+
+    owned = [pos for pos, record in enumerate(records) if isinstance(record, InteractionBase)]
+    if owned:
+        valid = {pos: records[pos].validate() for pos in owned}
+        comments = [pos for pos in owned if valid[pos] and isinstance(records[pos], CommentInteraction)]
+        verdicts = scorer.score_parallel([records[pos].comment_text for pos in comments], workers, pool)
+        spam = dict(zip(comments, verdicts))
+        for pos in owned:
+            prepared[pos] = (records[pos], valid[pos], spam.get(pos, False))
+    return prepared
+
+
+#Girdiyi sabit boyutlu partilere bölme
+def batches(records: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+#Tek çekirdekte süreç havuzu yalnızca taşıma maliyeti ekler; seri yol kullanılır
+def default_workers() -> int:
+    return os.cpu_count() or 1
@@ -0,0 +1,148 @@
+import heapq
+from typing import Dict, Any, Callable, Iterable, List, Tuple
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+
+#Sıralama ölçütleri: heap anahtarı (küçük olan önce gelir)
+METRICS: Dict[str, Callable[[CommentInteraction], float]] = {
+    "score": lambda c: -c.calculate_score(),
+    "longest": lambda c: -len(c),
+    "shortest": lambda c: len(c),
+}
+
+#Skoru veya uzunluğu etkileyen alanlar
+SCORE_FIELDS = ("like_count", "dislike_count", "reply_count")
+LENGTH_FIELDS = ("comment_text",)
+
+#Tembel silmeli heap: değişen kayıt yeni anahtarla tekrar eklenir, eski giriş sorguda atlanır
+#Eşit anahtarlarda ekleme sırası (seq) korunur; sorted() ile aynı sonucu verir.
+class _RankedHeap:
+    __slots__ = ("_heap", "_live")
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, CommentInteraction]] = []
+        #seq -> güncel anahtar
+        self._live: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def push(self, key: float, seq: int, comment: CommentInteraction) -> None:
+        if self._live.get(seq) == key:
+            return
+        self._live[seq] = key
+        heapq.heappush(self._heap, (key, seq, comment))
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._compact()
+
+    def discard(self, seq: int) -> None:
+        self._live.pop(seq, None)
+
+    def _compact(self) -> None:
+        live = self._live
+        self._heap = [entry for entry in self._heap if live.get(entry[1]) == entry[0]]
+        heapq.heapify(self._heap)
+
+#İlk K kayıt: K geçerli giriş çekilir ve geri konur (O(K log n))
+    def top(self, limit: int) -> List[CommentInteraction]:
+        heap = self._heap
+        live = self._live
+        taken: List[Tuple[float, int, CommentInteraction]] = []
+        seen = set()
+        while heap and len(taken) < limit:
+            entry = heapq.heappop(heap)
+            key, seq, _ = entry
+            if live.get(seq) != key or seq in seen:
+                continue
+            seen.add(seq)
+            taken.append(entry)
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        return [entry[2] for entry in taken]
+
+#Video başına ve genel yorum sıralamaları (skor, en uzun, en kısa)
+#Manager'a attach() ile bağlanır; beğeni, yanıt ve düzenlemelerde güncellenir.
+class CommentLeaderboard:
+    def __init__(self, metrics: Iterable[str] = ("score", "longest", "shortest")):
+        self.metrics = tuple(metrics)
+        for metric in self.metrics:
+            if metric not in METRICS:
+                raise ValueError(f"Geçersiz sıralama ölçütü: {metric}")
+        self._next_seq = 0
+        self._seq: Dict[int, int] = {}
+        self._global: Dict[str, _RankedHeap] = {m: _RankedHeap() for m in self.metrics}
+        self._by_video: Dict[str, Dict[str, _RankedHeap]] = {}
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase], **kwargs) -> "CommentLeaderboard":
+        board = cls(**kwargs)
+        for i in interactions:
+            board.add(i)
+        return board
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    def _heaps(self, comment: CommentInteraction) -> List[Dict[str, _RankedHeap]]:
+        video = self._by_video.get(comment.video_id)
+        if video is None:
+            video = self._by_video[comment.video_id] = {m: _RankedHeap() for m in self.metrics}
+        return [self._global, video]
+
+    def _push(self, comment: CommentInteraction, metrics: Iterable[str]) -> None:
+        seq = self._seq[id(comment)]
+        for heaps in self._heaps(comment):
+            for metric in metrics:
+                heaps[metric].push(METRICS[metric](comment), seq, comment)
+
+#Manager olayları (attach ile bağlanır)
+    def add(self, interaction: InteractionBase) -> None:
+        if not isinstance(interaction, CommentInteraction) or id(interaction) in self._seq:
+            return
+        self._seq[id(interaction)] = self._next_seq
+        self._next_seq += 1
+        self._push(interaction, self.metrics)
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if not isinstance(interaction, CommentInteraction) or id(interaction) not in self._seq:
+            return
+        if field in SCORE_FIELDS:
+            metrics = [m for m in self.metrics if m == "score"]
+        elif field in LENGTH_FIELDS:
+            metrics = [m for m in self.metrics if m != "score"]
+        else:
+            return
+        self._push(interaction, metrics)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        seq = self._seq.pop(id(interaction), None)
+        if seq is None:
+            return
+        video = self._by_video.get(interaction.video_id)
+        for heaps in (self._global, video):
+            if heaps is None:
+                continue
+            for heap in heaps.values():
+                heap.discard(seq)
+        if video is not None and not any(len(heap) for heap in video.values()):
+            del self._by_video[interaction.video_id]
+
+    def clear(self) -> None:
+        self._seq.clear()
+        self._global = {m: _RankedHeap() for m in self.metrics}
+        self._by_video.clear()
+
+#Sorgular
+    def top(self, metric: str = "score", limit: int = 5, video_id: str | None = None) -> List[CommentInteraction]:
+        if metric not in self.metrics:
+            raise ValueError(f"Sıralama ölçütü izlenmiyor: {metric}")
+        if video_id is None:
+            return self._global[metric].top(limit)
+        video = self._by_video.get(video_id)
+        if video is None:
+            return []
+        return video[metric].top(limit)
+
+    def __str__(self) -> str:
+        return f"CommentLeaderboard(comments={len(self._seq)}, videos={len(self._by_video)})"
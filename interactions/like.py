@@ -1,11 +1,19 @@
 from abc import ABC
 from typing import Dict, Any
-from datetime import datetime 
 
-from interactions.base import InteractionBase
+from interactions.base import InteractionBase, CodeTable, intern_id
+
+LIKE_TYPES = CodeTable("like", "dislike")
+TARGET_TYPES = CodeTable("video", "comment")
+
+#Tartışmalı sayılma eşikleri: en az tepki sayısı ve az olan tarafın toplamdaki payı
+MIN_REACTIONS = 10
+MIN_BALANCE_RATIO = 0.4
 
 ## like - dislike etkileşimlerini yöneten sınıf
 class LikeInteraction(InteractionBase):
+    __slots__ = ("target_id", "_target_type", "_like_type")
+
     total_likes = 0
     total_dislikes = 0
 
@@ -18,16 +26,38 @@ class LikeInteraction(InteractionBase):
         like_type: str = "like",
     ):
         super().__init__(interaction_id, user_id)
-        self.target_id = target_id
-        self.target_type = target_type
-        self.like_type = like_type
-        self.created_at = datetime.now()
+        self.target_id = intern_id(target_id)
+        self._target_type = TARGET_TYPES.code(target_type)
+        self._like_type = LIKE_TYPES.code(like_type)
 
         ## Global sayaçlar
         if like_type == "like":
             LikeInteraction.total_likes += 1
         else:
             LikeInteraction.total_dislikes += 1
+
+    @property
+    def like_type(self) -> str:
+        return LIKE_TYPES.value(self._like_type)
+
+    @like_type.setter
+    def like_type(self, value: str) -> None:
+        old = self._like_type
+        self._like_type = LIKE_TYPES.code(value)
+        if old != self._like_type:
+            self._notify("like_type", LIKE_TYPES.value(old), value)
+
+    @property
+    def target_type(self) -> str:
+        return TARGET_TYPES.value(self._target_type)
+
+    @target_type.setter
+    def target_type(self, value: str) -> None:
+        old = self._target_type
+        self._target_type = TARGET_TYPES.code(value)
+        if old != self._target_type:
+            self._notify("target_type", TARGET_TYPES.value(old), value)
+
     #Etkileşimi işler
     def process(self) -> bool:
         if not self.validate():
@@ -44,6 +74,8 @@ class LikeInteraction(InteractionBase):
         
         if not self.user_id or not self.target_id:
             return False
+
+        return True
     
     # like - dislike geçişi
     def toggle(self) -> bool:
@@ -60,7 +92,7 @@ class LikeInteraction(InteractionBase):
         return self.like_type == "like"
     
     def is_dislike(self) -> bool:
-        return self.dislike_type == "dislike"
+        return self.like_type == "dislike"
     
     def is_video_like(self) -> bool:
         return self.target_type == "video"
@@ -68,6 +100,19 @@ class LikeInteraction(InteractionBase):
     def is_comment_like(self) -> bool:
         return self.target_type == "comment"
     
+    #Dictionary formatından nesne oluşturma
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LikeInteraction":
+        like = cls(
+            data["interaction_id"],
+            data["user_id"],
+            data["target_id"],
+            data.get("target_type", "video"),
+            data.get("like_type", "like")
+        )
+        like._load_common(data)
+        return like
+
     #Dictionary formatına çevirme
     def to_dict(self) -> Dict[str, Any]:
         return{
@@ -106,10 +151,10 @@ class LikeInteraction(InteractionBase):
     @staticmethod
     def is_controversial(likes: int, dislikes: int,) -> bool:
         total = likes + dislikes
-        if total < 10:
+        if total < MIN_REACTIONS:
             return False
         ratio = min(likes, dislikes) / total
-        return ratio >= 0.4
+        return ratio >= MIN_BALANCE_RATIO
     
     def __str__(self) -> str:
         return(
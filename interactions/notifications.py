@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Set
+
+from interactions.subscribers import SubscriberTable
+
+#Bildirim alan seviyeler; "none" hiçbir zaman bildirim almaz
+NOTIFY_LEVELS = ("all", "personalized")
+
+#Varsayılan yerel hedef: alıcı sayısını tutar
+class CountingSink:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.delivered = 0
+        self.batches = 0
+
+    def deliver(self, channel_id: str, user_ids: List[str], payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self.delivered += len(user_ids)
+            self.batches += 1
+
+    def __str__(self) -> str:
+        return f"CountingSink(delivered={self.delivered}, batches={self.batches})"
+
+#Kanal yayınında abonelere bildirim dağıtımı
+#Aboneler tablodan tembel okunur ve sabit boyutlu partilere bölünür; aynı anda en fazla
+#workers * 2 parti bellekte bekler, böylece milyonlarca abone için liste oluşturulmaz.
+#Dağıtım sırasında abonelik tablosu değiştirilmemelidir.
+class NotificationFanout:
+    def __init__(
+            self,
+            subscribers: SubscriberTable,
+            sink: Any = None,
+            batch_size: int = 10000,
+            workers: int = 4,
+            personalized: Optional[Callable[[str, Dict[str, Any]], bool]] = None
+    ):
+        if batch_size <= 0 or workers <= 0:
+            raise ValueError("Parti boyutu ve işçi sayısı pozitif olmalıdır.")
+        self.subscribers = subscribers
+        self.sink = sink if sink is not None else CountingSink()
+        self.batch_size = batch_size
+        self.workers = workers
+        #"personalized" seviyesindeki aboneler için seçim kuralı (verilmezse hepsi alır)
+        self.personalized = personalized
+        self._pool: ThreadPoolExecutor | None = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+#Alıcı seçimi (seviye ve paket filtresi)
+    def recipients(
+            self,
+            channel_id: str,
+            payload: Dict[str, Any],
+            levels: Iterable[str] = NOTIFY_LEVELS,
+            tiers: Optional[Iterable[str]] = None
+    ) -> Iterator[str]:
+        levels = {l for l in levels if l != "none"}
+        tiers: Set[str] | None = set(tiers) if tiers is not None else None
+        personalized = self.personalized
+        for sub in self.subscribers.subscribers(channel_id):
+            level = sub.notification_level
+            if level not in levels:
+                continue
+            if tiers is not None and sub.tier not in tiers:
+                continue
+            if level == "personalized" and personalized is not None and not personalized(sub.user_id, payload):
+                continue
+            yield sub.user_id
+
+    def _batches(self, recipients: Iterator[str]) -> Iterator[List[str]]:
+        batch: List[str] = []
+        for user_id in recipients:
+            batch.append(user_id)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+#Yayın: partiler işçi havuzunda hedefe iletilir, gecikme ve hız raporlanır
+    def publish(
+            self,
+            channel_id: str,
+            payload: Dict[str, Any],
+            levels: Iterable[str] = NOTIFY_LEVELS,
+            tiers: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        pool = self._executor()
+        pending: List[Future] = []
+        max_pending = self.workers * 2
+        first_delivery: List[float] = []
+        recipients = 0
+        batches = 0
+
+        def deliver(batch: List[str]) -> None:
+            self.sink.deliver(channel_id, batch, payload)
+            if not first_delivery:
+                first_delivery.append(time.perf_counter() - started)
+
+        for batch in self._batches(self.recipients(channel_id, payload, levels, tiers)):
+            if len(pending) >= max_pending:
+                #En eski parti bitene kadar beklenir (bellekte sınırlı parti)
+                pending.pop(0).result()
+            pending.append(pool.submit(deliver, batch))
+            recipients += len(batch)
+            batches += 1
+        for future in pending:
+            future.result()
+
+        elapsed = time.perf_counter() - started
+        return {
+            "channel_id": channel_id,
+            "subscribers": self.subscribers.subscriber_count(channel_id),
+            "recipients": recipients,
+            "batches": batches,
+            "seconds": elapsed,
+            "first_delivery_seconds": first_delivery[0] if first_delivery else 0.0,
+            "recipients_per_second": recipients / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __str__(self) -> str:
+        return f"NotificationFanout(batch_size={self.batch_size}, workers={self.workers})"
@@ -0,0 +1,200 @@
+from bisect import insort
+from typing import Dict, Any, Callable, Iterable, List, Tuple
+
+from interactions.base import InteractionBase, intern_id
+from interactions.like import LikeInteraction
+
+REACTION_TYPES = ("like", "dislike")
+
+#Kullanıcının bir hedefe verdiği güncel tepki: (user_id, target_type, target_id) başına tek kayıt
+#Hedef başına like / dislike sayaçları her değişiklikte güncellenir, sorgular tarama yapmaz.
+#Manager'a attach() ile bağlanırsa LikeInteraction olaylarından beslenir: kullanıcının hedefe verdiği
+#aktif ve geçerli tepkiler created_ts sırasıyla tutulur, en yenisi geçerlidir. En yeni tepki silinirse
+#bir öncekine dönülür; geçersiz türdeki tepkiler sayılmaz.
+class ReactionStore:
+    def __init__(self):
+        self._reactions: Dict[Tuple[str, str, str], str] = {}
+        #(target_type, target_id) -> [like, dislike]
+        self._tallies: Dict[Tuple[str, str], List[int]] = {}
+        #Manager'dan gelen aktif ve geçerli tepkiler (created_ts sırasıyla; sonuncusu geçerli)
+        self._sources: Dict[Tuple[str, str, str], List[LikeInteraction]] = {}
+        #Sayaç değişikliklerini dinleyenler ((target_type, target_id), like, dislike)
+        self._watchers: List[Callable[[Tuple[str, str], int, int], None]] = []
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase]) -> "ReactionStore":
+        store = cls()
+        for i in interactions:
+            store.add(i)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._reactions)
+
+#Sayaç dinleyicileri (ör. tartışmalı içerik sıralaması)
+    def add_watcher(self, watcher: Callable[[Tuple[str, str], int, int], None]) -> None:
+        self._watchers.append(watcher)
+
+    def remove_watcher(self, watcher: Callable[[Tuple[str, str], int, int], None]) -> None:
+        if watcher in self._watchers:
+            self._watchers.remove(watcher)
+
+#Sayaç güncelleme
+    def _tally(self, target_type: str, target_id: str, reaction: str, delta: int) -> None:
+        key = (target_type, target_id)
+        tally = self._tallies.get(key)
+        if tally is None:
+            tally = self._tallies[key] = [0, 0]
+        tally[0 if reaction == "like" else 1] += delta
+        if tally[0] == 0 and tally[1] == 0:
+            del self._tallies[key]
+        for watcher in self._watchers:
+            watcher(key, tally[0], tally[1])
+
+#Upsert işlemleri (aynı tepki tekrar verilirse değişiklik olmaz)
+    def set_reaction(self, user_id: str, target_id: str, target_type: str = "video", like_type: str = "like") -> bool:
+        if like_type not in REACTION_TYPES:
+            raise ValueError(f"Geçersiz tepki türü: {like_type}")
+        key = (intern_id(user_id), target_type, intern_id(target_id))
+        old = self._reactions.get(key)
+        if old == like_type:
+            return False
+        if old is not None:
+            self._tally(target_type, key[2], old, -1)
+        self._reactions[key] = like_type
+        self._tally(target_type, key[2], like_type, 1)
+        return True
+
+    def like(self, user_id: str, target_id: str, target_type: str = "video") -> bool:
+        return self.set_reaction(user_id, target_id, target_type, "like")
+
+    def dislike(self, user_id: str, target_id: str, target_type: str = "video") -> bool:
+        return self.set_reaction(user_id, target_id, target_type, "dislike")
+
+    def remove_reaction(self, user_id: str, target_id: str, target_type: str = "video") -> bool:
+        key = (user_id, target_type, target_id)
+        old = self._reactions.pop(key, None)
+        if old is None:
+            return False
+        self._sources.pop(key, None)
+        self._tally(target_type, target_id, old, -1)
+        return True
+
+#Aynı tepki tekrar verilirse kaldırılır, farklıysa değiştirilir; yeni durum döner
+    def toggle(self, user_id: str, target_id: str, target_type: str = "video", like_type: str = "like") -> str | None:
+        if self.get_reaction(user_id, target_id, target_type) == like_type:
+            self.remove_reaction(user_id, target_id, target_type)
+            return None
+        self.set_reaction(user_id, target_id, target_type, like_type)
+        return like_type
+
+#Sorgular
+    def get_reaction(self, user_id: str, target_id: str, target_type: str = "video") -> str | None:
+        return self._reactions.get((user_id, target_type, target_id))
+
+    def counts(self, target_id: str, target_type: str = "video") -> Dict[str, int]:
+        tally = self._tallies.get((target_type, target_id), (0, 0))
+        return {"likes": tally[0], "dislikes": tally[1]}
+
+    def likes_by_target(self, target_type: str) -> Dict[str, int]:
+        #Hedef başına tekil tepki sayısı (like + dislike)
+        return {
+            target_id: tally[0] + tally[1]
+            for (kind, target_id), tally in self._tallies.items()
+            if kind == target_type
+        }
+
+    def likes_by_video(self) -> Dict[str, int]:
+        return self.likes_by_target("video")
+
+    def tallies(self, target_type: str | None = None) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        return {
+            key: (tally[0], tally[1])
+            for key, tally in self._tallies.items()
+            if target_type is None or key[0] == target_type
+        }
+
+    def count_like_types(self) -> Dict[str, int]:
+        likes = dislikes = 0
+        for tally in self._tallies.values():
+            likes += tally[0]
+            dislikes += tally[1]
+        return {"like": likes, "dislike": dislikes}
+
+#Manager olayları (attach ile bağlanır)
+    @staticmethod
+    def _source_key(interaction: LikeInteraction) -> Tuple[str, str, str]:
+        return interaction.user_id, interaction.target_type, interaction.target_id
+
+    @staticmethod
+    def _counts(interaction: LikeInteraction) -> bool:
+        return interaction.is_active() and interaction.like_type in REACTION_TYPES
+
+    def _discard(self, interaction: LikeInteraction, key: Tuple[str, str, str]) -> bool:
+        sources = self._sources.get(key)
+        if sources is None:
+            return False
+        for pos, source in enumerate(sources):
+            if source is interaction:
+                del sources[pos]
+                if not sources:
+                    del self._sources[key]
+                return True
+        return False
+
+    def _insert(self, interaction: LikeInteraction) -> None:
+        sources = self._sources.setdefault(self._source_key(interaction), [])
+        insort(sources, interaction, key=lambda i: i.created_ts)
+
+    #Kullanıcının tepkisini en yeni kaynağa eşitleme; kaynak kalmadıysa tepki kaldırılır
+    def _sync(self, key: Tuple[str, str, str]) -> None:
+        sources = self._sources.get(key)
+        if sources:
+            latest = sources[-1]
+            self.set_reaction(latest.user_id, latest.target_id, latest.target_type, latest.like_type)
+        else:
+            self.remove_reaction(key[0], key[2], key[1])
+
+    def add(self, interaction: InteractionBase) -> None:
+        if not isinstance(interaction, LikeInteraction) or not self._counts(interaction):
+            return
+        self._insert(interaction)
+        self._sync(self._source_key(interaction))
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if not isinstance(interaction, LikeInteraction):
+            return
+        key = self._source_key(interaction)
+        if field == "target_type":
+            #Kaynak eski hedefin anahtarından yenisine taşınır
+            old_key = (key[0], old, key[2])
+            if self._discard(interaction, old_key):
+                self._sync(old_key)
+            known = False
+        elif field in ("status", "like_type", "created_at"):
+            known = self._discard(interaction, key)
+        else:
+            return
+        if self._counts(interaction):
+            self._insert(interaction)
+        elif not known:
+            return
+        self._sync(key)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        if isinstance(interaction, LikeInteraction):
+            key = self._source_key(interaction)
+            if self._discard(interaction, key):
+                self._sync(key)
+
+    def clear(self) -> None:
+        if self._watchers:
+            for key in self._tallies:
+                for watcher in self._watchers:
+                    watcher(key, 0, 0)
+        self._reactions.clear()
+        self._tallies.clear()
+        self._sources.clear()
+
+    def __str__(self) -> str:
+        return f"ReactionStore(reactions={len(self._reactions)}, targets={len(self._tallies)})"
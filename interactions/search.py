@@ -0,0 +1,152 @@
+import re
+from typing import Dict, List, Set, Any
+
+from interactions.comment import CommentInteraction
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+#Türkçe büyük/küçük harf dönüşümü (I -> ı, İ -> i)
+TURKISH_UPPER = str.maketrans({"I": "ı", "İ": "i"})
+
+def turkish_fold(text: str) -> str:
+    return text.translate(TURKISH_UPPER).lower()
+
+#Yorum metinleri için artımlı ters indeks
+class CommentSearchIndex:
+    def __init__(self, ngram_size: int = 3, use_ngrams: bool = True):
+        self.ngram_size = ngram_size
+        self.use_ngrams = use_ngrams
+
+        #Belge numarası ekleme sırasını korur
+        self._next_doc = 0
+        self._doc_ids: Dict[int, int] = {}
+        self._docs: Dict[int, CommentInteraction] = {}
+        self._texts: Dict[int, str] = {}
+
+        self._tokens: Dict[str, Set[int]] = {}
+        self._ngrams: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+#Metin parçalama
+    def _terms(self, text: str):
+        tokens = set(TOKEN_PATTERN.findall(text))
+        ngrams = set()
+        if self.use_ngrams:
+            n = self.ngram_size
+            ngrams = {text[k:k + n] for k in range(len(text) - n + 1)}
+        return tokens, ngrams
+
+    @staticmethod
+    def _post(postings: Dict[str, Set[int]], terms, doc: int) -> None:
+        for term in terms:
+            docs = postings.get(term)
+            if docs is None:
+                postings[term] = {doc}
+            else:
+                docs.add(doc)
+
+    @staticmethod
+    def _unpost(postings: Dict[str, Set[int]], terms, doc: int) -> None:
+        for term in terms:
+            docs = postings.get(term)
+            if docs is not None:
+                docs.discard(doc)
+                if not docs:
+                    del postings[term]
+
+#Ekleme / güncelleme
+    def add(self, comment: CommentInteraction) -> None:
+        if id(comment) in self._doc_ids:
+            return
+        doc = self._next_doc
+        self._next_doc += 1
+        self._doc_ids[id(comment)] = doc
+        self._docs[doc] = comment
+        self._index_text(doc, comment.comment_text)
+
+    def _index_text(self, doc: int, raw: str) -> None:
+        text = turkish_fold(raw)
+        self._texts[doc] = text
+        tokens, ngrams = self._terms(text)
+        self._post(self._tokens, tokens, doc)
+        self._post(self._ngrams, ngrams, doc)
+
+    def _unindex_text(self, doc: int) -> None:
+        tokens, ngrams = self._terms(self._texts.pop(doc))
+        self._unpost(self._tokens, tokens, doc)
+        self._unpost(self._ngrams, ngrams, doc)
+
+    def remove(self, comment: CommentInteraction) -> bool:
+        doc = self._doc_ids.pop(id(comment), None)
+        if doc is None:
+            return False
+        self._unindex_text(doc)
+        del self._docs[doc]
+        return True
+
+    def update(self, comment: Any, field: str, old: Any, new: Any) -> None:
+        if field != "comment_text":
+            return
+        doc = self._doc_ids.get(id(comment))
+        if doc is not None:
+            self._unindex_text(doc)
+            self._index_text(doc, new)
+
+    def clear(self) -> None:
+        self._doc_ids.clear()
+        self._docs.clear()
+        self._texts.clear()
+        self._tokens.clear()
+        self._ngrams.clear()
+
+#Sorgular
+    def _candidates(self, keyword: str) -> Set[int] | None:
+        #None: aday kümesi çıkarılamadı, tüm metinler taranmalı
+        if not self.use_ngrams or len(keyword) < self.ngram_size:
+            return None
+        n = self.ngram_size
+        grams = {keyword[k:k + n] for k in range(len(keyword) - n + 1)}
+        postings = []
+        for gram in grams:
+            docs = self._ngrams.get(gram)
+            if not docs:
+                return set()
+            postings.append(docs)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for docs in postings[1:]:
+            result &= docs
+            if not result:
+                break
+        return result
+
+    def _matching_docs(self, keyword: str) -> List[int]:
+        keyword = turkish_fold(keyword)
+        candidates = self._candidates(keyword)
+        if candidates is None:
+            candidates = self._texts.keys()
+        texts = self._texts
+        return sorted(doc for doc in candidates if keyword in texts[doc])
+
+#Alt metin araması (search_comments ile aynı anlam)
+    def search(self, keyword: str) -> List[CommentInteraction]:
+        return [self._docs[doc] for doc in self._matching_docs(keyword)]
+
+    def count(self, keyword: str) -> int:
+        return len(self._matching_docs(keyword))
+
+#Kelime bazlı arama (tüm kelimeleri içeren yorumlar)
+    def search_tokens(self, query: str) -> List[CommentInteraction]:
+        tokens = TOKEN_PATTERN.findall(turkish_fold(query))
+        if not tokens:
+            return []
+        postings = sorted((self._tokens.get(t, set()) for t in tokens), key=len)
+        result = set(postings[0])
+        for docs in postings[1:]:
+            result &= docs
+        return [self._docs[doc] for doc in sorted(result)]
+
+    def __str__(self) -> str:
+        return f"CommentSearchIndex(comments={len(self._docs)}, tokens={len(self._tokens)})"
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from typing import Dict, Any, List, Tuple
+
+#Asenkron üreticiler için toplu ekleme servisi
+#Kayıtlar sınırlı kuyrukta bekler; kuyruk dolunca submit() bekletilir (backpressure)
+#Parti boyutu dolduğunda veya en eski kayıt max_latency süresini aştığında manager'a yazılır
+#Yazılamayan parti sayılır ve döngü devam eder; hata metrics() ile görülür, flush() / stop() ile yükseltilir
+class AsyncIngestService:
+    def __init__(
+            self,
+            manager,
+            max_queue: int = 10000,
+            batch_size: int = 500,
+            max_latency: float = 0.05
+    ):
+        if max_queue <= 0 or batch_size <= 0:
+            raise ValueError("Kuyruk ve parti boyutu pozitif olmalıdır.")
+        self.manager = manager
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+        #Metrikler
+        self._submitted = 0
+        self._batches = 0
+        self._rows = 0
+        self._accepted = 0
+        self._rejected = 0
+        self._flagged = 0
+        self._max_depth = 0
+        self._last_batch_size = 0
+        self._last_latency = 0.0
+        self._max_latency_seen = 0.0
+        self._total_latency = 0.0
+        self._commit_seconds = 0.0
+        self._failed_batches = 0
+        self._failed_rows = 0
+        self._last_error: BaseException | None = None
+        #Henüz flush() / stop() ile bildirilmemiş hatalı parti sayısı
+        self._unreported = 0
+
+#Başlatma / durdurma
+    async def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self._raise_failures()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+#Kayıt gönderme (kuyruk doluysa yer açılana kadar bekler)
+    async def submit(self, record: Any) -> None:
+        if self._worker is None:
+            raise ValueError("Servis başlatılmadan kayıt gönderilemez.")
+        await self._queue.put((time.perf_counter(), record))
+        self._submitted += 1
+        depth = self._queue.qsize()
+        if depth > self._max_depth:
+            self._max_depth = depth
+
+    async def submit_many(self, records) -> None:
+        for record in records:
+            await self.submit(record)
+
+#Kuyruktaki tüm kayıtlar yazılana kadar bekleme
+    async def flush(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+        self._raise_failures()
+
+    def _raise_failures(self) -> None:
+        if not self._unreported:
+            return
+        count = self._unreported
+        self._unreported = 0
+        raise ValueError(f"{count} parti yazılamadı, son hata: {self._last_error!r}") from self._last_error
+
+#Parti toplama döngüsü
+    async def _run(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[float, Any]] = [await queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            #Hata veren parti manager'da geri alınmıştır; satırları başarısız sayılır
+            try:
+                self._commit(batch)
+            except Exception as error:
+                self._failed_batches += 1
+                self._failed_rows += len(batch)
+                self._last_error = error
+                self._unreported += 1
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _commit(self, batch: List[Tuple[float, Any]]) -> None:
+        report = self.manager.commit_batch([record for _, record in batch])
+        latency = time.perf_counter() - batch[0][0]
+
+        self._batches += 1
+        self._rows += report["rows"]
+        self._accepted += report["accepted"]
+        self._rejected += len(report["rejected"])
+        self._flagged += len(report["flagged"])
+        self._last_batch_size = len(batch)
+        self._last_latency = latency
+        self._total_latency += latency
+        self._commit_seconds += report["seconds"]
+        if latency > self._max_latency_seen:
+            self._max_latency_seen = latency
+
+#Metrikler
+    def metrics(self) -> Dict[str, Any]:
+        batches = self._batches
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self._max_depth,
+            "submitted": self._submitted,
+            "rows": self._rows,
+            "accepted": self._accepted,
+            "rejected": self._rejected,
+            "flagged": self._flagged,
+            "batches": batches,
+            "last_batch_size": self._last_batch_size,
+            "average_batch_size": self._rows / batches if batches else 0.0,
+            "last_flush_latency": self._last_latency,
+            "average_flush_latency": self._total_latency / batches if batches else 0.0,
+            "max_flush_latency": self._max_latency_seen,
+            "commit_seconds": self._commit_seconds,
+            "failed_batches": self._failed_batches,
+            "failed_rows": self._failed_rows,
+            "last_error": repr(self._last_error) if self._last_error is not None else None,
+        }
+
+    def __str__(self) -> str:
+        depth = self._queue.qsize() if self._queue is not None else 0
+        return f"AsyncIngestService(queue={depth}/{self.max_queue}, batches={self._batches})"
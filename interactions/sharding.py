@@ -0,0 +1,374 @@
+import heapq
+import multiprocessing
+import zlib
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Tuple
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.aggregation import SummaryAccumulator
+
+SHARD_KEYS = ("user", "target")
+SEND_BATCH = 1000
+
+#Ham kayıttan (dict / tuple) bölümleme anahtarı çıkarma
+#tuple: ("comment", interaction_id, user_id, video_id, ...), ("like", id, user, target_id, ...)
+def record_key(record: Any, key: str) -> str:
+    if isinstance(record, InteractionBase):
+        if key == "user":
+            return record.user_id
+        if isinstance(record, CommentInteraction):
+            return record.video_id
+        if isinstance(record, LikeInteraction):
+            return record.target_id
+        if isinstance(record, SubscriptionInteraction):
+            return record.channel_id
+        return record.user_id
+    if isinstance(record, dict):
+        if key == "user":
+            return record.get("user_id", "")
+        return record.get("video_id") or record.get("target_id") or record.get("channel_id") or ""
+    if isinstance(record, (tuple, list)) and len(record) > 3:
+        return record[2] if key == "user" else record[3]
+    return ""
+
+
+def shard_of(value: str, shards: int) -> int:
+    #Süreçler arası sabit kalan hash (hash() süreç başına rastgeledir)
+    return zlib.crc32(str(value).encode("utf-8")) % shards
+
+#Her işçi süreçte çalışan komut sunucusu
+class _ShardServer:
+    def __init__(self, columnar: bool):
+        self.manager = InteractionManager(columnar=columnar)
+
+    def _report(self) -> InteractionReport:
+        m = self.manager
+        return InteractionReport(m.interactions, table=m.table, timeline=m.timeline, search_index=m.search_index)
+
+    def add_many(self, items: List[InteractionBase]) -> int:
+        self.manager._add_many(items)
+        return len(items)
+
+    def commit_batch(self, records: List[Any]) -> Dict[str, Any]:
+        return self.manager.commit_batch(records)
+
+    def get_by_id(self, interaction_id: str) -> InteractionBase | None:
+        return self.manager.get_by_id(interaction_id)
+
+    def get_by_user(self, user_id: str) -> List[InteractionBase]:
+        return self.manager.get_by_user(user_id)
+
+    def call(self, interaction_id: str, method: str, args: Tuple) -> Tuple[bool, Any]:
+        interaction = self.manager.get_by_id(interaction_id)
+        if interaction is None:
+            return False, None
+        return True, getattr(interaction, method)(*args)
+
+    def count_by_type(self) -> Dict[str, int]:
+        return self.manager.count_by_type()
+
+    def count_by_status(self) -> Dict[str, int]:
+        return self.manager.count_by_status()
+
+    def get_total_count(self) -> int:
+        return self.manager.get_total_count()
+
+    def summary(self) -> SummaryAccumulator:
+        return SummaryAccumulator.from_interactions(self.manager.interactions)
+
+    def report(self, method: str, args: Tuple) -> Any:
+        return getattr(self._report(), method)(*args)
+
+    def top_comments(self, limit: int) -> List[Tuple[float, Dict[str, Any]]]:
+        comments = heapq.nlargest(limit, self.manager.get_comments(), key=lambda c: c.calculate_score())
+        return [(c.calculate_score(), c.to_dict()) for c in comments]
+
+    def vacuum_all(self, retention_seconds: float) -> Dict[str, Any]:
+        return self.manager.vacuum_all(retention_seconds)
+
+    def clear_all(self) -> None:
+        self.manager.clear_all()
+
+
+def _serve(conn, columnar: bool) -> None:
+    server = _ShardServer(columnar)
+    while True:
+        try:
+            command, args = conn.recv()
+        except EOFError:
+            return
+        if command == "stop":
+            conn.send((True, None))
+            return
+        try:
+            conn.send((True, getattr(server, command)(*args)))
+        except Exception as e:
+            conn.send((False, e))
+
+#Kayıtları user_id veya hedef id'ye göre N işçi sürece bölen koordinatör
+#Yazmalar shard başına tamponlanıp toplu gönderilir; okumalar önce tamponları boşaltır.
+#Okumalardan dönen nesneler kopyadır, değişiklikler call() ile shard üzerinde yapılır.
+class ShardedInteractionManager:
+    def __init__(self, shards: int | None = None, key: str = "user", columnar: bool = False):
+        if key not in SHARD_KEYS:
+            raise ValueError(f"Geçersiz bölümleme anahtarı: {key}")
+        shards = shards or multiprocessing.cpu_count()
+        if shards <= 0:
+            raise ValueError("Shard sayısı pozitif olmalıdır.")
+        self.key = key
+        self.shards = shards
+        self._connections = []
+        self._processes = []
+        for _ in range(shards):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve, args=(child, columnar), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+        self._buffers: List[List[InteractionBase]] = [[] for _ in range(shards)]
+
+#İşçi süreçlerle iletişim
+    def _send(self, shard: int, command: str, *args) -> None:
+        self._connections[shard].send((command, args))
+
+    def _receive(self, shard: int) -> Any:
+        ok, result = self._connections[shard].recv()
+        if not ok:
+            raise result
+        return result
+
+    def _gather(self, shards: Iterable[int]) -> List[Any]:
+        #Önce her shard'ın yanıtı okunur, sonra ilk hata yükseltilir;
+        #okunmayan yanıt kalırsa sonraki komutların sonuçları kayar
+        replies = [self._connections[shard].recv() for shard in shards]
+        for ok, result in replies:
+            if not ok:
+                raise result
+        return [result for _, result in replies]
+
+    def _ask(self, shard: int, command: str, *args) -> Any:
+        self._flush_shard(shard)
+        self._send(shard, command, *args)
+        return self._receive(shard)
+
+    def _scatter(self, command: str, *args) -> List[Any]:
+        #Komut tüm shard'lara önce gönderilir, sonra sonuçlar toplanır (paralel çalışma)
+        self.flush()
+        for shard in range(self.shards):
+            self._send(shard, command, *args)
+        return self._gather(range(self.shards))
+
+    def _flush_shard(self, shard: int) -> None:
+        buffer = self._buffers[shard]
+        if buffer:
+            self._buffers[shard] = []
+            self._send(shard, "add_many", buffer)
+            self._receive(shard)
+
+    def flush(self) -> None:
+        pending = [s for s in range(self.shards) if self._buffers[s]]
+        for shard in pending:
+            self._send(shard, "add_many", self._buffers[shard])
+            self._buffers[shard] = []
+        self._gather(pending)
+
+#Yazma
+    def shard_for(self, record: Any) -> int:
+        return shard_of(record_key(record, self.key), self.shards)
+
+    def add_interaction(self, interaction: InteractionBase) -> None:
+        shard = self.shard_for(interaction)
+        buffer = self._buffers[shard]
+        buffer.append(interaction)
+        if len(buffer) >= SEND_BATCH:
+            self._flush_shard(shard)
+
+#Ham kayıtların toplu eklenmesi: doğrulama ve nesne oluşturma shard süreçlerinde yapılır
+    def add_interactions(self, records: Iterable[Any], batch_size: int = 10000) -> Dict[str, Any]:
+        self.flush()
+        parts: List[List[Any]] = [[] for _ in range(self.shards)]
+        busy = [False] * self.shards
+        totals = {"rows": 0, "accepted": 0, "rejected": 0, "flagged": []}
+        errors: List[Exception] = []
+
+        #Hata veren shard'ın yanıtı da okunur; hata tüm yanıtlar toplandıktan sonra yükseltilir
+        def collect(shard: int) -> None:
+            ok, report = self._connections[shard].recv()
+            busy[shard] = False
+            if not ok:
+                errors.append(report)
+                return
+            totals["rows"] += report["rows"]
+            totals["accepted"] += report["accepted"]
+            totals["rejected"] += len(report["rejected"])
+            totals["flagged"].extend(report["flagged"])
+
+        try:
+            for record in records:
+                shard = self.shard_for(record)
+                part = parts[shard]
+                part.append(record)
+                if len(part) >= batch_size:
+                    if busy[shard]:
+                        collect(shard)
+                    self._send(shard, "commit_batch", part)
+                    busy[shard] = True
+                    parts[shard] = []
+            for shard in range(self.shards):
+                if parts[shard]:
+                    if busy[shard]:
+                        collect(shard)
+                    self._send(shard, "commit_batch", parts[shard])
+                    busy[shard] = True
+        finally:
+            for shard in range(self.shards):
+                if busy[shard]:
+                    collect(shard)
+        if errors:
+            raise errors[0]
+        return totals
+
+#Nesne üzerinde metot çağırma (ör. call("c1", "add_like"))
+    def call(self, interaction_id: str, method: str, *args) -> Any:
+        for found, result in self._scatter("call", interaction_id, method, args):
+            if found:
+                return result
+        raise ValueError(f"Interaction bulunamadı: {interaction_id}")
+
+#Okuma (yönlendirme veya dağıt-topla)
+    def get_by_id(self, interaction_id: str) -> InteractionBase | None:
+        for result in self._scatter("get_by_id", interaction_id):
+            if result is not None:
+                return result
+        return None
+
+    def get_by_user(self, user_id: str) -> List[InteractionBase]:
+        if self.key == "user":
+            return self._ask(shard_of(user_id, self.shards), "get_by_user", user_id)
+        result: List[InteractionBase] = []
+        for part in self._scatter("get_by_user", user_id):
+            result.extend(part)
+        return result
+
+    def get_total_count(self) -> int:
+        return sum(self._scatter("get_total_count"))
+
+    def count_by_type(self) -> Dict[str, int]:
+        return _sum_counts(self._scatter("count_by_type"))
+
+    def count_by_status(self) -> Dict[str, int]:
+        return _sum_counts(self._scatter("count_by_status"))
+
+    def summary(self) -> SummaryAccumulator:
+        acc = SummaryAccumulator()
+        for part in self._scatter("summary"):
+            acc.merge(part)
+        return acc
+
+#Raporlar: shard'ların kısmi sonuçları birleştirilir
+    def export_full_report(self) -> Dict[str, Any]:
+        acc = self.summary()
+        generated_at = datetime.now().isoformat()
+        return {
+            "general": {
+                "generated_at": generated_at,
+                "total_interactions": acc.total,
+                "active": acc.by_status["active"],
+                "deleted": acc.by_status["deleted"],
+                "flagged": acc.by_status["flagged"],
+            },
+            "comments": {
+                "total": acc.comment_total,
+                "flagged": acc.comment_flagged,
+                "popular": acc.comment_popular,
+                "average_length": acc.average_comment_length(),
+                "average_score": acc.average_comment_score(),
+            },
+            "likes": {
+                "likes": acc.likes,
+                "dislikes": acc.dislikes,
+                "ratio": acc.like_ratio(),
+            },
+            "subscriptions": {
+                "total": acc.subscription_total,
+                "active": acc.subscription_active,
+                "inactive": acc.subscription_total - acc.subscription_active,
+                "active_ratio": acc.subscription_ratio(),
+            },
+            "generated_at": generated_at,
+        }
+
+    def report_counts(self, method: str, *args) -> Dict[str, int]:
+        #Sözlük döndüren sayım raporları (ör. likes_by_video, subscribers_by_channel)
+        return _sum_counts(self._scatter("report", method, args))
+
+    def likes_by_target(self, target_type: str) -> Dict[str, int]:
+        return self.report_counts("likes_by_target", target_type)
+
+    def likes_by_video(self) -> Dict[str, int]:
+        return self.report_counts("likes_by_video")
+
+    def comments_by_video(self) -> Dict[str, int]:
+        return self.report_counts("comments_by_video")
+
+    def subscribers_by_channel(self) -> Dict[str, int]:
+        return self.report_counts("subscribers_by_channel")
+
+    def interactions_last_hours(self, hours: int) -> int:
+        return sum(self._scatter("report", "interactions_last_hours", (hours,)))
+
+    def top_comments(self, limit: int = 5) -> List[Dict[str, Any]]:
+        #Her shard kendi ilk N'ini döndürür, birleşik liste yeniden sıralanır
+        candidates: List[Tuple[float, Dict[str, Any]]] = []
+        for part in self._scatter("top_comments", limit):
+            candidates.extend(part)
+        candidates.sort(key=lambda pair: pair[0], reverse=True)
+        return [data for _, data in candidates[:limit]]
+
+#Bakım
+    def vacuum_all(self, retention_seconds: float = 0.0) -> Dict[str, Any]:
+        result = {"scanned": 0, "removed": 0, "bytes": 0}
+        for part in self._scatter("vacuum_all", retention_seconds):
+            for key in result:
+                result[key] += part[key]
+        return result
+
+    def clear_all(self) -> None:
+        self._buffers = [[] for _ in range(self.shards)]
+        self._scatter("clear_all")
+
+    def close(self) -> None:
+        if not self._processes:
+            return
+        self.flush()
+        for shard in range(self.shards):
+            self._send(shard, "stop")
+        for shard in range(self.shards):
+            self._receive(shard)
+            self._connections[shard].close()
+            self._processes[shard].join()
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"ShardedInteractionManager(shards={self.shards}, key={self.key})"
+
+
+def _sum_counts(parts: Iterable[Dict[str, int]]) -> Dict[str, int]:
+    result: Dict[str, int] = {}
+    for part in parts:
+        for name, count in part.items():
+            result[name] = result.get(name, 0) + count
+    return result
@@ -0,0 +1,469 @@
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import struct
+from array import array
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+
+def hash64(value: Any) -> int:
+    #Süreçler ve shard'lar arasında aynı kalan 64 bit hash (birleştirme için gerekli)
+    return int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "little")
+
+#Seyrek HyperLogLog girdisi: (indeks << RANK_BITS) | rank; rank en fazla 61 olduğundan 6 bit yeter
+RANK_BITS = 6
+RANK_MASK = (1 << RANK_BITS) - 1
+#to_bytes başlığında seyrek gösterim işareti (hassasiyet en fazla 16)
+SPARSE_FLAG = 0x80
+
+#Farklı eleman sayısı tahmini (HyperLogLog); standart hata ~ 1.04 / sqrt(2^precision)
+#Az elemanlı kümeler seyrek tutulur (sıralı array, girdi başına 4 bayt); seyrek dizi yoğun
+#yazmaç dizisinden büyüyecekse yoğun gösterime geçilir. Anahtar başına bir özet tutulan
+#panolarda bellek, tekil eleman sayısıyla orantılı kalır.
+class HyperLogLog:
+    __slots__ = ("precision", "_registers", "_sparse")
+
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 16:
+            raise ValueError("HyperLogLog hassasiyeti 4 ile 16 arasında olmalıdır.")
+        self.precision = precision
+        self._registers: bytearray | None = None
+        self._sparse: array | None = array("I")
+
+    def _densify(self) -> None:
+        registers = bytearray(1 << self.precision)
+        for entry in self._sparse:
+            registers[entry >> RANK_BITS] = entry & RANK_MASK
+        self._registers = registers
+        self._sparse = None
+
+    def _set(self, index: int, rank: int) -> None:
+        sparse = self._sparse
+        if sparse is None:
+            if rank > self._registers[index]:
+                self._registers[index] = rank
+            return
+        pos = bisect.bisect_left(sparse, index << RANK_BITS)
+        if pos < len(sparse) and sparse[pos] >> RANK_BITS == index:
+            if rank > sparse[pos] & RANK_MASK:
+                sparse[pos] = (index << RANK_BITS) | rank
+            return
+        sparse.insert(pos, (index << RANK_BITS) | rank)
+        if len(sparse) * sparse.itemsize > (1 << self.precision):
+            self._densify()
+
+    def add(self, value: Any) -> None:
+        h = hash64(value)
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        self._set(index, rank)
+
+    def is_sparse(self) -> bool:
+        return self._sparse is not None
+
+    def count(self) -> int:
+        m = 1 << self.precision
+        if self._sparse is not None:
+            zeros = m - len(self._sparse)
+            total = zeros + sum(2.0 ** -(entry & RANK_MASK) for entry in self._sparse)
+        else:
+            zeros = self._registers.count(0)
+            total = sum(2.0 ** -r for r in self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / total
+        if estimate <= 2.5 * m and zeros:
+            #Küçük kümelerde doğrusal sayım
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Farklı hassasiyetteki HyperLogLog'lar birleştirilemez.")
+        if other._sparse is not None:
+            for entry in list(other._sparse):
+                self._set(entry >> RANK_BITS, entry & RANK_MASK)
+            return self
+        if self._sparse is not None:
+            self._densify()
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+    def error_bound(self) -> float:
+        return 1.04 / math.sqrt(1 << self.precision)
+
+    def to_bytes(self) -> bytes:
+        if self._sparse is not None:
+            return bytes([self.precision | SPARSE_FLAG]) + self._sparse.tobytes()
+        return bytes([self.precision]) + bytes(self._registers)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        hll = cls(data[0] & ~SPARSE_FLAG)
+        if data[0] & SPARSE_FLAG:
+            hll._sparse.frombytes(data[1:])
+        else:
+            hll._registers = bytearray(data[1:])
+            hll._sparse = None
+        return hll
+
+    def __str__(self) -> str:
+        return f"HyperLogLog(precision={self.precision}, estimate={self.count()})"
+
+#Frekans tahmini (Count-Min); tahmin >= gerçek değer, hata <= toplam * e / genişlik (1 - e^-derinlik olasılıkla)
+class CountMinSketch:
+    __slots__ = ("width", "depth", "total", "_rows")
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        if width <= 0 or depth <= 0:
+            raise ValueError("Count-Min boyutları pozitif olmalıdır.")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [array("q", bytes(8 * width)) for _ in range(depth)]
+
+    def _indexes(self, key: Any) -> List[int]:
+        h = hash64(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = h >> 32
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, key: Any, count: int = 1) -> None:
+        self.total += count
+        for row, index in zip(self._rows, self._indexes(key)):
+            row[index] += count
+
+    def estimate(self, key: Any) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Farklı boyuttaki Count-Min tabloları birleştirilemez.")
+        for row, other_row in zip(self._rows, other._rows):
+            for k in range(self.width):
+                row[k] += other_row[k]
+        self.total += other.total
+        return self
+
+    def error_bound(self) -> float:
+        return math.e / self.width * self.total
+
+    def to_bytes(self) -> bytes:
+        header = struct.pack("<IIq", self.width, self.depth, self.total)
+        return header + b"".join(row.tobytes() for row in self._rows)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CountMinSketch":
+        width, depth, total = struct.unpack_from("<IIq", data)
+        sketch = cls(width, depth)
+        sketch.total = total
+        offset = struct.calcsize("<IIq")
+        for row in sketch._rows:
+            row[:] = array("q", data[offset:offset + 8 * width])
+            offset += 8 * width
+        return sketch
+
+    def __str__(self) -> str:
+        return f"CountMinSketch(width={self.width}, depth={self.depth}, total={self.total})"
+
+#En sık elemanlar (Space-Saving); sayım en fazla 'hata' kadar fazla tahmin edilir
+#En küçük sayaç bir min-heap'ten bulunur. Heap'te her eleman için bir giriş vardır ve sayaçlar
+#add ile yalnızca arttığından girişler eskiyebilir (gerçek sayı >= giriş); eski giriş çıkarma sırasında
+#yenilenir. discard sayacı azalttığı için heap'i yeniden kurar (geri alma seyrek bir olaydır).
+class SpaceSaving:
+    __slots__ = ("capacity", "_counts", "_errors", "_heap")
+
+    def __init__(self, capacity: int = 100):
+        if capacity <= 0:
+            raise ValueError("Kapasite pozitif olmalıdır.")
+        self.capacity = capacity
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def _rebuild(self) -> None:
+        self._heap = [(count, key) for key, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+    def _pop_min(self) -> str:
+        heap = self._heap
+        while True:
+            count, key = heap[0]
+            current = self._counts[key]
+            if current == count:
+                heapq.heappop(heap)
+                return key
+            heapq.heapreplace(heap, (current, key))
+
+    def add(self, key: str, count: int = 1) -> None:
+        if count <= 0:
+            raise ValueError("Space-Saving artışı pozitif olmalıdır.")
+        counts = self._counts
+        if key in counts:
+            counts[key] += count
+            return
+        if len(counts) < self.capacity:
+            counts[key] = count
+            self._errors[key] = 0
+            heapq.heappush(self._heap, (count, key))
+            return
+        #En küçük sayaç yeni elemana devredilir
+        victim = self._pop_min()
+        floor = counts.pop(victim)
+        del self._errors[victim]
+        counts[key] = floor + count
+        self._errors[key] = floor
+        heapq.heappush(self._heap, (floor + count, key))
+
+#Geri alma: izlenen elemanın sayacı düşülür, sıfıra inen eleman bırakılır; izlenmeyen eleman yok sayılır
+    def discard(self, key: str, count: int = 1) -> None:
+        if count <= 0:
+            raise ValueError("Space-Saving azaltımı pozitif olmalıdır.")
+        current = self._counts.get(key)
+        if current is None:
+            return
+        remaining = current - count
+        if remaining <= 0:
+            del self._counts[key]
+            del self._errors[key]
+        else:
+            self._counts[key] = remaining
+            self._errors[key] = min(self._errors[key], remaining)
+        self._rebuild()
+
+    def top(self, limit: int = 10) -> List[Tuple[str, int, int]]:
+        #(eleman, tahmini sayı, hata payı)
+        ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return [(key, count, self._errors[key]) for key, count in ranked[:limit]]
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        #Her iki özetin en küçük sayacı, diğerinde bulunmayan elemanların hata payıdır
+        floor_self = min(self._counts.values()) if len(self._counts) >= self.capacity else 0
+        floor_other = min(other._counts.values()) if len(other._counts) >= other.capacity else 0
+        counts: Dict[str, int] = {}
+        errors: Dict[str, int] = {}
+        for key in set(self._counts) | set(other._counts):
+            counts[key] = self._counts.get(key, floor_self) + other._counts.get(key, floor_other)
+            errors[key] = self._errors.get(key, floor_self) + other._errors.get(key, floor_other)
+        keep = sorted(counts, key=counts.get, reverse=True)[:self.capacity]
+        self._counts = {key: counts[key] for key in keep}
+        self._errors = {key: errors[key] for key in keep}
+        self._rebuild()
+        return self
+
+    def to_bytes(self) -> bytes:
+        return json.dumps({"capacity": self.capacity, "counts": self._counts, "errors": self._errors}).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpaceSaving":
+        state = json.loads(data.decode("utf-8"))
+        sketch = cls(state["capacity"])
+        sketch._counts = state["counts"]
+        sketch._errors = state["errors"]
+        sketch._rebuild()
+        return sketch
+
+    def __str__(self) -> str:
+        return f"SpaceSaving(capacity={self.capacity}, tracked={len(self._counts)})"
+
+#Serileştirmede sırası sabit HyperLogLog sözlükleri
+HLL_FIELDS = ("commenters", "likers", "channel_likers", "subscribers")
+
+
+def _frame(data: bytes) -> bytes:
+    return struct.pack("<I", len(data)) + data
+
+
+def _unframe(data: bytes, offset: int) -> Tuple[bytes, int]:
+    (size,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    return bytes(data[offset:offset + size]), offset + size
+
+#Panolar için sabit bellekli özetler; manager'a attach() ile bağlanır
+#- video başına tekil yorumcu, hedef başına tekil beğenen, kanal başına tekil abone (HyperLogLog)
+#- hedef başına beğeni sayısı (Count-Min) ve en çok beğenilen hedefler (Space-Saving)
+#video_channel verilirse (video_id -> channel_id) kanal başına tekil beğenenler de tutulur.
+#Yalnızca aktif kayıtlar sayılır. Beğeni sayıları (Count-Min, Space-Saving) like_type / target_type / status
+#değişikliklerinde ve kaldırmada düşülür; HyperLogLog'lar silme desteklemediğinden tekil sayımlar düşülmez.
+class InteractionSketches:
+    def __init__(
+            self,
+            precision: int = 12,
+            cms_width: int = 2048,
+            cms_depth: int = 4,
+            heavy_hitters: int = 100,
+            video_channel: Optional[Callable[[str], Optional[str]]] = None
+    ):
+        self.precision = precision
+        self.cms_width = cms_width
+        self.cms_depth = cms_depth
+        self.heavy_hitters = heavy_hitters
+        self.video_channel = video_channel
+
+        self.commenters: Dict[str, HyperLogLog] = {}
+        self.likers: Dict[str, HyperLogLog] = {}
+        self.channel_likers: Dict[str, HyperLogLog] = {}
+        self.subscribers: Dict[str, HyperLogLog] = {}
+        self.like_counts = CountMinSketch(cms_width, cms_depth)
+        self.top_liked = SpaceSaving(heavy_hitters)
+
+    def _hll(self, sketches: Dict[str, HyperLogLog], key: str) -> HyperLogLog:
+        hll = sketches.get(key)
+        if hll is None:
+            hll = sketches[key] = HyperLogLog(self.precision)
+        return hll
+
+    @staticmethod
+    def _target(interaction: LikeInteraction) -> str:
+        return f"{interaction.target_type}:{interaction.target_id}"
+
+    def _count_like(self, target: str, delta: int) -> None:
+        self.like_counts.add(target, delta)
+        if delta > 0:
+            self.top_liked.add(target, delta)
+        else:
+            self.top_liked.discard(target, -delta)
+
+#Manager olayları (attach ile bağlanır)
+    def add(self, interaction: InteractionBase) -> None:
+        if not interaction.is_active():
+            return
+        if isinstance(interaction, CommentInteraction):
+            self._hll(self.commenters, interaction.video_id).add(interaction.user_id)
+        elif isinstance(interaction, LikeInteraction):
+            target = self._target(interaction)
+            self._hll(self.likers, target).add(interaction.user_id)
+            if interaction.is_like():
+                self._count_like(target, 1)
+            if self.video_channel is not None and interaction.is_video_like():
+                channel = self.video_channel(interaction.target_id)
+                if channel is not None:
+                    self._hll(self.channel_likers, channel).add(interaction.user_id)
+        elif isinstance(interaction, SubscriptionInteraction):
+            if interaction.action_type == "subscribe":
+                self._hll(self.subscribers, interaction.channel_id).add(interaction.user_id)
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if field == "status":
+            if (old == "active") == interaction.is_active():
+                return
+            if interaction.is_active():
+                self.add(interaction)
+            elif isinstance(interaction, LikeInteraction) and interaction.is_like():
+                self._count_like(self._target(interaction), -1)
+        elif not interaction.is_active():
+            return
+        elif field == "like_type" and isinstance(interaction, LikeInteraction):
+            if (old == "like") != interaction.is_like():
+                self._count_like(self._target(interaction), 1 if interaction.is_like() else -1)
+        elif field == "target_type" and isinstance(interaction, LikeInteraction):
+            #Eski hedefin sayısı düşülür; yeni hedef add ile beslenir
+            if interaction.is_like():
+                self._count_like(f"{old}:{interaction.target_id}", -1)
+            self.add(interaction)
+        elif field == "action_type" and isinstance(interaction, SubscriptionInteraction):
+            self.add(interaction)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        if isinstance(interaction, LikeInteraction) and interaction.is_active() and interaction.is_like():
+            self._count_like(self._target(interaction), -1)
+
+    def clear(self) -> None:
+        self.commenters.clear()
+        self.likers.clear()
+        self.channel_likers.clear()
+        self.subscribers.clear()
+        self.like_counts = CountMinSketch(self.cms_width, self.cms_depth)
+        self.top_liked = SpaceSaving(self.heavy_hitters)
+
+#Sorgular
+    @staticmethod
+    def _estimate(sketches: Dict[str, HyperLogLog], key: str) -> int:
+        hll = sketches.get(key)
+        return hll.count() if hll is not None else 0
+
+    def unique_commenters(self, video_id: str) -> int:
+        return self._estimate(self.commenters, video_id)
+
+    def unique_likers(self, target_id: str, target_type: str = "video") -> int:
+        return self._estimate(self.likers, f"{target_type}:{target_id}")
+
+    def unique_channel_likers(self, channel_id: str) -> int:
+        return self._estimate(self.channel_likers, channel_id)
+
+    def unique_subscribers(self, channel_id: str) -> int:
+        return self._estimate(self.subscribers, channel_id)
+
+    def estimate_likes(self, target_id: str, target_type: str = "video") -> int:
+        return self.like_counts.estimate(f"{target_type}:{target_id}")
+
+    def top_targets(self, limit: int = 10, target_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        result = []
+        for key, count, error in self.top_liked.top(self.heavy_hitters):
+            kind, target_id = key.split(":", 1)
+            if target_type is not None and kind != target_type:
+                continue
+            result.append({"target_type": kind, "target_id": target_id, "likes": count, "error": error})
+            if len(result) >= limit:
+                break
+        return result
+
+#Shard / zaman dilimi birleştirme ve serileştirme
+    def merge(self, other: "InteractionSketches") -> "InteractionSketches":
+        for mine, theirs in (
+            (self.commenters, other.commenters),
+            (self.likers, other.likers),
+            (self.channel_likers, other.channel_likers),
+            (self.subscribers, other.subscribers),
+        ):
+            for key, hll in theirs.items():
+                if key in mine:
+                    mine[key].merge(hll)
+                else:
+                    mine[key] = HyperLogLog.from_bytes(hll.to_bytes())
+        self.like_counts.merge(other.like_counts)
+        self.top_liked.merge(other.top_liked)
+        return self
+
+    def to_bytes(self) -> bytes:
+        #Başlık, ardından her HyperLogLog sözlüğü (adet, anahtar/özet çiftleri) ve diğer iki özet;
+        #değişken uzunluklu her parça 4 baytlık uzunlukla başlar
+        parts = [struct.pack("<BIII", self.precision, self.cms_width, self.cms_depth, self.heavy_hitters)]
+        for name in HLL_FIELDS:
+            sketches: Dict[str, HyperLogLog] = getattr(self, name)
+            parts.append(struct.pack("<I", len(sketches)))
+            for key, hll in sketches.items():
+                parts.append(_frame(key.encode("utf-8")))
+                parts.append(_frame(hll.to_bytes()))
+        parts.append(_frame(self.like_counts.to_bytes()))
+        parts.append(_frame(self.top_liked.to_bytes()))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InteractionSketches":
+        precision, cms_width, cms_depth, heavy_hitters = struct.unpack_from("<BIII", data)
+        offset = struct.calcsize("<BIII")
+        sketches = cls(precision, cms_width, cms_depth, heavy_hitters)
+        for name in HLL_FIELDS:
+            (size,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            target: Dict[str, HyperLogLog] = getattr(sketches, name)
+            for _ in range(size):
+                key, offset = _unframe(data, offset)
+                blob, offset = _unframe(data, offset)
+                target[key.decode("utf-8")] = HyperLogLog.from_bytes(blob)
+        blob, offset = _unframe(data, offset)
+        sketches.like_counts = CountMinSketch.from_bytes(blob)
+        blob, offset = _unframe(data, offset)
+        sketches.top_liked = SpaceSaving.from_bytes(blob)
+        return sketches
+
+    def __str__(self) -> str:
+        return f"InteractionSketches(videos={len(self.commenters)}, targets={len(self.likers)})"
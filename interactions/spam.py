@@ -0,0 +1,156 @@
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Callable, List, Optional, Sequence
+
+#Spam kuralı: check(orijinal metin, küçük harfli metin) -> spam mı
+#batch verilirse (metinler, küçük harfli metinler, sıra numaraları) -> yakalanan sıra numaraları;
+#toplu puanlamada metin başına fonksiyon çağrısı yapılmaz.
+#İşçi süreçlerde kullanılabilmesi için kurallar modül seviyesinde tanımlanmalıdır.
+class SpamRule:
+    __slots__ = ("name", "check", "batch")
+
+    def __init__(
+            self,
+            name: str,
+            check: Callable[[str, str], bool],
+            batch: Optional[Callable[[Sequence[str], Sequence[str], Sequence[int]], List[int]]] = None
+    ):
+        self.name = name
+        self.check = check
+        self.batch = batch
+
+    def apply(self, texts: Sequence[str], lowered: Sequence[str], indexes: Sequence[int]) -> List[int]:
+        if self.batch is not None:
+            return self.batch(texts, lowered, indexes)
+        check = self.check
+        return [k for k in indexes if check(texts[k], lowered[k])]
+
+    def __str__(self) -> str:
+        return f"SpamRule(name={self.name})"
+
+
+#Aynı karakterin 8 kez art arda gelmesi; metin başında 7 boşluk yeterlidir
+#(eski döngü son karakteri " " ile başlattığı için)
+#Geri başvurular tek tek yazılır; {7} tekrarından belirgin şekilde hızlıdır
+REPEATED_PATTERN = re.compile(r"(.)\1\1\1\1\1\1\1", re.DOTALL)
+LEADING_SPACES = " " * 7
+
+
+def too_many_links(text: str, lowered: str) -> bool:
+    return lowered.count("http") > 2
+
+
+def long_text_few_words(text: str, lowered: str) -> bool:
+    #En fazla 5 parça ayrılır: 5'ten az kelime olup olmadığını bilmek yeterli
+    return len(text) > 100 and len(text.split(None, 4)) < 5
+
+
+def repeated_characters(text: str, lowered: str) -> bool:
+    return lowered.startswith(LEADING_SPACES) or REPEATED_PATTERN.search(lowered) is not None
+
+
+def too_many_links_batch(texts: Sequence[str], lowered: Sequence[str], indexes: Sequence[int]) -> List[int]:
+    return [k for k in indexes if lowered[k].count("http") > 2]
+
+
+def long_text_few_words_batch(texts: Sequence[str], lowered: Sequence[str], indexes: Sequence[int]) -> List[int]:
+    return [k for k in indexes if len(texts[k]) > 100 and len(texts[k].split(None, 4)) < 5]
+
+
+def repeated_characters_batch(texts: Sequence[str], lowered: Sequence[str], indexes: Sequence[int]) -> List[int]:
+    search = REPEATED_PATTERN.search
+    return [k for k in indexes if lowered[k].startswith(LEADING_SPACES) or search(lowered[k])]
+
+
+DEFAULT_RULES = (
+    SpamRule("links", too_many_links, too_many_links_batch),
+    SpamRule("long_text", long_text_few_words, long_text_few_words_batch),
+    SpamRule("repeated_chars", repeated_characters, repeated_characters_batch),
+)
+
+#Tek metin kontrolü (CommentInteraction.detect_basic_spam ile aynı sonuç)
+def is_spam(text: str, rules: Sequence[SpamRule] = DEFAULT_RULES) -> bool:
+    lowered = text.lower()
+    for rule in rules:
+        if rule.check(text, lowered):
+            return True
+    return False
+
+#Toplu spam puanlama: her kural sırayla henüz işaretlenmemiş metinlere uygulanır
+#İsabet sayısı, metni ilk yakalayan kurala yazılır (detect_basic_spam'in kısa devresi gibi).
+class SpamScorer:
+    def __init__(self, rules: Sequence[SpamRule] = DEFAULT_RULES):
+        self.rules = tuple(rules)
+        self.hits: Dict[str, int] = {rule.name: 0 for rule in self.rules}
+        self.seconds: Dict[str, float] = {rule.name: 0.0 for rule in self.rules}
+        self.scored = 0
+
+    def score(self, texts: Sequence[str]) -> List[bool]:
+        verdicts = [False] * len(texts)
+        started = time.perf_counter()
+        lowered = [t.lower() for t in texts]
+        self.seconds["lower"] = self.seconds.get("lower", 0.0) + time.perf_counter() - started
+
+        remaining = range(len(texts))
+        for rule in self.rules:
+            started = time.perf_counter()
+            caught = rule.apply(texts, lowered, remaining)
+            for k in caught:
+                verdicts[k] = True
+            if caught:
+                hit = set(caught)
+                remaining = [k for k in remaining if k not in hit]
+            self.hits[rule.name] += len(caught)
+            self.seconds[rule.name] += time.perf_counter() - started
+        self.scored += len(texts)
+        return verdicts
+
+#Büyük partilerde puanlama süreç havuzunda yapılır, istatistikler birleştirilir
+    def score_parallel(
+            self,
+            texts: Sequence[str],
+            workers: int,
+            pool: Optional[ProcessPoolExecutor] = None
+    ) -> List[bool]:
+        if workers <= 1 or len(texts) < 2 * workers:
+            return self.score(texts)
+        chunk_size = -(-len(texts) // workers)
+        chunks = [list(texts[k:k + chunk_size]) for k in range(0, len(texts), chunk_size)]
+        own_pool = pool is None
+        if own_pool:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            parts = list(pool.map(_score_chunk, [self.rules] * len(chunks), chunks))
+        finally:
+            if own_pool:
+                pool.shutdown()
+        verdicts: List[bool] = []
+        for part_verdicts, stats in parts:
+            verdicts.extend(part_verdicts)
+            self.merge_stats(stats)
+        return verdicts
+
+#Başka bir puanlayıcının (ör. işçi süreç) stats() çıktısını ekleme
+    def merge_stats(self, stats: Dict[str, Any]) -> None:
+        for name, count in stats["hits"].items():
+            self.hits[name] = self.hits.get(name, 0) + count
+        for name, seconds in stats["seconds"].items():
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.scored += stats["scored"]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"scored": self.scored, "hits": dict(self.hits), "seconds": dict(self.seconds)}
+
+    def reset(self) -> None:
+        self.hits = {rule.name: 0 for rule in self.rules}
+        self.seconds = {rule.name: 0.0 for rule in self.rules}
+        self.scored = 0
+
+    def __str__(self) -> str:
+        return f"SpamScorer(rules={len(self.rules)}, scored={self.scored})"
+
+
+def _score_chunk(rules: Sequence[SpamRule], texts: List[str]):
+    scorer = SpamScorer(rules)
+    return scorer.score(texts), scorer.stats()
@@ -0,0 +1,251 @@
+import json
+import os
+import struct
+import zlib
+from datetime import datetime
+from typing import Dict, Any, List, Tuple, Optional, Iterator, BinaryIO
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+#Sınıf adı -> sınıf (kayıtlardan nesne oluşturmak için)
+INTERACTION_CLASSES = {
+    cls.__name__: cls
+    for cls in (CommentInteraction, LikeInteraction, SubscriptionInteraction)
+}
+
+#Çerçeve başlığı: veri uzunluğu + crc32; veri UTF-8 JSON'dır (to_dict / from_dict kayıtları)
+#CRC yalnızca yarım kalmış yazmaları yakalar; CRC'si doğru ama çözülemeyen çerçeve hata verir.
+FRAME_HEADER = struct.Struct("<II")
+SNAPSHOT_CHUNK = 1000
+
+
+def interaction_from_record(class_name: str, data: Dict[str, Any]) -> InteractionBase:
+    cls = INTERACTION_CLASSES.get(class_name)
+    if cls is None:
+        raise ValueError(f"Bilinmeyen interaction türü: {class_name}")
+    return cls.from_dict(data)
+
+#Log dosyasına çerçeve yazma / okuma
+def write_frame(fh: BinaryIO, payload: Any) -> None:
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    fh.write(FRAME_HEADER.pack(len(data), zlib.crc32(data)))
+    fh.write(data)
+
+
+def read_frames(fh: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    #Yarım kalmış (bozuk) son çerçevede okuma durur; (bitiş konumu, veri) döner
+    while True:
+        header = fh.read(FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            return
+        length, crc = FRAME_HEADER.unpack(header)
+        data = fh.read(length)
+        if len(data) < length or zlib.crc32(data) != crc:
+            return
+        yield fh.tell(), json.loads(data)
+
+#Append-only log + periyodik snapshot ile kalıcı depolama
+class InteractionStore:
+    def __init__(self, directory: str, sync_every: int = 100):
+        self.directory = directory
+        self.sync_every = sync_every
+        os.makedirs(directory, exist_ok=True)
+
+        self.manager = None
+        self._log: Optional[BinaryIO] = None
+        self._sequence = 0
+        self._pending = 0
+        self._replaying = False
+
+#Dosya adları
+    def _log_path(self, sequence: int) -> str:
+        return os.path.join(self.directory, f"wal-{sequence:08d}.log")
+
+    def _snapshot_path(self, sequence: int) -> str:
+        return os.path.join(self.directory, f"snapshot-{sequence:08d}.bin")
+
+    def _sequences(self, prefix: str) -> List[int]:
+        result = []
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix + "-") and not name.endswith(".tmp"):
+                result.append(int(name[len(prefix) + 1:].split(".")[0]))
+        return sorted(result)
+
+#Kurtarma: son snapshot yüklenir, sonraki loglar yeniden oynatılır
+    def recover(self, manager=None):
+        if manager is None:
+            from interactions.manager import InteractionManager
+            manager = InteractionManager()
+
+        snapshots = self._sequences("snapshot")
+        base = snapshots[-1] if snapshots else 0
+        self._replaying = True
+        try:
+            if snapshots:
+                self._load_snapshot(manager, self._snapshot_path(base))
+            logs = [s for s in self._sequences("wal") if s >= base]
+            for sequence in logs:
+                end = self._replay_log(manager, self._log_path(sequence))
+                #Bozuk kuyruk kesilir ki yeni kayıtlar ardına eklenebilsin
+                with open(self._log_path(sequence), "r+b") as fh:
+                    fh.truncate(end)
+        finally:
+            self._replaying = False
+
+        self._sequence = max([base] + logs)
+        self.manager = manager
+        self._open_log()
+        manager.attach(self)
+        return manager
+
+    def _load_snapshot(self, manager, path: str) -> None:
+        with open(path, "rb") as fh:
+            for _, records in read_frames(fh):
+                for class_name, data in records:
+                    manager.add_interaction(interaction_from_record(class_name, data))
+
+    def _replay_log(self, manager, path: str) -> int:
+        end = 0
+        #Art arda gelen purge olayları tek seferde uygulanır
+        purged: List[str] = []
+        with open(path, "rb") as fh:
+            for end, event in read_frames(fh):
+                if event[0] == "purge":
+                    purged.append(event[1])
+                    continue
+                if purged:
+                    manager.purge(purged)
+                    purged = []
+                self._apply(manager, event)
+        if purged:
+            manager.purge(purged)
+        return end
+
+    def _apply(self, manager, event: Tuple) -> None:
+        kind = event[0]
+        if kind == "add":
+            manager.add_interaction(interaction_from_record(event[1], event[2]))
+        elif kind == "set":
+            #Tekrarlanan id'lerde kaydın sırası beşinci alanda tutulur
+            copies = manager.get_all_by_id(event[1])
+            occurrence = event[4] if len(event) > 4 else 0
+            if occurrence < len(copies):
+                apply_change(copies[occurrence], event[2], event[3])
+        elif kind == "clear":
+            manager.clear_all()
+
+#Manager olayları (attach ile bağlanır)
+    def add(self, interaction: InteractionBase) -> None:
+        self._append(("add", interaction.get_class_name(), interaction.to_dict()))
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        event: Tuple = ("set", interaction.interaction_id, field, new)
+        if self.manager is not None:
+            copies = self.manager.get_all_by_id(interaction.interaction_id)
+            if len(copies) > 1:
+                occurrence = next(n for n, i in enumerate(copies) if i is interaction)
+                event += (occurrence,)
+        self._append(event)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        self._append(("purge", interaction.interaction_id))
+
+    def clear(self) -> None:
+        self._append(("clear",))
+
+    def _append(self, event: Tuple) -> None:
+        if self._replaying or self._log is None:
+            return
+        write_frame(self._log, event)
+        self._pending += 1
+        if self._pending >= self.sync_every:
+            self.flush()
+
+    def _open_log(self) -> None:
+        self._log = open(self._log_path(self._sequence), "ab")
+        self._sync_directory()
+
+    def flush(self) -> None:
+        if self._log is None:
+            return
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._pending = 0
+
+#Snapshot: yeni log dosyasına geçilir, o anki durum yazılır, eskiler silinir
+    def snapshot(self) -> str:
+        if self.manager is None:
+            raise ValueError("Snapshot için önce recover() çağrılmalıdır.")
+        self.flush()
+        self._log.close()
+        self._sequence += 1
+        self._open_log()
+
+        path = self._snapshot_path(self._sequence)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as fh:
+            chunk: List[Tuple[str, Dict[str, Any]]] = []
+            for i in self.manager.interactions:
+                chunk.append((i.get_class_name(), i.to_dict()))
+                if len(chunk) >= SNAPSHOT_CHUNK:
+                    write_frame(fh, chunk)
+                    chunk = []
+            if chunk:
+                write_frame(fh, chunk)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+        #Yeniden adlandırma ve yeni log dosyası dizin kaydı diske yazılınca kalıcı olur
+        self._sync_directory()
+
+        for sequence in self._sequences("snapshot"):
+            if sequence < self._sequence:
+                os.remove(self._snapshot_path(sequence))
+        for sequence in self._sequences("wal"):
+            if sequence < self._sequence:
+                os.remove(self._log_path(sequence))
+        return path
+
+    def _sync_directory(self) -> None:
+        if os.name == "nt":
+            return
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        if self._log is not None:
+            self.flush()
+            self._log.close()
+            self._log = None
+        if self.manager is not None:
+            self.manager.detach(self)
+            self.manager = None
+
+    def __str__(self) -> str:
+        return f"InteractionStore(directory={self.directory}, sequence={self._sequence})"
+
+#Log kaydındaki alan değişikliğini nesneye uygulama
+def apply_change(interaction: InteractionBase, field: str, value: Any) -> None:
+    if field == "created_at":
+        interaction.created_at = datetime.fromtimestamp(value)
+    elif field == "comment_text":
+        interaction.edit_comment(value)
+    elif field in ("like_count", "dislike_count", "reply_count"):
+        interaction._set_count(field, value)
+    elif field == "flags":
+        interaction.flags = value
+    elif field == "tier":
+        interaction._set_tier(value)
+    elif field == "is_pinned":
+        if value:
+            interaction.pin()
+        else:
+            interaction.unpin()
+    else:
+        setattr(interaction, field, value)
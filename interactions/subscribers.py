@@ -0,0 +1,144 @@
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
+
+from interactions.base import InteractionBase
+from interactions.subscription import SubscriptionInteraction
+
+#Geçerli sayılmayan olay durumları
+IGNORED_STATUSES = ("deleted", "flagged")
+
+#Abonelik olaylarından türetilen güncel durum tablosu
+#(user_id, channel_id) başına olaylar ekleme sırasıyla tutulur; son geçerli olay durumu belirler.
+#Bir olay silinir veya geri yüklenirse durum o anahtarın olaylarından yeniden hesaplanır.
+#Kanal başına aboneler ve bildirim seviyesi sayıları artımlı güncellenir. Manager'a attach() ile bağlanır.
+class SubscriberTable:
+    def __init__(self):
+        #(user_id, channel_id) -> olaylar (ekleme sırasıyla, silinmişler dahil)
+        self._events: Dict[Tuple[str, str], List[SubscriptionInteraction]] = {}
+        #channel_id -> {user_id: abonelik}; yalnızca aktif aboneler
+        self._channels: Dict[str, Dict[str, SubscriptionInteraction]] = {}
+        #channel_id -> {bildirim seviyesi: abone sayısı}
+        self._levels: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase]) -> "SubscriberTable":
+        table = cls()
+        for i in interactions:
+            table.add(i)
+        return table
+
+    def __len__(self) -> int:
+        return sum(len(users) for users in self._channels.values())
+
+#Tablo güncelleme
+    def _subscribe(self, sub: SubscriptionInteraction) -> None:
+        users = self._channels.get(sub.channel_id)
+        if users is None:
+            users = self._channels[sub.channel_id] = {}
+        previous = users.get(sub.user_id)
+        if previous is not None:
+            self._count_level(sub.channel_id, previous.notification_level, -1)
+        users[sub.user_id] = sub
+        self._count_level(sub.channel_id, sub.notification_level, 1)
+
+    def _unsubscribe(self, user_id: str, channel_id: str) -> None:
+        users = self._channels.get(channel_id)
+        if users is None:
+            return
+        previous = users.pop(user_id, None)
+        if previous is None:
+            return
+        self._count_level(channel_id, previous.notification_level, -1)
+        if not users:
+            del self._channels[channel_id]
+
+    def _count_level(self, channel_id: str, level: str, delta: int) -> None:
+        levels = self._levels.get(channel_id)
+        if levels is None:
+            levels = self._levels[channel_id] = {}
+        levels[level] = levels.get(level, 0) + delta
+        if levels[level] == 0:
+            del levels[level]
+            if not levels:
+                del self._levels[channel_id]
+
+    #Anahtarın durumunu son geçerli olaydan yeniden hesaplama
+    def _refresh(self, user_id: str, channel_id: str) -> None:
+        current = None
+        for sub in reversed(self._events.get((user_id, channel_id), ())):
+            if sub.status not in IGNORED_STATUSES:
+                current = sub
+                break
+        if current is not None and current.is_subscribed():
+            self._subscribe(current)
+        else:
+            self._unsubscribe(user_id, channel_id)
+
+#Manager olayları (process / _handle_subscription / _unhandle_subscription durum değiştirir)
+    def add(self, interaction: InteractionBase) -> None:
+        if not isinstance(interaction, SubscriptionInteraction):
+            return
+        key = (interaction.user_id, interaction.channel_id)
+        events = self._events.get(key)
+        if events is None:
+            events = self._events[key] = []
+        events.append(interaction)
+        self._refresh(*key)
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if not isinstance(interaction, SubscriptionInteraction):
+            return
+        if field in ("status", "action_type"):
+            if (interaction.user_id, interaction.channel_id) in self._events:
+                self._refresh(interaction.user_id, interaction.channel_id)
+        elif field == "notification_level":
+            if self.get(interaction.user_id, interaction.channel_id) is interaction:
+                self._count_level(interaction.channel_id, old, -1)
+                self._count_level(interaction.channel_id, new, 1)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        if not isinstance(interaction, SubscriptionInteraction):
+            return
+        key = (interaction.user_id, interaction.channel_id)
+        events = self._events.get(key)
+        if events is None:
+            return
+        for pos, sub in enumerate(events):
+            if sub is interaction:
+                del events[pos]
+                break
+        if not events:
+            del self._events[key]
+        self._refresh(*key)
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._channels.clear()
+        self._levels.clear()
+
+#Sorgular
+    def is_subscribed(self, user_id: str, channel_id: str) -> bool:
+        return user_id in self._channels.get(channel_id, ())
+
+    def get(self, user_id: str, channel_id: str) -> SubscriptionInteraction | None:
+        return self._channels.get(channel_id, {}).get(user_id)
+
+    def subscriber_count(self, channel_id: str, level: str | None = None) -> int:
+        if level is None:
+            return len(self._channels.get(channel_id, ()))
+        return self._levels.get(channel_id, {}).get(level, 0)
+
+    def level_counts(self, channel_id: str) -> Dict[str, int]:
+        return dict(self._levels.get(channel_id, {}))
+
+    def subscribers(self, channel_id: str) -> Iterator[SubscriptionInteraction]:
+        #Liste oluşturulmaz; gezinirken tablo değiştirilmemelidir
+        return iter(self._channels.get(channel_id, {}).values())
+
+    def subscriber_ids(self, channel_id: str) -> List[str]:
+        return list(self._channels.get(channel_id, ()))
+
+    def subscribers_by_channel(self) -> Dict[str, int]:
+        return {channel: len(users) for channel, users in self._channels.items()}
+
+    def __str__(self) -> str:
+        return f"SubscriberTable(channels={len(self._channels)}, subscribers={len(self)})"
@@ -1,10 +1,14 @@
 from typing import Dict, Any
-from datetime import datetime
 
-from interactions.base import InteractionBase
+from interactions.base import InteractionBase, CodeTable, intern_id
+
+ACTION_TYPES = CodeTable("subscribe", "unsubscribe")
+NOTIFICATION_LEVELS = CodeTable("all", "personalized", "none")
 
 # Subscription (abonelik) etkileşimlerini yöneten sınıf
 class SubscriptionInteraction(InteractionBase):
+    __slots__ = ("channel_id", "_action_type", "_notification_level", "tier")
+
     total_subscriptions = 0
     total_unsubscriptions = 0
 
@@ -17,10 +21,9 @@ class SubscriptionInteraction(InteractionBase):
             notification_level: str = "all"
     ):
         super().__init__(interaction_id, user_id)
-        self.channel_id = channel_id
-        self.action_type = action_type
-        self.notification_level = notification_level
-        self.created_at = datetime.now()
+        self.channel_id = intern_id(channel_id)
+        self._action_type = ACTION_TYPES.code(action_type)
+        self._notification_level = NOTIFICATION_LEVELS.code(notification_level)
         self.tier = "free"
 
         #Global sayaçlar
@@ -29,6 +32,28 @@ class SubscriptionInteraction(InteractionBase):
         else:
             SubscriptionInteraction.total_unsubscriptions += 1
 
+    @property
+    def action_type(self) -> str:
+        return ACTION_TYPES.value(self._action_type)
+
+    @action_type.setter
+    def action_type(self, value: str) -> None:
+        old = self._action_type
+        self._action_type = ACTION_TYPES.code(value)
+        if old != self._action_type:
+            self._notify("action_type", ACTION_TYPES.value(old), value)
+
+    @property
+    def notification_level(self) -> str:
+        return NOTIFICATION_LEVELS.value(self._notification_level)
+
+    @notification_level.setter
+    def notification_level(self, value: str) -> None:
+        old = self._notification_level
+        self._notification_level = NOTIFICATION_LEVELS.code(value)
+        if old != self._notification_level:
+            self._notify("notification_level", NOTIFICATION_LEVELS.value(old), value)
+
      #Abonelik işlemini başlatma
     def process(self) -> bool:
         if not self.validate():
@@ -65,7 +90,7 @@ class SubscriptionInteraction(InteractionBase):
 
     #Kullanıcı aktif olarak abone mi?
     def is_subscribed(self) -> bool:
-        return self.action_type == "subscrive" and self.is_active()
+        return self.action_type == "subscribe" and self.is_active()
     
     #Bildirim seviyesini güncelleme
     def set_notification_level(self, level: str) -> bool:
@@ -78,11 +103,31 @@ class SubscriptionInteraction(InteractionBase):
     def upgrade_tier(self, tier: str) -> bool:
         allowed = ["free", "basic", "premium"]
         if tier in allowed:
-            self.tier = tier
+            self._set_tier(tier)
 
     #Paketi varsayılana çekme
     def downgrade_tier(self) -> None:
-        self.tier = "free"
+        self._set_tier("free")
+
+    def _set_tier(self, tier: str) -> None:
+        old = self.tier
+        self.tier = tier
+        if old != tier:
+            self._notify("tier", old, tier)
+
+    #Dictionary formatından nesne oluşturma
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SubscriptionInteraction":
+        sub = cls(
+            data["interaction_id"],
+            data["user_id"],
+            data["channel_id"],
+            data.get("action_type", "subscribe"),
+            data.get("notification_level", "all")
+        )
+        sub.tier = data.get("tier", "free")
+        sub._load_common(data)
+        return sub
 
     #Dictionary formatına çevirme
     def to_dict(self) -> Dict[str, Any]:
@@ -0,0 +1,299 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Iterable, Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  #numpy opsiyonel bağımlılık
+    np = None
+
+from interactions.base import InteractionBase, CodeTable, STATUS
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction, LIKE_TYPES, TARGET_TYPES
+from interactions.subscription import SubscriptionInteraction, ACTION_TYPES
+
+#Satır türleri
+KIND_COMMENT = 0
+KIND_LIKE = 1
+KIND_SUBSCRIPTION = 2
+KIND_OTHER = 3
+#Vacuum ile atılan, compact() beklenen satırlar
+KIND_REMOVED = 4
+
+#Kolon adı -> numpy veri tipi
+COLUMNS = {
+    "kind": "int8",
+    "status": "int8",
+    "user": "int32",
+    "target": "int32",
+    "target_type": "int8",
+    "like_type": "int8",
+    "action_type": "int8",
+    "created_ts": "float64",
+    "like_count": "int32",
+    "dislike_count": "int32",
+    "reply_count": "int32",
+    "comment_length": "int32",
+    "flagged": "bool",
+}
+
+#Interactionları kolon bazlı (struct-of-arrays) tutan tablo
+class InteractionTable:
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ImportError("InteractionTable için numpy kurulu olmalıdır.")
+        self._size = 0
+        self._capacity = max(capacity, 1)
+        self._columns = {
+            name: np.zeros(self._capacity, dtype=dtype)
+            for name, dtype in COLUMNS.items()
+        }
+        #Kullanıcı ve hedef id'leri sözlükle tam sayıya çevrilir
+        self.users = CodeTable(extendable=True)
+        self.targets = CodeTable(extendable=True)
+        #Sınıf adı -> satır sayısı (ilk görülme sırasıyla)
+        self._type_counts: Dict[str, int] = {}
+        self._rows: Dict[int, List[int]] = {}
+        self._dead = 0
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase]) -> "InteractionTable":
+        items = list(interactions)
+        table = cls(capacity=len(items))
+        for i in items:
+            table.append(i)
+        return table
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> "np.ndarray":
+        return self._columns[name][:self._size]
+
+#Satır ekleme
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name, values in self._columns.items():
+            grown = np.zeros(self._capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._columns[name] = grown
+
+    def append(self, interaction: InteractionBase) -> int:
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        self._size += 1
+        self._rows.setdefault(id(interaction), []).append(row)
+        name = interaction.get_class_name()
+        self._type_counts[name] = self._type_counts.get(name, 0) + 1
+
+        cols = self._columns
+        cols["status"][row] = STATUS.find(interaction.status)
+        cols["user"][row] = self.users.code(interaction.user_id)
+        cols["created_ts"][row] = interaction.created_ts
+        cols["target_type"][row] = -1
+        cols["like_type"][row] = -1
+        cols["action_type"][row] = -1
+
+        if isinstance(interaction, CommentInteraction):
+            cols["kind"][row] = KIND_COMMENT
+            cols["target"][row] = self.targets.code(interaction.video_id)
+            cols["like_count"][row] = interaction.like_count
+            cols["dislike_count"][row] = interaction.dislike_count
+            cols["reply_count"][row] = interaction.reply_count
+            cols["comment_length"][row] = len(interaction.comment_text)
+            cols["flagged"][row] = interaction.is_flagged()
+        elif isinstance(interaction, LikeInteraction):
+            cols["kind"][row] = KIND_LIKE
+            cols["target"][row] = self.targets.code(interaction.target_id)
+            cols["target_type"][row] = TARGET_TYPES.find(interaction.target_type)
+            cols["like_type"][row] = LIKE_TYPES.find(interaction.like_type)
+        elif isinstance(interaction, SubscriptionInteraction):
+            cols["kind"][row] = KIND_SUBSCRIPTION
+            cols["target"][row] = self.targets.code(interaction.channel_id)
+            cols["action_type"][row] = ACTION_TYPES.find(interaction.action_type)
+        else:
+            cols["kind"][row] = KIND_OTHER
+            cols["target"][row] = -1
+        return row
+
+#Interaction değişikliklerini kolonlara yansıtma
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        rows = self._rows.get(id(interaction))
+        if not rows:
+            return
+        cols = self._columns
+        for row in rows:
+            if field == "status":
+                cols["status"][row] = STATUS.find(new)
+            elif field == "like_type":
+                cols["like_type"][row] = LIKE_TYPES.find(new)
+            elif field == "target_type":
+                cols["target_type"][row] = TARGET_TYPES.find(new)
+            elif field == "action_type":
+                cols["action_type"][row] = ACTION_TYPES.find(new)
+            elif field in ("like_count", "dislike_count", "reply_count"):
+                cols[field][row] = new
+            elif field == "comment_text":
+                cols["comment_length"][row] = len(new)
+            elif field == "created_at":
+                cols["created_ts"][row] = new
+
+            if field in ("status", "flags") and cols["kind"][row] == KIND_COMMENT:
+                cols["flagged"][row] = interaction.is_flagged()
+
+#Satır silme (işaretleme) ve sıkıştırma
+    def remove(self, interaction: InteractionBase) -> None:
+        rows = self._rows.pop(id(interaction), None)
+        if not rows:
+            return
+        self._columns["kind"][rows] = KIND_REMOVED
+        self._dead += len(rows)
+        name = interaction.get_class_name()
+        self._type_counts[name] -= len(rows)
+        if self._type_counts[name] == 0:
+            del self._type_counts[name]
+
+    def compact(self) -> int:
+        removed = self._dead
+        if removed == 0:
+            return 0
+        live = self.column("kind") != KIND_REMOVED
+        #Eski satır -> yeni satır numarası
+        new_rows = np.cumsum(live) - 1
+        size = int(np.count_nonzero(live))
+        for name, values in self._columns.items():
+            compacted = np.zeros(max(size, 1), dtype=values.dtype)
+            compacted[:size] = values[:self._size][live]
+            self._columns[name] = compacted
+        self._rows = {
+            key: [int(new_rows[row]) for row in rows]
+            for key, rows in self._rows.items()
+        }
+        self._size = size
+        self._capacity = max(size, 1)
+        self._dead = 0
+        return removed
+
+    def clear(self) -> None:
+        self._size = 0
+        self._dead = 0
+        self.users = CodeTable(extendable=True)
+        self.targets = CodeTable(extendable=True)
+        self._type_counts.clear()
+        self._rows.clear()
+
+#Vektörel hesaplamalar
+    def _live_column(self, name: str) -> "np.ndarray":
+        values = self.column(name)
+        if self._dead:
+            values = values[self.column("kind") != KIND_REMOVED]
+        return values
+
+    def _comment_mask(self) -> "np.ndarray":
+        return self.column("kind") == KIND_COMMENT
+
+    def _comment_scores(self) -> "np.ndarray":
+        mask = self._comment_mask()
+        score = (
+            self.column("like_count")[mask] * 1.0 +
+            self.column("reply_count")[mask] * 2.0 -
+            self.column("dislike_count")[mask] * 0.5
+        )
+        return np.maximum(score, 0.0)
+
+    def count_by_type(self) -> Dict[str, int]:
+        return dict(self._type_counts)
+
+    def count_by_status(self) -> Dict[str, int]:
+        codes = self._live_column("status")
+        #Tanımsız durumlar -1 ile tutulur ve sayılmaz
+        counts = np.bincount(codes[codes >= 0], minlength=len(STATUS))
+        return {
+            status: int(counts[STATUS.find(status)])
+            for status in ("active", "deleted", "flagged")
+        }
+
+    def total_comments(self) -> int:
+        return int(np.count_nonzero(self._comment_mask()))
+
+    def flagged_comments(self) -> int:
+        return int(np.count_nonzero(self._comment_mask() & self.column("flagged")))
+
+    def popular_comments(self) -> int:
+        mask = self._comment_mask()
+        popular = (self.column("like_count") >= 10) | (self.column("reply_count") >= 5)
+        return int(np.count_nonzero(mask & popular))
+
+    def average_comment_length(self) -> float:
+        lengths = self.column("comment_length")[self._comment_mask()]
+        if lengths.size == 0:
+            return 0.0
+        return float(lengths.mean())
+
+    def average_comment_score(self) -> float:
+        scores = self._comment_scores()
+        if scores.size == 0:
+            return 0.0
+        return float(scores.mean())
+
+    def classify_comments_by_score(self) -> Dict[str, int]:
+        scores = self._comment_scores()
+        low = int(np.count_nonzero(scores < 5))
+        medium = int(np.count_nonzero((scores >= 5) & (scores < 15)))
+        return {"low": low, "medium": medium, "high": int(scores.size) - low - medium}
+
+    def count_like_types(self) -> Dict[str, int]:
+        like_types = self.column("like_type")[self.column("kind") == KIND_LIKE]
+        return {
+            "like": int(np.count_nonzero(like_types == LIKE_TYPES.find("like"))),
+            "dislike": int(np.count_nonzero(like_types == LIKE_TYPES.find("dislike"))),
+        }
+
+    def _count_targets(self, mask: "np.ndarray") -> Dict[str, int]:
+        counts = np.bincount(self.column("target")[mask], minlength=len(self.targets))
+        return {
+            self.targets.value(int(code)): int(counts[code])
+            for code in np.flatnonzero(counts)
+        }
+
+    def likes_by_target(self, target_type: str) -> Dict[str, int]:
+        code = TARGET_TYPES.find(target_type)
+        if code < 0:
+            return {}
+        mask = (
+            (self.column("kind") == KIND_LIKE) &
+            (self.column("target_type") == code)
+        )
+        return self._count_targets(mask)
+
+    def likes_by_video(self) -> Dict[str, int]:
+        return self.likes_by_target("video")
+
+    def comments_by_video(self) -> Dict[str, int]:
+        return self._count_targets(self._comment_mask())
+
+    def count_since(self, since: datetime) -> int:
+        return int(np.count_nonzero(self._live_column("created_ts") >= since.timestamp()))
+
+    def daily_activity_map(self, days: int = 7, now: Optional[datetime] = None) -> Dict[str, int]:
+        now = now or datetime.now()
+        today = datetime(now.year, now.month, now.day)
+        #Gün sınırları (yerel gece yarıları): bugün, dün, ...
+        starts = [today - timedelta(days=d) for d in range(days)]
+        if days <= 0:
+            return {}
+        edges = np.array(
+            [s.timestamp() for s in reversed(starts)] +
+            [(today + timedelta(days=1)).timestamp()]
+        )
+        slots = np.searchsorted(edges, self._live_column("created_ts"), side="right") - 1
+        slots = slots[(slots >= 0) & (slots < days)]
+        counts = np.bincount(slots, minlength=days)
+
+        return {
+            start.strftime("%Y-%m-%d"): int(counts[days - 1 - d])
+            for d, start in enumerate(starts)
+        }
+
+    def __str__(self) -> str:
+        return f"InteractionTable(rows={self._size})"
@@ -0,0 +1,269 @@
+import bisect
+from operator import itemgetter
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+
+#Sayfalama sıralamaları: (yorum -> sıralama anahtarı); küçük anahtar önce gelir
+THREAD_ORDERS = {
+    "score": lambda c: -c.calculate_score(),
+    "newest": lambda c: -c.created_ts,
+    "oldest": lambda c: c.created_ts,
+}
+
+#Sıralama anahtarını değiştiren alanlar
+ORDER_FIELDS = {
+    "like_count": ("score",),
+    "dislike_count": ("score",),
+    "reply_count": ("score",),
+    "created_at": ("newest", "oldest"),
+}
+
+Cursor = Tuple[float, int]
+Entry = Tuple[float, int, CommentInteraction]
+
+_cursor_key = itemgetter(0, 1)
+
+#Tek bir video veya ebeveyn altındaki yorumlar
+#Her sıralama için (anahtar, sıra, yorum) listesi bisect ile sıralı tutulur; sayfa isteği yeniden sıralamaz.
+class _Thread:
+    __slots__ = ("items", "keys", "ordered")
+
+    def __init__(self):
+        #sıra -> yorum (ekleme sırasıyla)
+        self.items: Dict[int, CommentInteraction] = {}
+        #sıra -> sıralama -> listedeki güncel anahtar
+        self.keys: Dict[int, Dict[str, float]] = {}
+        self.ordered: Dict[str, List[Entry]] = {order: [] for order in THREAD_ORDERS}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, seq: int, comment: CommentInteraction) -> None:
+        self.items[seq] = comment
+        keys = self.keys[seq] = {}
+        for order, key_of in THREAD_ORDERS.items():
+            key = keys[order] = key_of(comment)
+            bisect.insort(self.ordered[order], (key, seq, comment), key=_cursor_key)
+
+    def _unlink(self, order: str, key: float, seq: int) -> None:
+        entries = self.ordered[order]
+        del entries[bisect.bisect_left(entries, (key, seq), key=_cursor_key)]
+
+    def remove(self, seq: int) -> None:
+        if self.items.pop(seq, None) is None:
+            return
+        for order, key in self.keys.pop(seq).items():
+            self._unlink(order, key, seq)
+
+    def refresh(self, seq: int, orders: Iterable[str]) -> None:
+        comment = self.items.get(seq)
+        if comment is None:
+            return
+        keys = self.keys[seq]
+        for order in orders:
+            key = THREAD_ORDERS[order](comment)
+            if key != keys[order]:
+                self._unlink(order, keys[order], seq)
+                keys[order] = key
+                bisect.insort(self.ordered[order], (key, seq, comment), key=_cursor_key)
+
+#Yorum ağacı indeksi: ebeveyn -> sıralı yanıtlar, video -> kök yorumlar
+#reply_count, silinmemiş doğrudan yanıt sayısına eşit tutulur (elle artırmaya gerek kalmaz).
+#Manager'a attach() ile bağlanır.
+class CommentThreadIndex:
+    def __init__(self):
+        self._next_seq = 0
+        self._seq: Dict[int, int] = {}
+        self._by_id: Dict[str, CommentInteraction] = {}
+        #parent_comment_id -> yanıtlar; ebeveyn henüz gelmemiş olabilir
+        self._children: Dict[str, _Thread] = {}
+        #video_id -> kök yorumlar
+        self._roots: Dict[str, _Thread] = {}
+        #parent_comment_id -> silinmemiş yanıt sayısı
+        self._live: Dict[str, int] = {}
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase]) -> "CommentThreadIndex":
+        index = cls()
+        for i in interactions:
+            index.add(i)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+#reply_count eşitleme
+    def _sync(self, parent_id: Optional[str]) -> None:
+        parent = self._by_id.get(parent_id) if parent_id is not None else None
+        if parent is None:
+            return
+        live = self._live.get(parent_id, 0)
+        if parent.reply_count != live:
+            parent._set_count("reply_count", live)
+
+#Manager olayları (attach ile bağlanır)
+    def add(self, interaction: InteractionBase) -> None:
+        if not isinstance(interaction, CommentInteraction) or id(interaction) in self._seq:
+            return
+        seq = self._seq[id(interaction)] = self._next_seq
+        self._next_seq += 1
+        comment_id = interaction.interaction_id
+        if comment_id not in self._by_id:
+            self._by_id[comment_id] = interaction
+
+        parent_id = interaction.parent_comment_id
+        if parent_id is None:
+            self._roots.setdefault(interaction.video_id, _Thread()).add(seq, interaction)
+        else:
+            self._children.setdefault(parent_id, _Thread()).add(seq, interaction)
+            if interaction.status != "deleted":
+                self._count(parent_id, 1)
+            self._sync(parent_id)
+        #Yanıtları önceden gelmiş ebeveyn
+        if comment_id in self._children and self._by_id[comment_id] is interaction:
+            self._sync(comment_id)
+
+    def _thread(self, comment: CommentInteraction) -> _Thread | None:
+        if comment.parent_comment_id is None:
+            return self._roots.get(comment.video_id)
+        return self._children.get(comment.parent_comment_id)
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if not isinstance(interaction, CommentInteraction) or id(interaction) not in self._seq:
+            return
+        orders = ORDER_FIELDS.get(field)
+        if orders is not None:
+            thread = self._thread(interaction)
+            if thread is not None:
+                thread.refresh(self._seq[id(interaction)], orders)
+            return
+        parent_id = interaction.parent_comment_id
+        if field != "status" or parent_id is None or (old == "deleted") == (new == "deleted"):
+            return
+        self._count(parent_id, 1 if old == "deleted" else -1)
+        self._sync(parent_id)
+
+    def _count(self, parent_id: str, delta: int) -> None:
+        live = self._live.get(parent_id, 0) + delta
+        if live:
+            self._live[parent_id] = live
+        else:
+            self._live.pop(parent_id, None)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        seq = self._seq.pop(id(interaction), None)
+        if seq is None:
+            return
+        comment_id = interaction.interaction_id
+        if self._by_id.get(comment_id) is interaction:
+            del self._by_id[comment_id]
+        parent_id = interaction.parent_comment_id
+        if parent_id is None:
+            bucket, key = self._roots, interaction.video_id
+        else:
+            bucket, key = self._children, parent_id
+        thread = bucket.get(key)
+        if thread is not None:
+            thread.remove(seq)
+            if not thread:
+                del bucket[key]
+        if parent_id is not None:
+            if interaction.status != "deleted":
+                self._count(parent_id, -1)
+            self._sync(parent_id)
+
+    def clear(self) -> None:
+        self._seq.clear()
+        self._by_id.clear()
+        self._children.clear()
+        self._roots.clear()
+        self._live.clear()
+
+#Sorgular
+    def get(self, comment_id: str) -> CommentInteraction | None:
+        return self._by_id.get(comment_id)
+
+    def replies(self, comment_id: str) -> List[CommentInteraction]:
+        thread = self._children.get(comment_id)
+        return list(thread.items.values()) if thread is not None else []
+
+    def reply_count(self, comment_id: str) -> int:
+        return self._live.get(comment_id, 0)
+
+    def roots(self, video_id: str) -> List[CommentInteraction]:
+        thread = self._roots.get(video_id)
+        return list(thread.items.values()) if thread is not None else []
+
+#Anahtar tabanlı sayfalama: cursor son döndürülen kaydın (anahtar, sıra) değeridir
+    def _page(
+            self,
+            thread: _Thread | None,
+            order: str,
+            cursor: Optional[Cursor],
+            limit: int,
+            include_deleted: bool
+    ) -> Tuple[List[CommentInteraction], Optional[Cursor]]:
+        if order not in THREAD_ORDERS:
+            raise ValueError(f"Geçersiz sıralama: {order}")
+        if thread is None or limit <= 0:
+            return [], None
+        entries = thread.ordered[order]
+        start = 0
+        if cursor is not None:
+            start = bisect.bisect_right(entries, tuple(cursor), key=_cursor_key)
+        page: List[Entry] = []
+        next_cursor = None
+        for pos in range(start, len(entries)):
+            entry = entries[pos]
+            if not include_deleted and entry[2].status == "deleted":
+                continue
+            if len(page) == limit:
+                next_cursor = (page[-1][0], page[-1][1])
+                break
+            page.append(entry)
+        return [entry[2] for entry in page], next_cursor
+
+    def replies_page(
+            self,
+            comment_id: str,
+            order: str = "oldest",
+            cursor: Optional[Cursor] = None,
+            limit: int = 20,
+            include_deleted: bool = False
+    ) -> Dict[str, Any]:
+        comments, next_cursor = self._page(self._children.get(comment_id), order, cursor, limit, include_deleted)
+        return {"items": [c.to_dict() for c in comments], "next_cursor": next_cursor}
+
+#Video yorum bölümü: kök yorumlar sayfalanır, her birinin ilk yanıtları derinlik sınırıyla eklenir
+    def thread_page(
+            self,
+            video_id: str,
+            order: str = "score",
+            cursor: Optional[Cursor] = None,
+            limit: int = 20,
+            replies_per_thread: int = 3,
+            depth: int = 2,
+            include_deleted: bool = False
+    ) -> Dict[str, Any]:
+        roots, next_cursor = self._page(self._roots.get(video_id), order, cursor, limit, include_deleted)
+        return {
+            "items": [self._render(c, replies_per_thread, depth, include_deleted) for c in roots],
+            "next_cursor": next_cursor,
+        }
+
+    def _render(self, comment: CommentInteraction, replies: int, depth: int, include_deleted: bool) -> Dict[str, Any]:
+        data = comment.to_dict()
+        children = self._children.get(comment.interaction_id)
+        if depth <= 0 or not children:
+            data["replies"] = []
+            data["more_replies"] = comment.reply_count if children else 0
+            return data
+        shown, _ = self._page(children, "oldest", None, replies, include_deleted)
+        data["replies"] = [self._render(c, replies, depth - 1, include_deleted) for c in shown]
+        data["more_replies"] = max(0, self.reply_count(comment.interaction_id) - len(shown))
+        return data
+
+    def __str__(self) -> str:
+        return f"CommentThreadIndex(comments={len(self._seq)}, videos={len(self._roots)})"
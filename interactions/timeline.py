@@ -0,0 +1,111 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+
+from interactions.base import InteractionBase
+
+#Interactionları oluşturulma zamanına göre sıralı tutan indeks
+class TimeIndex:
+    def __init__(self):
+        self._ts: List[float] = []
+        self._items: List[Optional[InteractionBase]] = []
+        #Silinen kayıtlar purge() çağrılana kadar yerinde None olarak kalır
+        self._dead_ts: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._ts) - len(self._dead_ts)
+
+#Ekleme (çoğu kayıt zaman sırasıyla gelir, sona ekleme hızlı yol)
+    def add(self, interaction: InteractionBase) -> None:
+        self._insert(interaction.created_ts, interaction)
+
+    def _insert(self, ts: float, interaction: InteractionBase) -> None:
+        if not self._ts or ts >= self._ts[-1]:
+            self._ts.append(ts)
+            self._items.append(interaction)
+            return
+        pos = bisect_right(self._ts, ts)
+        self._ts.insert(pos, ts)
+        self._items.insert(pos, interaction)
+
+    def _find(self, interaction: InteractionBase, ts: float) -> int:
+        pos = bisect_left(self._ts, ts)
+        while pos < len(self._ts) and self._ts[pos] == ts:
+            if self._items[pos] is interaction:
+                return pos
+            pos += 1
+        return -1
+
+    def remove(self, interaction: InteractionBase, ts: Optional[float] = None) -> bool:
+        if ts is None:
+            ts = interaction.created_ts
+        pos = self._find(interaction, ts)
+        if pos < 0:
+            return False
+        self._items[pos] = None
+        insort(self._dead_ts, ts)
+        return True
+
+#Silinen kayıtları listelerden fiziksel olarak atma
+    def purge(self) -> int:
+        removed = len(self._dead_ts)
+        if removed:
+            kept = [(t, i) for t, i in zip(self._ts, self._items) if i is not None]
+            self._ts = [t for t, _ in kept]
+            self._items = [i for _, i in kept]
+            self._dead_ts.clear()
+        return removed
+
+#Interaction zamanı değişirse yeniden konumlandırma
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if field != "created_at":
+            return
+        pos = self._find(interaction, old)
+        if pos >= 0:
+            del self._ts[pos]
+            del self._items[pos]
+            self._insert(new, interaction)
+
+    def clear(self) -> None:
+        self._ts.clear()
+        self._items.clear()
+        self._dead_ts.clear()
+
+#Sorgular (ikili arama)
+    def _rank(self, ts: float) -> int:
+        #ts'den önceki canlı kayıt sayısı
+        return bisect_left(self._ts, ts) - bisect_left(self._dead_ts, ts)
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        return self._rank(end.timestamp()) - self._rank(start.timestamp())
+
+    def count_since(self, since: datetime) -> int:
+        return len(self) - self._rank(since.timestamp())
+
+    def items_since(self, since: datetime) -> List[InteractionBase]:
+        start = bisect_left(self._ts, since.timestamp())
+        return [i for i in self._items[start:] if i is not None]
+
+    def oldest(self, limit: int) -> List[InteractionBase]:
+        result: List[InteractionBase] = []
+        for i in self._items:
+            if len(result) >= limit:
+                break
+            if i is not None:
+                result.append(i)
+        return result
+
+    def daily_counts(self, days: int, now: datetime) -> Dict[str, int]:
+        #Günlük sayılar gün sınırlarında (yerel gece yarıları) arama ile bulunur
+        today = datetime(now.year, now.month, now.day)
+        result: Dict[str, int] = {}
+        end = self._rank((today + timedelta(days=1)).timestamp())
+        for d in range(days):
+            day = today - timedelta(days=d)
+            start = self._rank(day.timestamp())
+            result[day.strftime("%Y-%m-%d")] = end - start
+            end = start
+        return result
+
+    def __str__(self) -> str:
+        return f"TimeIndex(total={len(self._ts)})"
@@ -0,0 +1,224 @@
+import heapq
+import math
+from datetime import datetime, timedelta
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
+
+from interactions.base import InteractionBase
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+#Olay ağırlıkları (olay türü -> puan)
+TRENDING_WEIGHTS: Dict[str, float] = {
+    "like": 1.0,
+    "dislike": 0.5,
+    "comment": 2.0,
+    "reply": 1.0,
+    "subscribe": 1.0,
+    "unsubscribe": -1.0,
+}
+
+#Üs bu sınırı aşınca referans zaman öne alınır (float taşmasını önler)
+MAX_EXPONENT = 600.0
+
+#İleri bozunmalı puan tablosu
+#Her olay w * exp(λ (t - t0)) olarak eklenir; şu anki puan bu toplamın exp(-λ (now - t0)) katıdır.
+#Çarpan tüm anahtarlar için aynı olduğundan sıralama zamanla değişmez: olay başına O(1)
+#güncelleme yapılır ve tembel silmeli heap'ten ilk N okunur.
+class _DecayedScores:
+    __slots__ = ("_scores", "_events", "_seq", "_heap", "_next_seq")
+
+    def __init__(self):
+        self._scores: Dict[str, float] = {}
+        #anahtar -> katkı sayısı; sıfıra inen anahtar kayan nokta artığı bırakmadan silinir
+        self._events: Dict[str, int] = {}
+        self._seq: Dict[str, int] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def add(self, key: str, amount: float, events: int = 1) -> None:
+        remaining = self._events.get(key, 0) + events
+        if remaining <= 0:
+            self._events.pop(key, None)
+            self._scores.pop(key, None)
+            self._seq.pop(key, None)
+            return
+        self._events[key] = remaining
+        score = self._scores.get(key, 0.0) + amount
+        self._scores[key] = score
+        seq = self._seq.get(key)
+        if seq is None:
+            seq = self._seq[key] = self._next_seq
+            self._next_seq += 1
+        heapq.heappush(self._heap, (-score, seq, key))
+        if len(self._heap) > 2 * len(self._scores) + 64:
+            self._compact()
+
+    def get(self, key: str) -> float:
+        return self._scores.get(key, 0.0)
+
+    def _compact(self) -> None:
+        scores = self._scores
+        self._heap = [entry for entry in self._heap if scores.get(entry[2]) == -entry[0]]
+        heapq.heapify(self._heap)
+
+    def rescale(self, factor: float) -> None:
+        self._scores = {key: score * factor for key, score in self._scores.items()}
+        self._heap = [(-score, self._seq[key], key) for key, score in self._scores.items()]
+        heapq.heapify(self._heap)
+
+#İlk N anahtar: geçerli girişler çekilir ve geri konur (O(N log n))
+    def top(self, limit: int) -> List[Tuple[str, float]]:
+        heap = self._heap
+        scores = self._scores
+        taken: List[Tuple[float, int, str]] = []
+        seen = set()
+        while heap and len(taken) < limit:
+            entry = heapq.heappop(heap)
+            key = entry[2]
+            if scores.get(key) != -entry[0] or key in seen:
+                continue
+            seen.add(key)
+            taken.append(entry)
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        return [(entry[2], -entry[0]) for entry in taken]
+
+    def clear(self) -> None:
+        self._scores.clear()
+        self._events.clear()
+        self._seq.clear()
+        self._heap.clear()
+        self._next_seq = 0
+
+#Zamanla bozunan trend puanları: videolar (beğeni, beğenmeme, yorum, yanıt) ve kanallar (abonelik)
+#Puan yarılanma süresi kadar eski olayların ağırlığı yarıya iner. Olay zamanı created_at'tir;
+#silinen veya türü değişen kayıtların katkısı kendi zamanıyla geri alınır.
+#Manager'a attach() ile bağlanır.
+class TrendingEngine:
+    def __init__(
+            self,
+            half_life: timedelta = timedelta(hours=6),
+            weights: Optional[Dict[str, float]] = None,
+            clock: Optional[Callable[[], datetime]] = None
+    ):
+        if half_life.total_seconds() <= 0:
+            raise ValueError("Yarılanma süresi pozitif olmalıdır.")
+        self.half_life = half_life
+        self.weights = dict(TRENDING_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+        self.clock = clock or datetime.now
+        self._rate = math.log(2) / half_life.total_seconds()
+        self._t0: float | None = None
+        self.videos = _DecayedScores()
+        self.channels = _DecayedScores()
+        #id(interaction) -> (tablo, anahtar, ağırlık, zaman); geri almak için
+        self._contrib: Dict[int, Tuple[_DecayedScores, str, float, float]] = {}
+
+    @classmethod
+    def from_interactions(cls, interactions: Iterable[InteractionBase], **kwargs) -> "TrendingEngine":
+        engine = cls(**kwargs)
+        for i in interactions:
+            engine.add(i)
+        return engine
+
+    def __len__(self) -> int:
+        return len(self._contrib)
+
+#Olay sınıflandırma: (tablo, anahtar, olay türü) veya None
+    def _event(self, interaction: InteractionBase) -> Tuple[_DecayedScores, str, str] | None:
+        if interaction.status == "deleted":
+            return None
+        if isinstance(interaction, LikeInteraction):
+            if interaction.target_type != "video":
+                return None
+            return self.videos, interaction.target_id, interaction.like_type
+        if isinstance(interaction, CommentInteraction):
+            kind = "comment" if interaction.parent_comment_id is None else "reply"
+            return self.videos, interaction.video_id, kind
+        if isinstance(interaction, SubscriptionInteraction):
+            return self.channels, interaction.channel_id, interaction.action_type
+        return None
+
+    def _amount(self, weight: float, ts: float) -> float:
+        if self._t0 is None:
+            self._t0 = ts
+        exponent = self._rate * (ts - self._t0)
+        if exponent > MAX_EXPONENT:
+            self._rebase(ts)
+            exponent = 0.0
+        return weight * math.exp(exponent)
+
+    def _rebase(self, ts: float) -> None:
+        factor = math.exp(-self._rate * (ts - self._t0))
+        self._t0 = ts
+        self.videos.rescale(factor)
+        self.channels.rescale(factor)
+
+    def _apply(self, interaction: InteractionBase) -> None:
+        event = self._event(interaction)
+        if event is None:
+            return
+        table, key, kind = event
+        weight = self.weights.get(kind, 0.0)
+        if not weight:
+            return
+        ts = interaction.created_ts
+        self._contrib[id(interaction)] = (table, key, weight, ts)
+        table.add(key, self._amount(weight, ts))
+
+    def _revert(self, interaction: InteractionBase) -> None:
+        contrib = self._contrib.pop(id(interaction), None)
+        if contrib is None:
+            return
+        table, key, weight, ts = contrib
+        table.add(key, -self._amount(weight, ts), -1)
+
+#Manager olayları (attach ile bağlanır)
+    def add(self, interaction: InteractionBase) -> None:
+        self._apply(interaction)
+
+    def update(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if field == "status" and (old == "deleted") == (new == "deleted"):
+            return
+        if field in ("status", "like_type", "target_type", "action_type", "created_at"):
+            self._revert(interaction)
+            self._apply(interaction)
+
+    def remove(self, interaction: InteractionBase) -> None:
+        self._revert(interaction)
+
+    def clear(self) -> None:
+        self._t0 = None
+        self.videos.clear()
+        self.channels.clear()
+        self._contrib.clear()
+
+#Sorgular: puanlar şu anki zamana indirgenir
+    def _decay(self) -> float:
+        if self._t0 is None:
+            return 0.0
+        #Saat olaylardan gerideyse çarpan taşmasın diye üs sınırlanır
+        exponent = -self._rate * (self.clock().timestamp() - self._t0)
+        return math.exp(min(exponent, MAX_EXPONENT))
+
+    def video_score(self, video_id: str) -> float:
+        return self.videos.get(video_id) * self._decay()
+
+    def channel_score(self, channel_id: str) -> float:
+        return self.channels.get(channel_id) * self._decay()
+
+    def top_videos(self, limit: int = 10) -> List[Tuple[str, float]]:
+        decay = self._decay()
+        return [(key, score * decay) for key, score in self.videos.top(limit)]
+
+    def top_channels(self, limit: int = 10) -> List[Tuple[str, float]]:
+        decay = self._decay()
+        return [(key, score * decay) for key, score in self.channels.top(limit)]
+
+    def __str__(self) -> str:
+        return f"TrendingEngine(videos={len(self.videos)}, channels={len(self.channels)})"
@@ -1,39 +1,500 @@
-from typing import List, Dict, Any, Type
+import sys
+import time
+from collections import defaultdict
+from typing import List, Dict, Any, Type, Tuple, Iterator, TextIO, Iterable
 from interactions.base import  InteractionBase
 from interactions.comment import CommentInteraction
 from interactions.like import LikeInteraction
 from interactions.subscription import SubscriptionInteraction
+from interactions.table import InteractionTable
+from interactions.timeline import TimeIndex
+from interactions.search import CommentSearchIndex
+from interactions.subscribers import SubscriberTable
+from interactions.spam import SpamScorer
+from interactions import export
+from interactions import ingest
 
 #Tüm interaction nesnelerini yöneten sınıf
 class InteractionManager:
-    def __init__(self):
+    def __init__(self, columnar: bool = False, text_index: bool = False, subscriber_table: bool = False):
         self.interactions: List[InteractionBase] = []
 
+        #Opsiyonel kolon bazlı kopya (numpy ile vektörel raporlar için)
+        self.table: InteractionTable | None = InteractionTable() if columnar else None
+        #Opsiyonel yorum arama indeksi
+        self.search_index: CommentSearchIndex | None = CommentSearchIndex() if text_index else None
+
+        #İkincil indeksler (liste sırası korunur)
+        self._by_id: Dict[str, InteractionBase] = {}
+        self._by_user: Dict[str, List[InteractionBase]] = defaultdict(list)
+        self._by_type: Dict[type, List[InteractionBase]] = defaultdict(list)
+        self._comments_by_video: Dict[str, List[CommentInteraction]] = defaultdict(list)
+        self._likes_by_target: Dict[Tuple[str, str], List[LikeInteraction]] = defaultdict(list)
+        self._subs_by_channel: Dict[str, List[SubscriptionInteraction]] = defaultdict(list)
+        self.timeline = TimeIndex()
+
+        #Canlı sayaçlar (her değişiklikte güncellenir)
+        self._type_counts: Dict[str, int] = {}
+        self._status_counts: Dict[str, int] = defaultdict(int)
+        self._like_type_counts: Dict[str, int] = defaultdict(int)
+        self._action_type_counts: Dict[str, int] = defaultdict(int)
+        self._listener = self._on_interaction_changed
+
+        #Dışarıdan bağlanan bileşenler (add / update / clear metotları olan)
+        self._attached: List[Any] = []
+        #Opsiyonel güncel abonelik tablosu (kullanıcı-kanal başına son durum)
+        self.subscribers: SubscriberTable | None = None
+        if subscriber_table:
+            self.subscribers = SubscriberTable()
+            self.attach(self.subscribers)
+
+        #Vacuum durumu: taranan konum ve tür listelerindeki karşılık gelen konum
+        self._vacuum_cursor = 0
+        self._vacuum_type_pos: Dict[type, int] = {}
+        #Birden fazla eklenen id'ler (id -> fazla kopya sayısı)
+        self._duplicate_ids: Dict[str, int] = {}
+        #Toplu eklemelerin spam kuralı istatistikleri (parti raporlarının toplamı)
+        self.spam_scorer = SpamScorer()
+
 #Yeni interaction ekleme
     def add_interaction(self, interaction: InteractionBase) -> None:
-        self.interactions.append(interaction)
+        self._add_many([interaction])
+
+#Toplu ekleme: ham kayıtlar partiler halinde doğrulanır ve tek adımda eklenir
+    def add_interactions(
+            self,
+            records: Iterable[Any],
+            batch_size: int = 50000,
+            workers: int | None = None,
+            parallel_threshold: int = 20000
+    ) -> List[Dict[str, Any]]:
+        if workers is None:
+            workers = ingest.default_workers()
+        reports: List[Dict[str, Any]] = []
+        offset = 0
+        pool = None
+        try:
+            for batch in ingest.batches(records, batch_size):
+                prepared = None
+                scorer = SpamScorer(self.spam_scorer.rules)
+                if workers > 1 and len(batch) >= parallel_threshold:
+                    if pool is None:
+                        pool = ingest.ProcessPoolExecutor(max_workers=workers)
+                    prepared = ingest.check_batch(batch, pool, workers, scorer)
+                reports.append(self.commit_batch(batch, prepared, offset, scorer))
+                offset += len(batch)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return reports
+
+#Tek partiyi doğrulayıp ekleme
+#prepared: işçilerde dönüştürülüp kontrol edilmiş (nesne, geçerli mi, spam mı) kayıtları
+#scorer: partinin spam puanlayıcısı; istatistikleri raporda döner ve spam_scorer'a eklenir
+    def commit_batch(
+            self,
+            batch: List[Any],
+            prepared: List[Tuple[InteractionBase | None, bool, bool]] | None = None,
+            offset: int = 0,
+            scorer: SpamScorer | None = None
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        if scorer is None:
+            scorer = SpamScorer(self.spam_scorer.rules)
+        accepted: List[InteractionBase] = []
+        rejected: List[int] = []
+        flagged: List[str] = []
+        converted: List[Tuple[int, InteractionBase]] = []
+        if prepared is None:
+            for pos, record in enumerate(batch):
+                try:
+                    converted.append((pos, ingest.record_to_interaction(record)))
+                except (ValueError, KeyError, TypeError):
+                    rejected.append(offset + pos)
+            #Spam kuralları tüm partideki yorumlara tek seferde uygulanır
+            checked = ingest.check_interactions([i for _, i in converted], scorer)
+        else:
+            checked = []
+            for pos, (i, valid, spam) in enumerate(prepared):
+                if i is None:
+                    rejected.append(offset + pos)
+                    continue
+                converted.append((pos, i))
+                checked.append((valid, spam))
+
+        for (pos, i), (valid, spam) in zip(converted, checked):
+            ingest.apply_verdict(i, valid, spam)
+            if not valid:
+                rejected.append(offset + pos)
+                continue
+            if spam:
+                flagged.append(i.interaction_id)
+            accepted.append(i)
+        rejected.sort()
+
+        self._add_many(accepted)
+        spam = scorer.stats()
+        self.spam_scorer.merge_stats(spam)
+        elapsed = time.perf_counter() - started
+        return {
+            "rows": len(batch),
+            "accepted": len(accepted),
+            "rejected": rejected,
+            "flagged": flagged,
+            "spam": spam,
+            "seconds": elapsed,
+            "rows_per_second": len(batch) / elapsed if elapsed > 0 else 0.0,
+        }
+
+#Kayıtlar listeye, indekslere ve bileşenlere eklenir; bir bileşen hata verirse parti
+#bütünüyle geri alınır (liste, indeksler, sayaçlar ve bileşenlerin remove metodu) ve hata yükseltilir.
+    def _add_many(self, items: List[InteractionBase]) -> None:
+        start = len(self.interactions)
+        self.interactions.extend(items)
+        table = self.table
+        listener = self._listener
+        applied = 0
+        #Son kaydı ekleyebilmiş bileşen sayısı
+        accepted = 0
+        try:
+            for i in items:
+                self._index(i)
+                self._count(i)
+                if table is not None:
+                    table.append(i)
+                #Gözlemci önce bağlanır; bileşenlerin ekleme sırasında yaptığı değişiklikler (ör. bayrak) de izlenir
+                i.add_observer(listener)
+                applied += 1
+                accepted = 0
+                for component in self._attached:
+                    component.add(i)
+                    accepted += 1
+        except Exception:
+            self._rollback(start, items[:applied], accepted)
+            raise
+
+    def _rollback(self, start: int, applied: List[InteractionBase], accepted: int) -> None:
+        #Liste önce kısaltılır; tekrarlanan id'ler geri alınan kayıtlara devredilmez
+        del self.interactions[start:]
+        per_type: Dict[type, int] = defaultdict(int)
+        for i in applied:
+            per_type[type(i)] += 1
+        for cls, count in per_type.items():
+            bucket = self._by_type[cls]
+            del bucket[len(bucket) - count:]
+            if not bucket:
+                del self._by_type[cls]
+        if applied:
+            #Hata veren kayıt yalnızca onu eklemiş bileşenlerden çıkarılır
+            self._drop(applied[:-1])
+            self._drop(applied[-1:], self._attached[:accepted])
+
+#Bileşen bağlama (ör. kalıcı depolama)
+    def attach(self, component: Any) -> None:
+        self._attached.append(component)
+
+    def detach(self, component: Any) -> None:
+        if component in self._attached:
+            self._attached.remove(component)
+
+#Sayaç güncelleme
+    def _count(self, interaction: InteractionBase) -> None:
+        name = interaction.get_class_name()
+        self._type_counts[name] = self._type_counts.get(name, 0) + 1
+        self._status_counts[interaction.status] += 1
+
+        if isinstance(interaction, LikeInteraction):
+            self._like_type_counts[interaction.like_type] += 1
+        elif isinstance(interaction, SubscriptionInteraction):
+            self._action_type_counts[interaction.action_type] += 1
+
+#Interaction üzerindeki değişiklikleri dinleme
+    def _on_interaction_changed(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        self._count_change(field, old, new)
+        self._apply_change(interaction, field, old, new)
+
+    def _count_change(self, field: str, old: Any, new: Any) -> None:
+        if field == "status":
+            self._status_counts[old] -= 1
+            self._status_counts[new] += 1
+        elif field == "like_type":
+            self._like_type_counts[old] -= 1
+            self._like_type_counts[new] += 1
+        elif field == "action_type":
+            self._action_type_counts[old] -= 1
+            self._action_type_counts[new] += 1
+
+#Değişikliği indekslere, kolon tablosuna ve bağlı bileşenlere yayma
+    def _apply_change(self, interaction: InteractionBase, field: str, old: Any, new: Any) -> None:
+        if field == "target_type":
+            self._move_target(interaction, old)
+        elif field == "created_at":
+            self.timeline.update(interaction, field, old, new)
+        elif field == "comment_text" and self.search_index is not None:
+            self.search_index.update(interaction, field, old, new)
+
+        if self.table is not None:
+            self.table.update(interaction, field, old, new)
+        for component in self._attached:
+            component.update(interaction, field, old, new)
+
+#Hedef türü değişen beğeniyi hedef kovaları arasında taşıma
+#Tür düzeltmesi seyrek olduğundan yeni kova ana liste sırası korunacak şekilde yeniden kurulur
+    def _move_target(self, interaction: LikeInteraction, old_type: str) -> None:
+        old_key = (old_type, interaction.target_id)
+        bucket = [x for x in self._likes_by_target.get(old_key, ()) if x is not interaction]
+        if bucket:
+            self._likes_by_target[old_key] = bucket
+        else:
+            self._likes_by_target.pop(old_key, None)
+        key = (interaction.target_type, interaction.target_id)
+        members = {id(x) for x in self._likes_by_target.get(key, ())}
+        members.add(id(interaction))
+        self._likes_by_target[key] = [x for x in self.interactions if id(x) in members]
+
+#İndeks güncelleme
+    def _index(self, interaction: InteractionBase) -> None:
+        #Aynı id birden fazla kez eklenirse ilk kayıt geçerli kalır
+        interaction_id = interaction.interaction_id
+        if interaction_id in self._by_id:
+            self._duplicate_ids[interaction_id] = self._duplicate_ids.get(interaction_id, 0) + 1
+        else:
+            self._by_id[interaction_id] = interaction
+        self._by_user[interaction.user_id].append(interaction)
+        self._by_type[type(interaction)].append(interaction)
+
+        if isinstance(interaction, CommentInteraction):
+            self._comments_by_video[interaction.video_id].append(interaction)
+            if self.search_index is not None:
+                self.search_index.add(interaction)
+        elif isinstance(interaction, LikeInteraction):
+            key = (interaction.target_type, interaction.target_id)
+            self._likes_by_target[key].append(interaction)
+        elif isinstance(interaction, SubscriptionInteraction):
+            self._subs_by_channel[interaction.channel_id].append(interaction)
+        self.timeline.add(interaction)
 
 #Interaction sileme
     def remove_interaction(self, interaction_id: str) -> bool:
-        for i in self.interactions:
-            if i.interaction_id == interaction_id:
-                i.mark_as_deleted()
-                return True
-        return False
+        i = self._by_id.get(interaction_id)
+        if i is None:
+            return False
+        i.mark_as_deleted()
+        return True
     
+#Vacuum: silinmiş ve saklama süresi dolmuş kayıtları fiziksel olarak atma
+    def vacuum(
+            self,
+            retention_seconds: float = 0.0,
+            max_items: int = 10000,
+            time_budget: float | None = None
+    ) -> Dict[str, Any]:
+        #Her çağrı listenin bir dilimini tarar; tam tur bitince done=True döner
+        started = time.perf_counter()
+        cutoff = time.time() - retention_seconds
+        start = self._vacuum_cursor
+        end = min(len(self.interactions), start + max_items)
+
+        kept: List[InteractionBase] = []
+        dropped: List[InteractionBase] = []
+        kept_by_type: Dict[type, List[InteractionBase]] = defaultdict(list)
+        scanned_by_type: Dict[type, int] = defaultdict(int)
+
+        pos = start
+        while pos < end:
+            i = self.interactions[pos]
+            pos += 1
+            cls = type(i)
+            scanned_by_type[cls] += 1
+            if i.is_deleted() and i.created_ts <= cutoff:
+                dropped.append(i)
+            else:
+                kept.append(i)
+                kept_by_type[cls].append(i)
+            if time_budget is not None and (pos - start) % 256 == 0:
+                if time.perf_counter() - started >= time_budget:
+                    break
+
+        #Tür listeleri ana liste ile aynı sırada olduğu için aynı dilim değiştirilir
+        self.interactions[start:pos] = kept
+        for cls, scanned in scanned_by_type.items():
+            type_pos = self._vacuum_type_pos.get(cls, 0)
+            cls_kept = kept_by_type.get(cls, [])
+            self._by_type[cls][type_pos:type_pos + scanned] = cls_kept
+            self._vacuum_type_pos[cls] = type_pos + len(cls_kept)
+        self._vacuum_cursor = start + len(kept)
+
+        reclaimed = sum(self._estimate_size(i) for i in dropped)
+        if dropped:
+            self._drop(dropped)
+
+        done = self._vacuum_cursor >= len(self.interactions)
+        if done:
+            self._finish_vacuum()
+        return {
+            "scanned": pos - start,
+            "removed": len(dropped),
+            "bytes": reclaimed,
+            "done": done,
+            "seconds": time.perf_counter() - started,
+        }
+
+    def vacuum_all(self, retention_seconds: float = 0.0, max_items: int = 10000) -> Dict[str, Any]:
+        total = {"scanned": 0, "removed": 0, "bytes": 0, "done": False, "seconds": 0.0}
+        #Yarım kalmış tur önce bitirilir, ardından tüm liste baştan taranır
+        passes = 2 if self._vacuum_cursor > 0 else 1
+        for _ in range(passes):
+            result = {"done": False}
+            while not result["done"]:
+                result = self.vacuum(retention_seconds, max_items)
+                for key in ("scanned", "removed", "bytes", "seconds"):
+                    total[key] += result[key]
+        total["done"] = True
+        return total
+
+#Verilen id'lere sahip silinmiş kayıtları tek seferde atma (log yeniden oynatma)
+    def purge(self, interaction_ids: Iterable[str]) -> int:
+        wanted: Dict[str, int] = defaultdict(int)
+        for interaction_id in interaction_ids:
+            wanted[interaction_id] += 1
+
+        kept: List[InteractionBase] = []
+        dropped: List[InteractionBase] = []
+        for i in self.interactions:
+            if wanted.get(i.interaction_id, 0) > 0 and i.is_deleted():
+                wanted[i.interaction_id] -= 1
+                dropped.append(i)
+            else:
+                kept.append(i)
+        if not dropped:
+            return 0
+
+        self.interactions[:] = kept
+        self._by_type.clear()
+        for i in kept:
+            self._by_type[type(i)].append(i)
+        self._drop(dropped)
+        self._finish_vacuum()
+        return len(dropped)
+
+    def _drop(self, dropped: List[InteractionBase], components: List[Any] | None = None) -> None:
+        #Ana liste ve tür listeleri dışındaki tüm türetilmiş yapılardan çıkarma
+        if components is None:
+            components = self._attached
+        dropped_ids = {id(i) for i in dropped}
+        user_keys = set()
+        video_keys = set()
+        target_keys = set()
+        channel_keys = set()
+
+        for i in dropped:
+            i.remove_observer(self._listener)
+            user_keys.add(i.user_id)
+            if isinstance(i, CommentInteraction):
+                video_keys.add(i.video_id)
+                if self.search_index is not None:
+                    self.search_index.remove(i)
+            elif isinstance(i, LikeInteraction):
+                target_keys.add((i.target_type, i.target_id))
+            elif isinstance(i, SubscriptionInteraction):
+                channel_keys.add(i.channel_id)
+
+            self._uncount(i)
+            self.timeline.remove(i)
+            if self.table is not None:
+                self.table.remove(i)
+            for component in components:
+                remove = getattr(component, "remove", None)
+                if remove is not None:
+                    remove(i)
+
+        for buckets, keys in (
+            (self._by_user, user_keys),
+            (self._comments_by_video, video_keys),
+            (self._likes_by_target, target_keys),
+            (self._subs_by_channel, channel_keys),
+        ):
+            for key in keys:
+                bucket = [x for x in buckets[key] if id(x) not in dropped_ids]
+                if bucket:
+                    buckets[key] = bucket
+                else:
+                    del buckets[key]
+
+        for i in dropped:
+            self._unindex_id(i)
+
+    def _unindex_id(self, interaction: InteractionBase) -> None:
+        interaction_id = interaction.interaction_id
+        duplicates = self._duplicate_ids.get(interaction_id, 0)
+        if duplicates:
+            if duplicates == 1:
+                del self._duplicate_ids[interaction_id]
+            else:
+                self._duplicate_ids[interaction_id] = duplicates - 1
+        if self._by_id.get(interaction_id) is not interaction:
+            return
+        del self._by_id[interaction_id]
+        if duplicates:
+            #Nadir durum: aynı id'li sonraki kayıt indekse alınır
+            for i in self.interactions:
+                if i.interaction_id == interaction_id and i is not interaction:
+                    self._by_id[interaction_id] = i
+                    break
+
+    def _uncount(self, interaction: InteractionBase) -> None:
+        name = interaction.get_class_name()
+        self._type_counts[name] -= 1
+        if self._type_counts[name] == 0:
+            del self._type_counts[name]
+        self._status_counts[interaction.status] -= 1
+
+        if isinstance(interaction, LikeInteraction):
+            self._like_type_counts[interaction.like_type] -= 1
+        elif isinstance(interaction, SubscriptionInteraction):
+            self._action_type_counts[interaction.action_type] -= 1
+
+    def _finish_vacuum(self) -> None:
+        self._vacuum_cursor = 0
+        self._vacuum_type_pos.clear()
+        self.timeline.purge()
+        if self.table is not None:
+            self.table.compact()
+
+    @staticmethod
+    def _estimate_size(interaction: InteractionBase) -> int:
+        size = sys.getsizeof(interaction)
+        if isinstance(interaction, CommentInteraction):
+            size += sys.getsizeof(interaction.comment_text)
+            if interaction._flags is not None:
+                size += sys.getsizeof(interaction._flags)
+        return size
+
 #ID ile interaction bulunması
     def get_by_id(self, interaction_id: str) -> InteractionBase | None:
-        for i in self.interactions:
-            if i.interaction_id == interaction_id:
-                return i
-        return None
+        return self._by_id.get(interaction_id)
+
+    #Aynı id'li tüm kayıtlar (ekleme sırasıyla); yalnızca tekrarlanan id'lerde liste taranır
+    def get_all_by_id(self, interaction_id: str) -> List[InteractionBase]:
+        first = self._by_id.get(interaction_id)
+        if first is None:
+            return []
+        if interaction_id not in self._duplicate_ids:
+            return [first]
+        return [i for i in self.interactions if i.interaction_id == interaction_id]
     
 #Kullanıcıya göre filtreleme
     def get_by_user(self, user_id: str) -> List[InteractionBase]:
-        return [i for i in self.interactions if i.user_id == user_id]
+        return list(self._by_user.get(user_id, []))
     
 #Türe göre filtreleme
     def get_by_type(self, interaction_type: Type[InteractionBase]) -> List[InteractionBase]:
+        matching = [t for t in self._by_type if issubclass(t, interaction_type)]
+        if len(matching) == len(self._by_type):
+            return list(self.interactions)
+        if len(matching) == 1:
+            return list(self._by_type[matching[0]])
+        #Birden fazla alt sınıf eşleşirse ekleme sırası için listeyi tara
         return [i for i in self.interactions if isinstance(i, interaction_type)]
     
 #Sadece aktif olanlarrı alma
@@ -46,11 +507,7 @@ class InteractionManager:
     
 #Türe göre sayı
     def count_by_type(self) -> Dict[str,int]:
-        result: Dict[str, int] = {}
-        for i in self.interactions:
-            name = i.get_class_name()
-            result[name] = result.get(name, 0) + 1
-        return result
+        return {name: count for name, count in self._type_counts.items() if count > 0}
     
 #Kullanıcı bazlı özet raporu
     def get_user_summary(self, user_id: str) -> Dict[str, Any]:
@@ -80,7 +537,30 @@ class InteractionManager:
     
 #Temizleme
     def clear_all(self) -> None:
+        for i in self.interactions:
+            i.remove_observer(self._listener)
         self.interactions.clear()
+        self._by_id.clear()
+        self._by_user.clear()
+        self._by_type.clear()
+        self._comments_by_video.clear()
+        self._likes_by_target.clear()
+        self._subs_by_channel.clear()
+        self.timeline.clear()
+        if self.search_index is not None:
+            self.search_index.clear()
+        for component in self._attached:
+            component.clear()
+        self._type_counts.clear()
+        self._status_counts.clear()
+        self._like_type_counts.clear()
+        self._action_type_counts.clear()
+        self._vacuum_cursor = 0
+        self._vacuum_type_pos.clear()
+        self._duplicate_ids.clear()
+        self.spam_scorer.reset()
+        if self.table is not None:
+            self.table.clear()
 
 #String gösterim
     def __str__(self) -> str:
@@ -91,10 +571,7 @@ class InteractionManager:
 
 #Yorum (comment) işlemi
     def get_comments_by_video(self, video_id: str) -> List[CommentInteraction]:
-        return [
-            c for c in self.get_comments()
-            if c.video_id == video_id
-        ]
+        return list(self._comments_by_video.get(video_id, []))
     
     def get_flagged_comments(self) -> List[CommentInteraction]:
         return [
@@ -110,24 +587,24 @@ class InteractionManager:
     
 #Like (beğenme) işlemi
     def count_likes(self) -> int:
-        return len([ l for l in self.get_likes() if l.is_like()])
+        return self._like_type_counts.get("like", 0)
     
     def count_dislikes(self) -> int:
-        return len([ l for l in self.get_likes() if l.is_dislike()])
+        return self._like_type_counts.get("dislike", 0)
     
     def get_video_likes(self, video_id: str) -> List[LikeInteraction]:
-        return [
-            l for l in self.get_likes()
-            if l.target_type == "video" and l.target_id == video_id
-        ]
+        return list(self._likes_by_target.get(("video", video_id), []))
     
     def get_comment_likes(self, comment_id: str) -> List[LikeInteraction]:
-        return [
-            l for l in self.get_likes()
-            if l.target_type == "comment" and l.target_id == comment_id
-        ]
+        return list(self._likes_by_target.get(("comment", comment_id), []))
     
 #Subscription (abonelik) işkemi
+    def count_subscriptions(self) -> int:
+        return self._action_type_counts.get("subscribe", 0)
+
+    def count_unsubscriptions(self) -> int:
+        return self._action_type_counts.get("unsubscribe", 0)
+
     def get_active_subscriptions(self) -> List[SubscriptionInteraction]:
         return [
             s for s in self.get_subscriptions()
@@ -135,20 +612,30 @@ class InteractionManager:
         ]
     
     def get_channel_subscribers(self, channel_id: str) -> List[SubscriptionInteraction]:
+        if self.subscribers is not None:
+            return list(self.subscribers.subscribers(channel_id))
         return [
-            s for s in self.get_subscriptions()
-            if s.channel_id == channel_id and s.is_subscribed()
+            s for s in self._subs_by_channel.get(channel_id, [])
+            if s.is_subscribed()
         ]
 
+    def count_channel_subscribers(self, channel_id: str) -> int:
+        if self.subscribers is not None:
+            return self.subscribers.subscriber_count(channel_id)
+        return len(self.get_channel_subscribers(channel_id))
+
 #Durum bazlı sayım
     def count_by_status(self) -> Dict[str, int]:
-        result = {"active": 0, "deleted": 0, "flagged": 0}
-        for i in self.interactions:
-            result[i.status] += 1
-        return result
+        #Bilinmeyen durumlar (ör. "inactive") sayılmaz
+        return {
+            status: self._status_counts.get(status, 0)
+            for status in ("active", "deleted", "flagged")
+        }
     
 #Arama
     def search_comments(self, keyword: str) -> List[CommentInteraction]:
+        if self.search_index is not None:
+            return self.search_index.search(keyword)
         keyword = keyword.lower()
         return [
             c for c in self.get_comments()
@@ -158,5 +645,34 @@ class InteractionManager:
 #Export etme
     def export_active(self) -> List[Dict[str, Any]]:
         return [i.to_dict() for i in self.get_active()]
+
+#Akış halinde export (bellek kullanımı sabit)
+    def iter_dicts(self, active_only: bool = False, columns: export.Columns = None) -> Iterator[Dict[str, Any]]:
+        items = self.interactions
+        if active_only:
+            items = (i for i in items if i.is_active())
+        return export.iter_dicts(items, columns)
+
+    def export_to(
+            self,
+            fh: TextIO,
+            fmt: str = "ndjson",
+            active_only: bool = False,
+            columns: export.Columns = None
+    ) -> int:
+        items = self.interactions
+        if active_only:
+            items = (i for i in items if i.is_active())
+        return export.write_export(items, fh, fmt, columns)
+
+    def export_to_file(
+            self,
+            path: str,
+            fmt: str = "ndjson",
+            active_only: bool = False,
+            columns: export.Columns = None
+    ) -> int:
+        with export.open_export(path) as fh:
+            return self.export_to(fh, fmt, active_only, columns)
     
         
\ No newline at end of file
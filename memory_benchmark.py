@@ -0,0 +1,141 @@
+import gc
+import sys
+import tracemalloc
+from datetime import datetime
+
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+#Interaction başına bellek kullanımını ölçen basit benchmark
+#"önce" sütunu __slots__ öncesi düzeni (__dict__, datetime, metin durum alanları, her yorumda
+#boş bayrak listesi, intern edilmemiş id'ler) aynı alanlarla taklit eder.
+#Kullanım: python memory_benchmark.py [adet]
+
+USER_POOL = 5000
+VIDEO_POOL = 1000
+CHANNEL_POOL = 200
+
+
+def build_comments(count: int) -> list:
+    #Id'ler her kayıtta yeniden üretilir (ör. JSON/CSV okurken olduğu gibi)
+    return [
+        CommentInteraction(
+            f"c{n}",
+            f"user_{n % USER_POOL}",
+            f"video_{n % VIDEO_POOL}",
+            f"Yorum metni {n % 97}"
+        )
+        for n in range(count)
+    ]
+
+
+def build_likes(count: int) -> list:
+    return [
+        LikeInteraction(
+            f"l{n}",
+            f"user_{n % USER_POOL}",
+            f"video_{n % VIDEO_POOL}",
+            "video",
+            "like" if n % 3 else "dislike"
+        )
+        for n in range(count)
+    ]
+
+
+def build_subscriptions(count: int) -> list:
+    return [
+        SubscriptionInteraction(
+            f"s{n}",
+            f"user_{n % USER_POOL}",
+            f"channel_{n % CHANNEL_POOL}"
+        )
+        for n in range(count)
+    ]
+
+
+#__slots__ öncesi düzen: alanlar nesne sözlüğünde tutulur
+class DictInteraction:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def legacy_fields(interaction_id: str, user_id: str) -> dict:
+    return {
+        "interaction_id": interaction_id,
+        "user_id": user_id,
+        "created_at": datetime.now(),
+        "status": "active",
+    }
+
+
+def build_legacy_comments(count: int) -> list:
+    return [
+        DictInteraction(
+            **legacy_fields(f"c{n}", f"user_{n % USER_POOL}"),
+            video_id=f"video_{n % VIDEO_POOL}",
+            comment_text=f"Yorum metni {n % 97}",
+            parent_comment_id=None,
+            like_count=0,
+            dislike_count=0,
+            reply_count=0,
+            is_edited=False,
+            is_pinned=False,
+            flags=[]
+        )
+        for n in range(count)
+    ]
+
+
+def build_legacy_likes(count: int) -> list:
+    return [
+        DictInteraction(
+            **legacy_fields(f"l{n}", f"user_{n % USER_POOL}"),
+            target_id=f"video_{n % VIDEO_POOL}",
+            target_type="video",
+            like_type="like" if n % 3 else "dislike"
+        )
+        for n in range(count)
+    ]
+
+
+def build_legacy_subscriptions(count: int) -> list:
+    return [
+        DictInteraction(
+            **legacy_fields(f"s{n}", f"user_{n % USER_POOL}"),
+            channel_id=f"channel_{n % CHANNEL_POOL}",
+            action_type="subscribe",
+            notification_level="all",
+            tier="free"
+        )
+        for n in range(count)
+    ]
+
+
+def measure(builder, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = builder(count)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def run_benchmark(count: int = 100_000) -> None:
+    print(f" === BELLEK BENCHMARK ({count} adet / tür, byte / interaction) ===")
+    for name, legacy, builder in [
+        ("CommentInteraction", build_legacy_comments, build_comments),
+        ("LikeInteraction", build_legacy_likes, build_likes),
+        ("SubscriptionInteraction", build_legacy_subscriptions, build_subscriptions),
+    ]:
+        before = measure(legacy, count)
+        after = measure(builder, count)
+        saving = (1 - after / before) * 100
+        print(f" {name}: önce {before:.1f}, sonra {after:.1f} (%{saving:.0f} tasarruf)")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
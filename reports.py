@@ -1,19 +1,63 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterator, TextIO
 from datetime import datetime, timedelta
 
 from interactions.base import InteractionBase
+from interactions.table import InteractionTable
+from interactions.timeline import TimeIndex
+from interactions.search import CommentSearchIndex
+from interactions.reactions import ReactionStore
+from interactions.subscribers import SubscriberTable
+from interactions.leaderboard import CommentLeaderboard
+from interactions.trending import TrendingEngine
+from interactions import export
 from interactions.comment import CommentInteraction
 from interactions.like import LikeInteraction
 from interactions.subscription import SubscriptionInteraction
 
 
 class InteractionReport:
-    def __init__(self, interactions: List[InteractionBase]):
+    def __init__(
+            self,
+            interactions: List[InteractionBase],
+            table: Optional[InteractionTable] = None,
+            timeline: Optional[TimeIndex] = None,
+            clock: Optional[Callable[[], datetime]] = None,
+            search_index: Optional[CommentSearchIndex] = None,
+            reactions: Optional[ReactionStore] = None,
+            subscribers: Optional[SubscriberTable] = None,
+            leaderboard: Optional[CommentLeaderboard] = None,
+            trending: Optional[TrendingEngine] = None
+    ):
         self.interactions = interactions
-        self.generated_at = datetime.now()
+        #Kolon tablosu verilirse sayımlar vektörel yapılır
+        self.table = table
+        #Zaman indeksi verilirse zaman pencereleri ikili arama ile sayılır
+        self.timeline = timeline
+        #Tüm zaman sorguları için tek saat kaynağı
+        self.clock = clock or datetime.now
+        #Arama indeksi verilirse metin sorguları indeksten yapılır
+        self.search_index = search_index
+        #Tepki deposu verilirse hedef başına sayımlar tekil tepkilerden okunur
+        self.reactions = reactions
+        #Abonelik tablosu verilirse kanal başına aboneler güncel durumdan okunur
+        self.subscribers = subscribers
+        #Sıralama tablosu verilirse en iyi / en uzun / en kısa yorumlar sıralanmadan okunur
+        self.leaderboard = leaderboard
+        #Trend motoru verilirse güncel trendler bakımı yapılan sıralamadan okunur
+        self.trending = trending
+        self.generated_at = self.clock()
 
 #Genel rapor
     def general_overview(self) -> Dict[str, Any]:
+        if self.table is not None:
+            by_status = self.table.count_by_status()
+            return {
+                "generated_at": self.generated_at.isoformat(),
+                "total_interactions": len(self.interactions),
+                "active": by_status["active"],
+                "deleted": by_status["deleted"],
+                "flagged": by_status["flagged"],
+            }
         return {
             "generated_at": self.generated_at.isoformat(),
             "total_interactions": len(self.interactions),
@@ -27,6 +71,14 @@ class InteractionReport:
     
 #Comment (yorum) raporu
     def comment_overview(self) -> Dict[str, Any]:
+        if self.table is not None:
+            return {
+                "total": self.table.total_comments(),
+                "flagged": self.table.flagged_comments(),
+                "popular": self.table.popular_comments(),
+                "average_length": self.table.average_comment_length(),
+                "average_score": self.table.average_comment_score(),
+            }
         comments = self._get_comments()
 
         return {
@@ -53,18 +105,35 @@ class InteractionReport:
         return total / len(comments)
 
     def top_comments(self, limit: int = 5) -> List[Dict[str, Any]]:
+        if self.leaderboard is not None:
+            return [c.to_dict() for c in self.leaderboard.top("score", limit)]
         comments = sorted(
             self._get_comments(),
             key=lambda c: c.calculate_score(),
             reverse=True
         )
         return [c.to_dict() for c in comments[:limit]]
+
+    def top_comments_for_video(self, video_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        if self.leaderboard is not None:
+            return [c.to_dict() for c in self.leaderboard.top("score", limit, video_id)]
+        comments = sorted(
+            [c for c in self._get_comments() if c.video_id == video_id],
+            key=lambda c: c.calculate_score(),
+            reverse=True
+        )
+        return [c.to_dict() for c in comments[:limit]]
     
 #Like (beğeni) raporu
     def like_overview(self) -> Dict[str, Any]:
-        likes = self._get_likes()
-        like_count = len([l for l in likes if l.is_like()])
-        dislike_count = len([l for l in likes if l.is_dislike()])
+        if self.table is not None:
+            counts = self.table.count_like_types()
+            like_count = counts["like"]
+            dislike_count = counts["dislike"]
+        else:
+            likes = self._get_likes()
+            like_count = len([l for l in likes if l.is_like()])
+            dislike_count = len([l for l in likes if l.is_dislike()])
 
         total = like_count + dislike_count
         ratio = (like_count / total * 100) if total > 0 else 0.0
@@ -79,6 +148,10 @@ class InteractionReport:
         return [i for i in self.interactions if isinstance(i, LikeInteraction)]
 
     def likes_by_target(self, target_type: str) -> Dict[str, int]:
+        if self.reactions is not None:
+            return self.reactions.likes_by_target(target_type)
+        if self.table is not None:
+            return self.table.likes_by_target(target_type)
         result: Dict[str, int] = {}
 
         for l in self._get_likes():
@@ -106,6 +179,8 @@ class InteractionReport:
         ]
 
     def subscribers_by_channel(self) -> Dict[str, int]:
+        if self.subscribers is not None:
+            return self.subscribers.subscribers_by_channel()
         result: Dict[str, int] = {}
 
         for s in self._get_subscriptions():
@@ -144,6 +219,12 @@ class InteractionReport:
 
     def export_raw(self) -> List[Dict[str, Any]]:
         return [i.to_dict() for i in self.interactions]
+
+    def iter_raw(self, columns: export.Columns = None) -> Iterator[Dict[str, Any]]:
+        return export.iter_dicts(self.interactions, columns)
+
+    def export_raw_to(self, fh: TextIO, fmt: str = "ndjson", columns: export.Columns = None) -> int:
+        return export.write_export(self.interactions, fh, fmt, columns)
     
 #String
     def __str__(self) -> str:
@@ -151,16 +232,26 @@ class InteractionReport:
     
 #Zaman bazlı analiz
     def interactions_last_hours(self, hours: int) -> int:
-        limit = datetime.now() - timedelta(hours=hours)
-        return len([i for i in self.interactions if i.created_at >= limit])
+        return self._count_since(self.clock() - timedelta(hours=hours))
 
     def interactions_last_days(self, days: int) -> int:
-        limit = datetime.now() - timedelta(days=days)
-        return len([i for i in self.interactions if i.created_at >= limit])
+        return self._count_since(self.clock() - timedelta(days=days))
+
+    def _count_since(self, limit: datetime) -> int:
+        if self.timeline is not None:
+            return self.timeline.count_since(limit)
+        if self.table is not None:
+            return self.table.count_since(limit)
+        since = limit.timestamp()
+        return len([i for i in self.interactions if i.created_ts >= since])
 
     def daily_activity_map(self, days: int = 7) -> Dict[str, int]:
+        now = self.clock()
+        if self.timeline is not None:
+            return self.timeline.daily_counts(days, now)
+        if self.table is not None:
+            return self.table.daily_activity_map(days, now)
         result: Dict[str, int] = {}
-        now = datetime.now()
 
         for d in range(days):
             day = (now - timedelta(days=d)).strftime("%Y-%m-%d")
@@ -175,19 +266,45 @@ class InteractionReport:
 
 #Video - kanal raporları
     def comments_by_video(self) -> Dict[str, int]:
+        if self.table is not None:
+            return self.table.comments_by_video()
         result: Dict[str, int] = {}
         for c in self._get_comments():
             result[c.video_id] = result.get(c.video_id, 0) + 1
         return result
 
     def likes_by_video(self) -> Dict[str, int]:
+        if self.reactions is not None:
+            return self.reactions.likes_by_video()
+        if self.table is not None:
+            return self.table.likes_by_video()
         result: Dict[str, int] = {}
         for l in self._get_likes():
             if l.target_type == "video":
                 result[l.target_id] = result.get(l.target_id, 0) + 1
         return result
 
+#Trendler: zamanla bozunan etkileşim puanına göre videolar ve kanallar
+    def _trending_engine(self) -> TrendingEngine:
+        if self.trending is not None:
+            return self.trending
+        return TrendingEngine.from_interactions(self.interactions, clock=self.clock)
+
+    def trending_videos(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return [
+            {"video_id": video_id, "score": score}
+            for video_id, score in self._trending_engine().top_videos(limit)
+        ]
+
+    def trending_channels(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return [
+            {"channel_id": channel_id, "score": score}
+            for channel_id, score in self._trending_engine().top_channels(limit)
+        ]
+
     def subscriptions_by_channel(self) -> Dict[str, int]:
+        if self.subscribers is not None:
+            return self.subscribers.subscribers_by_channel()
         result: Dict[str, int] = {}
         for s in self._get_subscriptions():
             if s.is_subscribed():
@@ -196,6 +313,8 @@ class InteractionReport:
     
 #Metin analizi
     def longest_comments(self, limit: int = 5) -> List[Dict[str, Any]]:
+        if self.leaderboard is not None:
+            return [c.to_dict() for c in self.leaderboard.top("longest", limit)]
         comments = sorted(
             self._get_comments(),
             key=lambda c: len(c),
@@ -204,6 +323,8 @@ class InteractionReport:
         return [c.to_dict() for c in comments[:limit]]
 
     def shortest_comments(self, limit: int = 5) -> List[Dict[str, Any]]:
+        if self.leaderboard is not None:
+            return [c.to_dict() for c in self.leaderboard.top("shortest", limit)]
         comments = sorted(
             self._get_comments(),
             key=lambda c: len(c)
@@ -211,6 +332,8 @@ class InteractionReport:
         return [c.to_dict() for c in comments[:limit]]
 
     def comments_with_links(self) -> List[Dict[str, Any]]:
+        if self.search_index is not None:
+            return [c.to_dict() for c in self.search_index.search("http")]
         result = []
         for c in self._get_comments():
             if "http" in c.comment_text.lower():
@@ -218,6 +341,8 @@ class InteractionReport:
         return result
 
     def keyword_frequency(self, keyword: str) -> int:
+        if self.search_index is not None:
+            return self.search_index.count(keyword)
         keyword = keyword.lower()
         count = 0
         for c in self._get_comments():
@@ -227,6 +352,8 @@ class InteractionReport:
     
 #Skor sınıflandırma
     def classify_comments_by_score(self) -> Dict[str, int]:
+        if self.table is not None:
+            return self.table.classify_comments_by_score()
         result = {"low": 0, "medium": 0, "high": 0}
 
         for c in self._get_comments():
@@ -241,10 +368,10 @@ class InteractionReport:
         return result
 
     def top_interactions(self, limit: int = 10) -> List[Dict[str, Any]]:
-        sorted_items = sorted(
-            self.interactions,
-            key=lambda i: i.get_age_in_seconds(),
-            reverse=True
-        )
+        #En eski önce: yaş yerine oluşturulma zamanına göre sıralanır
+        if self.timeline is not None:
+            sorted_items = self.timeline.oldest(limit)
+        else:
+            sorted_items = sorted(self.interactions, key=lambda i: i.created_ts)
         return [i.to_dict() for i in sorted_items[:limit]]
     
\ No newline at end of file
@@ -0,0 +1,60 @@
+import sys
+import time
+
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.sharding import ShardedInteractionManager
+
+#Shard sayısına göre toplu ekleme ve rapor hızını ölçen benchmark
+#Kullanım: python sharding_benchmark.py [adet]
+
+USER_POOL = 5000
+VIDEO_POOL = 1000
+
+
+def build_records(count: int) -> list:
+    records = []
+    for n in range(count):
+        user = f"user_{n % USER_POOL}"
+        video = f"video_{n % VIDEO_POOL}"
+        if n % 3 == 0:
+            records.append(("comment", f"c{n}", user, video, f"Yorum metni {n % 97}"))
+        elif n % 3 == 1:
+            records.append(("like", f"l{n}", user, video, "video", "like" if n % 4 else "dislike"))
+        else:
+            records.append(("subscription", f"s{n}", user, f"channel_{n % 200}"))
+    return records
+
+
+def run_single(records: list) -> tuple:
+    manager = InteractionManager()
+    started = time.perf_counter()
+    manager.add_interactions(records, workers=1)
+    ingest = time.perf_counter() - started
+    started = time.perf_counter()
+    InteractionReport(manager.interactions).export_full_report()
+    return ingest, time.perf_counter() - started
+
+
+def run_sharded(records: list, shards: int) -> tuple:
+    with ShardedInteractionManager(shards) as manager:
+        started = time.perf_counter()
+        manager.add_interactions(records)
+        ingest = time.perf_counter() - started
+        started = time.perf_counter()
+        manager.export_full_report()
+        return ingest, time.perf_counter() - started
+
+
+def run_benchmark(count: int = 200_000) -> None:
+    records = build_records(count)
+    print(f" === SHARD BENCHMARK ({count} kayıt) ===")
+    ingest, report = run_single(records)
+    print(f" tek süreç: {count / ingest:.0f} kayıt/sn, rapor {report * 1000:.0f} ms")
+    for shards in (1, 2, 4, 8):
+        ingest, report = run_sharded(records, shards)
+        print(f" {shards} shard: {count / ingest:.0f} kayıt/sn, rapor {report * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -1,20 +1,43 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime, timedelta
 
+from interactions.aggregation import SummaryAccumulator
 from interactions.base import InteractionBase
+from interactions.controversy import ControversyIndex, controversial_mask
 from interactions.comment import CommentInteraction
 from interactions.like import LikeInteraction
+from interactions.reactions import ReactionStore
 from interactions.subscription import SubscriptionInteraction
+from interactions.table import InteractionTable
+from interactions.timeline import TimeIndex
 
 class InteractionStatistics:
-    def __init__(self, interactions: List[InteractionBase]):
+    def __init__(
+            self,
+            interactions: List[InteractionBase],
+            table: Optional[InteractionTable] = None,
+            timeline: Optional[TimeIndex] = None,
+            clock: Optional[Callable[[], datetime]] = None,
+            controversy: Optional[ControversyIndex] = None
+    ):
         self.interactions = interactions
-        self.generated_at = datetime.now()
+        #Kolon tablosu verilirse sayımlar vektörel yapılır
+        self.table = table
+        #Zaman indeksi verilirse zaman pencereleri ikili arama ile sayılır
+        self.timeline = timeline
+        #Tüm zaman sorguları için tek saat kaynağı
+        self.clock = clock or datetime.now
+        #Tartışma indeksi verilirse tartışmalı hedefler güncel sıralamadan sayılır
+        self.controversy = controversy
+        self.generated_at = self.clock()
 
+#Genel sayılar
     def total_count(self) -> int:
         return len(self.interactions)
     
     def count_by_type(self) -> Dict[str, int]:
+        if self.table is not None:
+            return self.table.count_by_type()
         result: Dict[str, int] = {}
         for i in self.interactions:
             name = i.get_class_name()
@@ -22,49 +45,144 @@ class InteractionStatistics:
         return result
     
     def count_by_status(self) -> Dict[str, int]:
+        if self.table is not None:
+            return self.table.count_by_status()
         result = {"active": 0, "deleted": 0, "flagged": 0}
         for i in self.interactions:
             if i.status in result:
                 result[i.status] += 1
         return result
     
+#Comment işlemleri
     def get_comments(self) -> List[CommentInteraction]:
         return [i for i in self.interactions if isinstance(i, CommentInteraction)]
     
-    def flagged_comments(self) -> int: 
-        return len([c for c in self.get_comments() if c.status == "flagged"])
+    def total_comments(self) -> int:
+        if self.table is not None:
+            return self.table.total_comments()
+        return len(self.get_comments())
+
+    def flagged_comments(self) -> List[CommentInteraction]:
+        if self.table is not None:
+            return self.table.flagged_comments()
+        return len([c for c in self.get_comments() if c.is_flagged()])
     
-    def popular_comments(self) -> int:
-        return len([c for c in self.get_comments() if hasattr(c, 'is_popular') and c.is_popular()])
+    def popular_comments(self) -> List[CommentInteraction]:
+        if self.table is not None:
+            return self.table.popular_comments()
+        return len([c for c in self.get_comments() if c.is_popular()])
     
     def average_comment_length(self) -> float:
+        if self.table is not None:
+            return self.table.average_comment_length()
         comments = self.get_comments()
         if not comments:
             return 0.0
-        # DÜZELTME: c.content yerine c.comment_text yazıldı
         total = sum(len(c.comment_text) for c in comments)
         return total / len(comments)
     
     def average_comment_score(self) -> float:
+        if self.table is not None:
+            return self.table.average_comment_score()
         comments = self.get_comments()
         if not comments:
             return 0.0
-        total = sum(c.calculate_score() if hasattr(c, 'calculate_score') else 0 for c in comments)
+        total = sum(c.calculate_score() for c in comments)
         return total / len(comments)
+    
+#Like işlemleri
+    def get_likes(self) -> List[LikeInteraction]:
+        return [i for i in self.interactions if isinstance(i, LikeInteraction)]
+    
+    def total_likes(self) -> int:
+        if self.table is not None:
+            return self.table.count_like_types()["like"]
+        return len([l for l in self.get_likes() if l.is_like()])
+    
+    def total_dislikes(self) -> int:
+        if self.table is not None:
+            return self.table.count_like_types()["dislike"]
+        return len([l for l in self.get_likes() if l.is_dislike()])
+    
+    def like_ratio(self) -> float:
+        likes = self.total_likes()
+        dislikes = self.total_dislikes()
+        total = likes + dislikes
+        if total == 0:
+            return 0.0
+        return (likes / total) * 100
+    
+    def controversial_items(self) -> int:
+        #Hedef başına (kullanıcı başına tek) like / dislike sayıları üzerinden
+        if self.controversy is not None:
+            return self.controversy.count()
+        #Kullanıcının hedefe son aktif like / dislike'ı geçerlidir (ReactionStore ile aynı kural)
+        tallies = ReactionStore.from_interactions(self.get_likes()).tallies()
+        mask = controversial_mask([t[0] for t in tallies.values()], [t[1] for t in tallies.values()])
+        return int(sum(mask))
+    
+#Subscription (abonelik) işlemleri
+    def get_subscriptions(self) -> List[SubscriptionInteraction]:
+        return [
+            i for i in self.interactions
+            if isinstance(i, SubscriptionInteraction)
+        ]
+    def active_subscriptions(self) -> int:
+        return len([s for s in self.get_subscriptions() if s.is_subscribed()])
+    
+    def total_subscriptions(self) -> int:
+        return len(self.get_subscriptions())
 
+    def subscription_ratio(self) -> float:
+        total = self.total_subscriptions()
+        if total == 0:
+            return 0.0
+        return (self.active_subscriptions() / total) * 100
+    
+#Zaman bazlı analiz
+    def interactions_last_days(self, days: int) -> int:
+        since = self.clock() - timedelta(days=days) 
+        if self.timeline is not None:
+            return self.timeline.count_since(since)
+        if self.table is not None:
+            return self.table.count_since(since)
+        since_ts = since.timestamp()
+        return len([i for i in self.interactions if i.created_ts >= since_ts])
+
+    def daily_average(self, days: int) -> float:
+        if days <= 0:
+            return 0.0
+        return self.interactions_last_days(days) / days
+
+#Rapor
     def generate_summary(self) -> Dict[str, Any]:
-        return {
-            "total_interactions": self.total_count(),
-            "by_type": self.count_by_type(),
-            "by_status": self.count_by_status(),
+        acc = SummaryAccumulator.from_interactions(self.interactions)
+        return{
+            "generated_at": self.generated_at,
+            "total_interactions": acc.total,
+            "by_type": acc.by_type,
+            "by_status": acc.by_status,
             "comments": {
-                "total": len(self.get_comments()),
-                "flagged": self.flagged_comments(),
-                "popular": self.popular_comments(),
-                "average_length": round(self.average_comment_length(), 2),
-                "average_score": round(self.average_comment_score(), 2)
+                "total": acc.comment_total,
+                "flagged": acc.comment_flagged,
+                "popular": acc.comment_popular,
+                "average_length": acc.average_comment_length(),
+                "average_score": acc.average_comment_score()
             },
             "likes": {
-                "like_ratio": 0 # test.py'de hata vermemesi için eklendi
+                "likes": acc.likes,
+                "dislikes": acc.dislikes,
+                "like_ratio": acc.like_ratio()
+            },
+            "subscriptions": {
+                "total": acc.subscription_total,
+                "active": acc.subscription_active,
+                "ratio": acc.subscription_ratio()
             }
-        }
\ No newline at end of file
+        }   
+    
+    def __str__(self) -> str:
+        return f"InteractionStatistics(total={self.total_count()})"
+    
+        
+    
\ No newline at end of file
@@ -0,0 +1,66 @@
+import random
+
+from interactions.aggregation import SummaryAccumulator
+from interactions.statistics import InteractionStatistics
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+
+def build(seed: int = 1):
+    rng = random.Random(seed)
+    items = []
+    for n in range(2000):
+        r = rng.random()
+        if r < 0.4:
+            i = CommentInteraction(f"c{n}", "u", "v", "kelime " * rng.randint(1, 30))
+            for _ in range(rng.randint(0, 12)):
+                i.add_like()
+            if rng.random() < 0.1:
+                i.set_status("flagged")
+        elif r < 0.8:
+            i = LikeInteraction(f"l{n}", "u", "v", "video", rng.choice(["like", "dislike"]))
+        else:
+            i = SubscriptionInteraction(f"s{n}", "u", "ch")
+            if rng.random() < 0.5:
+                i.process()
+        items.append(i)
+    return items
+
+
+def test_summary_matches_individual_methods():
+    stats = InteractionStatistics(build())
+    summary = stats.generate_summary()
+    assert summary["by_status"] == stats.count_by_status()
+    assert summary["by_type"] == stats.count_by_type()
+    assert summary["comments"] == {
+        "total": stats.total_comments(),
+        "flagged": stats.flagged_comments(),
+        "popular": stats.popular_comments(),
+        "average_length": stats.average_comment_length(),
+        "average_score": stats.average_comment_score(),
+    }
+    assert summary["likes"] == {
+        "likes": stats.total_likes(),
+        "dislikes": stats.total_dislikes(),
+        "like_ratio": stats.like_ratio(),
+    }
+    assert summary["subscriptions"] == {
+        "total": stats.total_subscriptions(),
+        "active": stats.active_subscriptions(),
+        "ratio": stats.subscription_ratio(),
+    }
+
+
+def test_merged_accumulators_equal_single_pass():
+    items = build(2)
+    merged = SummaryAccumulator.from_interactions(items[:700]).merge(
+        SummaryAccumulator.from_interactions(items[700:])
+    )
+    single = SummaryAccumulator.from_interactions(items)
+    assert vars(merged).keys() == vars(single).keys()
+    for key, value in vars(single).items():
+        if isinstance(value, float):
+            assert abs(vars(merged)[key] - value) < 1e-6
+        else:
+            assert vars(merged)[key] == value
@@ -0,0 +1,203 @@
+import threading
+import time
+
+import pytest
+
+from interactions.concurrent import ConcurrentInteractionManager, SNAPSHOT_CHUNK
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+
+
+def build(count: int = 3000) -> ConcurrentInteractionManager:
+    manager = ConcurrentInteractionManager()
+    for n in range(count):
+        manager.add_interaction(CommentInteraction(f"c{n}", "u", "v", "metin"))
+    return manager
+
+
+def test_snapshots_are_isolated_and_share_unchanged_chunks():
+    manager = build()
+    first = manager.snapshot()
+    assert manager.snapshot() is first
+    manager.mutate("c1", CommentInteraction.add_like)
+    manager.mutate("c2", CommentInteraction.add_flag, "spam")
+    manager.add_interaction(LikeInteraction("l1", "u", "v"))
+    second = manager.snapshot()
+
+    assert first.interactions[1].like_count == 0 and second.interactions[1].like_count == 1
+    assert first.interactions[2].flags == [] and second.interactions[2].flags == ["spam"]
+    assert len(first) == 3000 and len(second) == 3001
+    assert second.interactions[-1].interaction_id == "l1"
+    assert first.interactions[5] is second.interactions[5]
+    #Değişmeyen parçalar kopyalanmaz
+    assert first.interactions._chunks[1] is second.interactions._chunks[1]
+    assert first.interactions._chunks[0] is not second.interactions._chunks[0]
+    assert [i.interaction_id for i in second.interactions[SNAPSHOT_CHUNK - 1:SNAPSHOT_CHUNK + 1]] == [
+        f"c{SNAPSHOT_CHUNK - 1}", f"c{SNAPSHOT_CHUNK}"
+    ]
+    assert second.report().general_overview()["total_interactions"] == 3001
+    assert second.statistics().count_by_status() == second.count_by_status()
+
+
+def test_snapshot_after_vacuum():
+    manager = build(100)
+    before = manager.snapshot()
+    manager.remove_interaction("c3")
+    manager.vacuum_all()
+    after = manager.snapshot()
+    assert len(before) == 100 and len(after) == 99
+    assert all(i.interaction_id != "c3" for i in after.interactions)
+    manager.mutate("c50", CommentInteraction.add_like)
+    latest = manager.snapshot()
+    assert next(i for i in latest.interactions if i.interaction_id == "c50").like_count == 1
+
+
+def test_concurrent_readers_see_consistent_counters():
+    manager = build(1000)
+    stop = threading.Event()
+    errors = []
+
+    def writer(k: int) -> None:
+        n = 0
+        while not stop.is_set():
+            manager.add_interaction(LikeInteraction(f"l{k}-{n}", "u", "v", "video", "like"))
+            manager.mutate(f"c{n % 1000}", CommentInteraction.add_like)
+            if n % 7 == 0:
+                manager.remove_interaction(f"c{(n * 13) % 1000}")
+            n += 1
+
+    def reader() -> None:
+        while not stop.is_set():
+            snapshot = manager.snapshot()
+            counted = {"active": 0, "deleted": 0, "flagged": 0}
+            for i in snapshot.interactions:
+                counted[i.status] += 1
+            if counted != snapshot.count_by_status() or sum(snapshot.count_by_type().values()) != len(snapshot):
+                errors.append(counted)
+
+    threads = [threading.Thread(target=writer, args=(k,)) for k in range(3)]
+    threads += [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    time.sleep(0.5)
+    stop.set()
+    for t in threads:
+        t.join()
+    assert not errors
+
+
+#Toplu ekleme, partinin spam puanlayıcısını taban sınıfa iletir
+def test_bulk_ingest_reports_spam_stats():
+    manager = ConcurrentInteractionManager()
+    epoch = manager.epoch
+    records = [("comment", f"c{n}", "u", "v", "http http http spam" if n % 3 == 0 else "güzel video")
+               for n in range(30)]
+    reports = manager.add_interactions(records, workers=1)
+    assert reports[0]["spam"]["hits"] == manager.spam_scorer.stats()["hits"]
+    assert reports[0]["spam"]["scored"] == 30 and len(reports[0]["flagged"]) == 10
+    assert manager.get_total_count() == 30 and manager.epoch > epoch
+    assert len(manager.snapshot()) == 30
+
+
+#Bileşen hatasında yarım kalan parti geri alınır; snapshot yeniden kurulur
+class FailingComponent:
+    def __init__(self, bad_id):
+        self.bad_id = bad_id
+        self.seen = []
+
+    def add(self, interaction) -> None:
+        if interaction.interaction_id == self.bad_id:
+            raise OSError("disk dolu")
+        self.seen.append(interaction.interaction_id)
+
+    def update(self, interaction, field, old, new) -> None:
+        pass
+
+    def remove(self, interaction) -> None:
+        self.seen.remove(interaction.interaction_id)
+
+    def clear(self) -> None:
+        self.seen.clear()
+
+
+def test_failed_batch_is_rolled_back():
+    manager = build(10)
+    manager.snapshot()
+    failing = FailingComponent("l3")
+    manager.attach(failing)
+    with pytest.raises(OSError):
+        manager.add_interactions([("like", f"l{n}", "u", "v") for n in range(5)], workers=1)
+    assert manager.get_total_count() == 10 and failing.seen == []
+    assert manager.get_by_id("l0") is None and manager.count_by_type() == {"CommentInteraction": 10}
+    assert [i.interaction_id for i in manager.snapshot().interactions] == [f"c{n}" for n in range(10)]
+
+
+#Ortak yapılara dokunmayan değişiklikler yalnızca parça kilidini alır
+def test_mutation_does_not_wait_for_write_lock():
+    manager = build(100)
+    manager.snapshot()
+    done = threading.Event()
+
+    def writer() -> None:
+        manager.mutate("c7", CommentInteraction.add_like)
+        manager.remove_interaction("c8")
+        done.set()
+
+    with manager._write_lock:
+        thread = threading.Thread(target=writer)
+        thread.start()
+        assert done.wait(5)
+    thread.join()
+    assert manager.count_by_status() == {"active": 99, "deleted": 1, "flagged": 0}
+    snapshot = manager.snapshot()
+    assert snapshot.interactions[7].like_count == 1 and snapshot.interactions[8].status == "deleted"
+    assert snapshot.count_by_status() == manager.count_by_status()
+
+
+#Eşzamanlı değişiklik ve vacuum sonrası sayaçlar ve snapshot canlı nesnelerle aynıdır
+def test_counts_match_scan_after_concurrent_writes():
+    manager = build(2000)
+    stop = threading.Event()
+    errors = []
+
+    def writer(k: int) -> None:
+        n = k
+        while not stop.is_set():
+            manager.mutate(f"c{n % 2000}", CommentInteraction.add_like)
+            if n % 5 == 0:
+                manager.remove_interaction(f"c{(n * 7) % 2000}")
+            elif n % 5 == 1:
+                manager.mutate(f"c{(n * 11) % 2000}", CommentInteraction.restore)
+            if k == 0 and n % 400 == 0:
+                manager.vacuum_all()
+            n += 3
+
+    def reader() -> None:
+        while not stop.is_set():
+            snapshot = manager.snapshot()
+            counted = {"active": 0, "deleted": 0, "flagged": 0}
+            for i in snapshot.interactions:
+                counted[i.status] += 1
+            if counted != snapshot.count_by_status():
+                errors.append(counted)
+
+    threads = [threading.Thread(target=writer, args=(k,)) for k in range(3)]
+    threads.append(threading.Thread(target=reader))
+    for t in threads:
+        t.start()
+    time.sleep(0.5)
+    stop.set()
+    for t in threads:
+        t.join()
+    assert not errors
+
+    live = manager.interactions
+    counted = {"active": 0, "deleted": 0, "flagged": 0}
+    for i in live:
+        counted[i.status] += 1
+    assert manager.count_by_status() == counted
+    snapshot = manager.snapshot()
+    assert [(i.interaction_id, i.status, i.like_count) for i in snapshot.interactions] == [
+        (i.interaction_id, i.status, i.like_count) for i in live
+    ]
+    assert snapshot.count_by_status() == counted
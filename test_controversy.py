@@ -0,0 +1,76 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+from interactions.manager import InteractionManager
+from interactions.like import LikeInteraction
+from interactions.reactions import ReactionStore
+from interactions.controversy import ControversyIndex, controversy_score, controversial_mask
+from interactions.statistics import InteractionStatistics
+
+T0 = datetime(2024, 5, 1, 12, 0)
+
+
+def like(interaction_id: str, user: str, target: str, like_type: str = "like",
+         target_type: str = "video", minutes: int = 0) -> LikeInteraction:
+    i = LikeInteraction(interaction_id, user, target, target_type, like_type)
+    i.created_at = T0 + timedelta(minutes=minutes)
+    return i
+
+
+def test_invalid_and_inactive_reactions_are_ignored():
+    assert InteractionStatistics([LikeInteraction("l1", "u1", "v1", "video", "superlike")]).controversial_items() == 0
+
+    items = [like(f"l{n}", f"u{n}", "v1", "like" if n % 2 else "dislike") for n in range(20)]
+    items.append(like("x1", "u99", "v1", "superlike"))
+    assert InteractionStatistics(items).controversial_items() == 1
+    for i in items[:11]:
+        i.mark_as_deleted()
+    assert InteractionStatistics(items).controversial_items() == 0
+
+
+#Aynı kullanıcının tekrar eden tepkileri tek sayılır; en yeni tepki geçerlidir
+def test_latest_reaction_per_user_counts_once():
+    items = [like(f"l{n}", f"u{n}", "v1", "like") for n in range(10)]
+    items += [like(f"d{n}", f"u{n}", "v1", "dislike", minutes=5) for n in range(5)]
+    items += [like(f"o{n}", f"u{n}", "v1", "like", minutes=-5) for n in range(5, 10)]
+    assert InteractionStatistics(items).controversial_items() == 1
+    assert InteractionStatistics(items[:10] * 3).controversial_items() == 0
+
+
+def test_count_matches_live_index():
+    rng = random.Random(25)
+    manager = InteractionManager()
+    store = ReactionStore()
+    manager.attach(store)
+    index = ControversyIndex(store)
+    likes = []
+    for n in range(5000):
+        i = like(f"l{n}", f"u{rng.randint(0, 30)}", f"t{rng.randint(0, 80)}",
+                 rng.choice(["like", "dislike", "superlike"]), rng.choice(["video", "comment"]),
+                 minutes=rng.randint(0, 100))
+        manager.add_interaction(i)
+        likes.append(i)
+        other = rng.choice(likes)
+        k = rng.random()
+        if k < 0.05:
+            other.mark_as_deleted() if other.status != "deleted" else other.restore()
+        elif k < 0.1:
+            other.toggle()
+    stats = InteractionStatistics(manager.interactions)
+    assert stats.controversial_items() == index.count() > 0
+    assert InteractionStatistics(manager.interactions, controversy=index).controversial_items() == index.count()
+
+    tallies = store.tallies("video")
+    expected = sorted(((controversy_score(*v), key[1]) for key, v in tallies.items() if controversy_score(*v)),
+                      key=lambda e: (-e[0], e[1]))
+    got = index.most_controversial("video", 10)
+    assert [(g["score"], g["target_id"]) for g in got] == expected[:10]
+    assert all(math.isclose(g["sentiment"], LikeInteraction.calculate_sentiment(g["likes"], g["dislikes"])) for g in got)
+
+#Vektörel maske ve LikeInteraction.is_controversial eşik sınırlarında aynı sonucu verir
+def test_mask_matches_scalar_thresholds():
+    pairs = [(likes, dislikes) for likes in range(0, 12) for dislikes in range(0, 12)]
+    mask = controversial_mask([p[0] for p in pairs], [p[1] for p in pairs])
+    assert [bool(m) for m in mask] == [LikeInteraction.is_controversial(*p) for p in pairs]
+    assert LikeInteraction.is_controversial(6, 4) and not LikeInteraction.is_controversial(5, 4)
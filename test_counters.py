@@ -0,0 +1,70 @@
+import random
+
+from interactions.manager import InteractionManager
+from interactions.statistics import InteractionStatistics
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+
+def recount(manager: InteractionManager):
+    status = {"active": 0, "deleted": 0, "flagged": 0}
+    types = {}
+    for i in manager.interactions:
+        if i.status in status:
+            status[i.status] += 1
+        types[i.get_class_name()] = types.get(i.get_class_name(), 0) + 1
+    likes = [l for l in manager.interactions if isinstance(l, LikeInteraction)]
+    return status, types, sum(l.is_like() for l in likes), sum(l.is_dislike() for l in likes)
+
+
+def test_counters_follow_mutations():
+    rng = random.Random(3)
+    manager = InteractionManager()
+    #Bir nesne birden fazla manager'a eklenebilir; sayaçlar her birinde ayrı tutulur
+    other = InteractionManager()
+    objs = []
+    for n in range(2000):
+        r = rng.random()
+        if r < 0.3:
+            i = CommentInteraction(f"c{n}", "u", "v", "selam")
+        elif r < 0.7:
+            i = LikeInteraction(f"l{n}", "u", "v", "video", rng.choice(["like", "dislike"]))
+        else:
+            i = SubscriptionInteraction(f"s{n}", "u", "ch", rng.choice(["subscribe", "unsubscribe"]))
+        manager.add_interaction(i)
+        objs.append(i)
+        if rng.random() < 0.3:
+            other.add_interaction(i)
+        o = rng.choice(objs)
+        k = rng.random()
+        if k < 0.2:
+            o.set_status(rng.choice(["active", "deleted", "flagged"]))
+        elif k < 0.3:
+            manager.remove_interaction(o.interaction_id)
+        elif k < 0.5 and isinstance(o, LikeInteraction):
+            o.toggle()
+        elif k < 0.6 and isinstance(o, SubscriptionInteraction):
+            o.process()
+    for m in (manager, other):
+        assert (m.count_by_status(), m.count_by_type(), m.count_likes(), m.count_dislikes()) == recount(m)
+
+    manager.clear_all()
+    assert manager.count_likes() == 0
+    assert manager.count_by_status() == {"active": 0, "deleted": 0, "flagged": 0}
+    objs[0].set_status("deleted" if objs[0].status != "deleted" else "active")
+    assert manager.count_by_type() == {}
+
+
+def test_count_by_status_ignores_unknown_statuses():
+    #Abonelikten çıkış "inactive" durumuna geçer; sayımda yer almaz
+    sub = SubscriptionInteraction("s1", "u", "ch", "unsubscribe")
+    sub.process()
+    comment = CommentInteraction("c1", "u", "v", "selam")
+    manager = InteractionManager()
+    manager.add_interaction(sub)
+    manager.add_interaction(comment)
+    expected = {"active": 1, "deleted": 0, "flagged": 0}
+    assert sub.status == "inactive"
+    assert manager.count_by_status() == expected
+    assert InteractionStatistics([sub, comment]).count_by_status() == expected
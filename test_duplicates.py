@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.duplicates import NearDuplicateDetector, minhash
+
+NOW = datetime(2026, 1, 1, 12)
+SPAM = "Check out my channel for FREE gift cards, subscribe now and win big prizes today!!"
+TEXTS = [
+    "Bu video gerçekten çok faydalı oldu, emeğinize sağlık hocam",
+    "Harika bir anlatım, bir sonraki bölümü sabırsızlıkla bekliyorum",
+    "Ses kalitesi biraz düşük ama içerik olarak çok başarılı bir video",
+    "Kodları paylaşabilir misiniz, ben de denemek istiyorum lütfen",
+]
+
+
+def comment(n: int, text: str, when: datetime = NOW) -> CommentInteraction:
+    c = CommentInteraction(f"c{n}", f"u{n}", "v", text)
+    c.created_at = when
+    return c
+
+
+#İmzalar PYTHONHASHSEED'den bağımsız olmalı
+def test_signature_is_stable_across_processes():
+    code = "from interactions.duplicates import minhash; print(minhash(%r))" % SPAM
+    env = dict(os.environ, PYTHONHASHSEED="123")
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    assert int(output) == minhash(SPAM)
+
+
+def test_edited_comment_replaces_its_signature():
+    now = [NOW]
+    detector = NearDuplicateDetector(threshold=2, clock=lambda: now[0])
+    manager = InteractionManager()
+    manager.attach(detector)
+    comments = [comment(n, text) for n, text in enumerate(TEXTS)]
+    for c in comments:
+        manager.add_interaction(c)
+    assert len(detector) == 4 and detector.count_similar(SPAM) == 0
+
+    #Aynı yorum defalarca düzenlense de tek imza kalır
+    for _ in range(3):
+        comments[0].edit_comment(SPAM)
+        assert len(detector) == 4 and detector.count_similar(SPAM) == 1
+    assert not comments[0].is_flagged()
+    assert detector.count_similar(TEXTS[0]) == 0
+
+    comments[1].edit_comment(SPAM + " ")
+    assert detector.count_similar(SPAM) == 2
+    comments[0].edit_comment(TEXTS[0])
+    assert detector.count_similar(SPAM) == 1 and detector.count_similar(TEXTS[0]) == 1
+
+    #Çıkarılmış imzalar süre dolunca sorunsuz atılır
+    now[0] = NOW + timedelta(hours=7)
+    assert detector.count_similar(SPAM) == 0 and len(detector) == 0
+    assert all(not bucket for bucket in detector._buckets)
+    late = comment(9, SPAM, now[0])
+    manager.add_interaction(late)
+    comments[2].edit_comment(SPAM)
+    assert len(detector) == 2 and detector.count_similar(SPAM) == 2
+
+
+def test_flood_is_flagged_after_threshold():
+    detector = NearDuplicateDetector(clock=lambda: NOW)
+    manager = InteractionManager()
+    manager.attach(detector)
+    flood = [comment(n, SPAM.replace("!!", "!" * (n % 3 + 1))) for n in range(10)]
+    for c in flood:
+        manager.add_interaction(c)
+    assert [c.is_flagged() for c in flood] == [False] * 3 + [True] * 7
+    assert detector.stats() == {"signatures": 10, "checked": 10, "flagged": 7}
+    manager.clear_all()
+    assert len(detector) == 0
@@ -0,0 +1,62 @@
+import csv
+import gzip
+import io
+import json
+
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+TEXT = "ğüşı, \"x\"\n y"
+
+
+def build(count: int = 600) -> InteractionManager:
+    manager = InteractionManager()
+    for n in range(count):
+        i = [
+            CommentInteraction(f"c{n}", "u", "v", TEXT),
+            LikeInteraction(f"l{n}", "u", "v"),
+            SubscriptionInteraction(f"s{n}", "u", "ch"),
+        ][n % 3]
+        if n % 7 == 0:
+            i.mark_as_deleted()
+        if n % 3 == 0 and n % 2:
+            i.add_flag("spam")
+        manager.add_interaction(i)
+    return manager
+
+
+def test_ndjson_matches_dict_lists():
+    manager = build()
+    out = io.StringIO()
+    assert manager.export_to(out) == 600
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == manager.to_dict_list()
+
+    out = io.StringIO()
+    manager.export_to(out, active_only=True)
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == manager.export_active()
+
+
+def test_csv_and_column_selection():
+    manager = build()
+    out = io.StringIO()
+    manager.export_to(out, fmt="csv")
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert len(rows) == 600
+    assert rows[0]["comment_text"] == TEXT
+
+    out = io.StringIO()
+    manager.export_to(out, columns={"LikeInteraction": ["interaction_id"]})
+    assert json.loads(out.getvalue().splitlines()[1]) == {"interaction_id": "l1"}
+
+
+def test_gzip_file_and_raw_iterator(tmp_path):
+    manager = build()
+    path = str(tmp_path / "export.ndjson.gz")
+    assert manager.export_to_file(path) == 600
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == 600
+    report = InteractionReport(manager.interactions)
+    assert list(report.iter_raw()) == report.export_raw()
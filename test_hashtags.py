@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.hashtags import HashtagIndex, SlidingWindowCounter
+
+NOW = datetime(2026, 3, 1, 12)
+
+
+def comment(n: int, text: str, minutes: int = 0) -> CommentInteraction:
+    c = CommentInteraction(f"c{n}", "u", "v", text)
+    c.created_at = NOW - timedelta(minutes=minutes)
+    return c
+
+
+#Noktalama etikete dahil edilmez
+def test_extract_strips_punctuation():
+    tags, mentions = HashtagIndex.extract(comment(0, "Bugün #Python, yarın #Rust! (#go) ##çift @ayşe: mail@site.com # @"))
+    assert tags == ("python", "rust", "go", "çift")
+    assert mentions == ("ayşe",)
+
+    #Yorum metotları ve indeks aynı ayrıştırmayı kullanır
+    c = comment(1, "Loving #Python, and @alice!")
+    assert c.find_hashtags() == ["Python"] and c.find_mentions() == ["alice"]
+    assert HashtagIndex.extract(c) == (("python",), ("alice",))
+
+
+def test_punctuated_tags_are_counted_together():
+    now = [NOW]
+    index = HashtagIndex(clock=lambda: now[0])
+    manager = InteractionManager()
+    manager.attach(index)
+    first = comment(0, "#Python, harika bir dil @ali.", minutes=5)
+    second = comment(1, "Kesinlikle #python! #python?", minutes=1)
+    manager.add_interaction(first)
+    manager.add_interaction(second)
+    assert index.tag_count("python", "1h") == 2
+    assert index.trending_hashtags("1h") == [("python", 2)]
+    assert index.comments_with_tag("#PYTHON") == [first, second]
+    assert index.mention_count("@ali", "1h") == 1
+
+    first.edit_comment("Artık #rust.")
+    assert index.tag_count("python", "1h") == 1 and index.tag_count("rust", "1h") == 1
+    second.mark_as_deleted()
+    assert index.tag_count("python", "1h") == 0
+
+    now[0] = NOW + timedelta(hours=2)
+    assert index.tag_count("rust", "1h") == 0 and index.tag_count("rust", "24h") == 1
+    with pytest.raises(ValueError):
+        index.trending_hashtags("2h")
+
+
+def test_sliding_window_expires_old_slots():
+    counter = SlidingWindowCounter(timedelta(minutes=10), slots=10)
+    start = NOW.timestamp()
+    for minute in range(20):
+        counter.add("a", start + minute * 60)
+    counter.advance(start + 19 * 60)
+    assert counter.count("a") == 10
+    counter.discard("a", start + 19 * 60)
+    counter.discard("a", start)
+    assert counter.count("a") == 9
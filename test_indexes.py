@@ -0,0 +1,82 @@
+import random
+
+from interactions.base import InteractionBase
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+
+def build(seed: int = 1):
+    rng = random.Random(seed)
+    manager = InteractionManager()
+    items = []
+    for n in range(1500):
+        r = rng.random()
+        user = f"u{rng.randint(0, 20)}"
+        if r < 0.4:
+            #Tekrarlanan id'ler: get_by_id ilk kaydı döndürmeli
+            i = CommentInteraction(f"i{rng.randint(0, 1000)}", user, f"v{rng.randint(0, 5)}", "merhaba dünya")
+        elif r < 0.8:
+            i = LikeInteraction(f"i{n}", user, rng.choice(["v1", "v2", "c1"]), rng.choice(["video", "comment"]))
+        else:
+            i = SubscriptionInteraction(f"i{n}", user, f"ch{rng.randint(0, 3)}")
+        manager.add_interaction(i)
+        items.append(i)
+    return manager, items
+
+
+def test_lookups_match_linear_scan():
+    manager, items = build()
+    for key in ("i3", "i10", "i999", "yok"):
+        expected = next((i for i in items if i.interaction_id == key), None)
+        assert manager.get_by_id(key) is expected
+    for user in ("u1", "u5", "yok"):
+        assert manager.get_by_user(user) == [i for i in items if i.user_id == user]
+    for cls in (InteractionBase, CommentInteraction, LikeInteraction, SubscriptionInteraction):
+        assert manager.get_by_type(cls) == [i for i in items if isinstance(i, cls)]
+    assert manager.get_video_likes("v1") == [
+        l for l in items
+        if isinstance(l, LikeInteraction) and l.target_type == "video" and l.target_id == "v1"
+    ]
+    assert manager.get_comment_likes("c1") == [
+        l for l in items
+        if isinstance(l, LikeInteraction) and l.target_type == "comment" and l.target_id == "c1"
+    ]
+    assert manager.get_comments_by_video("v3") == [
+        c for c in items if isinstance(c, CommentInteraction) and c.video_id == "v3"
+    ]
+
+
+
+#Hedef / eylem türü değişiklikleri kovaları ve sayaçları günceller
+def test_type_changes_update_indexes():
+    manager, items = build(3)
+    rng = random.Random(3)
+    for _ in range(300):
+        i = rng.choice(items)
+        if isinstance(i, LikeInteraction):
+            i.target_type = rng.choice(["video", "comment"])
+        elif isinstance(i, SubscriptionInteraction):
+            i.action_type = rng.choice(["subscribe", "unsubscribe"])
+    for target in ("v1", "v2", "c1"):
+        for kind, lookup in (("video", manager.get_video_likes), ("comment", manager.get_comment_likes)):
+            assert lookup(target) == [
+                l for l in items
+                if isinstance(l, LikeInteraction) and l.target_type == kind and l.target_id == target
+            ]
+    subs = [s for s in items if isinstance(s, SubscriptionInteraction)]
+    assert manager.count_subscriptions() == sum(s.action_type == "subscribe" for s in subs)
+    assert manager.count_unsubscriptions() == sum(s.action_type == "unsubscribe" for s in subs)
+
+
+def test_remove_and_clear_update_indexes():
+    manager, items = build(2)
+    first = items[0]
+    assert manager.remove_interaction(first.interaction_id)
+    assert manager.get_by_id(first.interaction_id).status == "deleted"
+
+    manager.clear_all()
+    assert manager.get_by_id(first.interaction_id) is None
+    assert manager.get_by_user("u1") == []
+    assert manager.get_by_type(CommentInteraction) == []
@@ -0,0 +1,174 @@
+import pytest
+
+from interactions import ingest
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+
+
+def records():
+    result = []
+    for n in range(400):
+        r = n % 6
+        if r == 0:
+            text = "http http http spam" if n % 36 == 0 else "güzel video"
+            result.append({"type": "comment", "interaction_id": f"c{n}", "user_id": "u",
+                           "video_id": "v", "comment_text": text})
+        elif r == 1:
+            result.append(("like", f"l{n}", "u", f"v{n % 9}", "video", "like" if n % 7 else "meh"))
+        elif r == 2:
+            result.append({"interaction_id": f"s{n}", "user_id": "u", "channel_id": "ch",
+                           "action_type": "subscribe" if n % 4 else "unsubscribe"})
+        elif r == 3:
+            result.append(("comment", f"c{n}", "u", "v", ""))
+        elif r == 4:
+            result.append(("bilinmeyen",))
+        else:
+            result.append(LikeInteraction(f"o{n}", "u", "v"))
+    return result
+
+
+#Tek tek process() ile eklemenin sonucu
+def reference(items):
+    manager = InteractionManager()
+    rejected = 0
+    for record in items:
+        try:
+            i = ingest.record_to_interaction(record)
+        except ValueError:
+            rejected += 1
+            continue
+        if not i.validate():
+            rejected += 1
+            continue
+        i.process()
+        manager.add_interaction(i)
+    return manager, rejected
+
+
+def summary(manager):
+    return [(i.get_class_name(), i.interaction_id, i.status) for i in manager.interactions]
+
+
+def test_serial_batches_match_process():
+    manager = InteractionManager()
+    reports = manager.add_interactions(records(), batch_size=150, workers=1)
+    expected, rejected = reference(records())
+    assert sum(len(r["rejected"]) for r in reports) == rejected
+    assert summary(manager) == summary(expected)
+    assert manager.count_by_status() == expected.count_by_status()
+    assert sum(len(r["flagged"]) for r in reports) == 12
+    #Kural isabetleri parti raporunda döner ve manager'ın puanlayıcısında toplanır
+    assert [sum(r["spam"]["hits"].values()) for r in reports] == [len(r["flagged"]) for r in reports]
+    assert manager.spam_scorer.stats()["hits"] == spam_hits(reports)
+    manager.clear_all()
+    assert manager.spam_scorer.stats()["scored"] == 0
+
+
+def spam_hits(reports):
+    hits = {}
+    for r in reports:
+        for name, count in r["spam"]["hits"].items():
+            hits[name] = hits.get(name, 0) + count
+    return hits
+
+
+def test_pool_returns_built_objects():
+    items = records()
+    manager = InteractionManager()
+    reports = manager.add_interactions(items, batch_size=200, workers=2, parallel_threshold=10)
+    expected, rejected = reference(records())
+    assert sum(len(r["rejected"]) for r in reports) == rejected
+    assert summary(manager) == summary(expected)
+    #İşçi süreçlerdeki kural istatistikleri kaybolmaz
+    serial = InteractionManager()
+    serial.add_interactions(records(), batch_size=200, workers=1)
+    assert manager.spam_scorer.stats()["hits"] == serial.spam_scorer.stats()["hits"] == spam_hits(reports)
+    assert manager.spam_scorer.stats()["scored"] == serial.spam_scorer.stats()["scored"]
+    #Nesne olarak verilen kayıtlar kopyalanmaz
+    owned = [i for i in items if isinstance(i, LikeInteraction)]
+    assert all(manager.get_by_id(i.interaction_id) is i for i in owned)
+
+
+def test_check_records_reports_unconvertible_rows():
+    prepared = ingest.check_records([("bilinmeyen",), ("comment", "c1", "u", "v", "selam")])
+    assert prepared[0] == (None, False, False)
+    assert isinstance(prepared[1][0], CommentInteraction) and prepared[1][1:] == (True, False)
+
+
+#Belirli kayıtta hata veren bileşen
+class FailingComponent:
+    def __init__(self, bad_id):
+        self.bad_id = bad_id
+        self.seen = []
+
+    def add(self, interaction) -> None:
+        if interaction.interaction_id == self.bad_id:
+            raise OSError("disk dolu")
+        self.seen.append(interaction.interaction_id)
+
+    def update(self, interaction, field, old, new) -> None:
+        pass
+
+    def remove(self, interaction) -> None:
+        self.seen.remove(interaction.interaction_id)
+
+    def clear(self) -> None:
+        self.seen.clear()
+
+
+def state(manager):
+    return (summary(manager), manager.count_by_type(), manager.count_by_status(),
+            len(manager.timeline), manager.table.count_by_status())
+
+
+#Bileşen hatasında parti yarım kalmaz; liste, indeksler, sayaçlar ve tablo eski haline döner
+def test_failed_batch_is_rolled_back():
+    pytest.importorskip("numpy")
+    manager = InteractionManager(columnar=True, text_index=True)
+    failing = FailingComponent("l5")
+    manager.attach(failing)
+    manager.add_interactions([("like", "l0", "u", "v")], workers=1)
+    before = state(manager)
+    batch = [("like", f"l{n}", "u", f"v{n % 3}") for n in range(20)] + [("comment", "c1", "u", "v", "selam")]
+    with pytest.raises(OSError):
+        manager.add_interactions(batch, workers=1)
+    assert state(manager) == before
+    assert manager.get_by_id("l0") is not None and manager.get_by_id("l10") is None
+    assert len(manager.get_likes()) == 1 and manager.get_by_user("u")[0].interaction_id == "l0"
+    assert failing.seen == ["l0"] and manager.search_index.search("selam") == []
+
+    with pytest.raises(OSError):
+        manager.add_interaction(LikeInteraction("l5", "u", "v"))
+    assert state(manager) == before
+
+    manager.detach(failing)
+    manager.add_interactions(batch, workers=1)
+    assert manager.get_total_count() == 22 and manager.count_by_type()["LikeInteraction"] == 21
+    assert manager.get_by_id("l0") is manager.get_all_by_id("l0")[0]
+
+
+#Süreçlere gönderilirse hata veren nesneler
+class LocalLike(LikeInteraction):
+    __slots__ = ()
+
+    def __reduce_ex__(self, protocol):
+        raise TypeError("nesne süreçlere gönderilmemeli")
+
+
+class LocalComment(CommentInteraction):
+    __slots__ = ()
+
+    def __reduce_ex__(self, protocol):
+        raise TypeError("nesne süreçlere gönderilmemeli")
+
+
+def test_pool_does_not_ship_caller_objects():
+    items = [LocalLike(f"o{n}", "u", "v") for n in range(30)]
+    items += [LocalComment(f"k{n}", "u", "v", "http http http" if n % 4 == 0 else "güzel") for n in range(30)]
+    items += [("like", f"l{n}", "u", "v") for n in range(30)]
+    manager = InteractionManager()
+    reports = manager.add_interactions(items, batch_size=1000, workers=2, parallel_threshold=10)
+    assert reports[0]["accepted"] == 90 and len(reports[0]["flagged"]) == 8
+    assert all(manager.get_by_id(i.interaction_id) is i for i in items[:60])
+    assert manager.spam_scorer.stats()["hits"]["links"] == 8
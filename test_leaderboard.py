@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.leaderboard import CommentLeaderboard
+from interactions.reports import InteractionReport
+
+
+def assert_matches_sort(manager: InteractionManager, leaderboard: CommentLeaderboard) -> None:
+    plain = InteractionReport(manager.interactions)
+    ranked = InteractionReport(manager.interactions, leaderboard=leaderboard)
+    for limit in (1, 5, 40):
+        assert plain.top_comments(limit) == ranked.top_comments(limit)
+        assert plain.longest_comments(limit) == ranked.longest_comments(limit)
+        assert plain.shortest_comments(limit) == ranked.shortest_comments(limit)
+        assert plain.top_comments_for_video("v3", limit) == ranked.top_comments_for_video("v3", limit)
+
+
+#Heap sonuçları her adımda sorted() ile aynı olmalı (eşitlikte ekleme sırası)
+def test_leaderboard_matches_sorted_reports():
+    rng = random.Random(18)
+    manager = InteractionManager()
+    leaderboard = CommentLeaderboard()
+    manager.attach(leaderboard)
+    for n in range(600):
+        manager.add_interaction(CommentInteraction(f"c{n}", "u", f"v{n % 12}", "x" * rng.randint(1, 60)))
+    comments = manager.get_comments()
+    for step in range(4000):
+        c = rng.choice(comments)
+        k = rng.random()
+        if k < 0.4:
+            c.add_like()
+        elif k < 0.6:
+            c.add_dislike()
+        elif k < 0.75:
+            c.add_reply()
+        elif k < 0.85:
+            c.toggle_like()
+        elif k < 0.9:
+            c.edit_comment("y" * rng.randint(1, 80))
+        elif k < 0.93:
+            manager.remove_interaction(c.interaction_id)
+        if step % 400 == 0:
+            manager.vacuum_all()
+            comments = manager.get_comments()
+            assert_matches_sort(manager, leaderboard)
+    assert_matches_sort(manager, leaderboard)
+
+    manager.clear_all()
+    assert len(leaderboard) == 0 and leaderboard.top() == []
+
+
+def test_untracked_metric_and_unknown_video():
+    leaderboard = CommentLeaderboard.from_interactions(
+        [CommentInteraction("c1", "u", "v1", "selam")], metrics=("score",)
+    )
+    assert [c.interaction_id for c in leaderboard.top("score")] == ["c1"]
+    assert leaderboard.top("score", video_id="yok") == []
+    with pytest.raises(ValueError):
+        leaderboard.top("longest")
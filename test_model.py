@@ -0,0 +1,93 @@
+import pytest
+
+from interactions.base import CodeTable, STATUS
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction, LIKE_TYPES
+from interactions.subscription import SubscriptionInteraction
+
+
+def test_objects_use_slots():
+    for i in (
+        CommentInteraction("c1", "u", "v", "selam"),
+        LikeInteraction("l1", "u", "v", "video"),
+        SubscriptionInteraction("s1", "u", "ch"),
+    ):
+        assert not hasattr(i, "__dict__")
+
+
+def test_unknown_values_are_not_registered():
+    size = len(LIKE_TYPES), len(STATUS)
+    like = LikeInteraction("l1", "u", "v", "video", "superlike")
+    like.status = "archived"
+    assert like.like_type == "superlike"
+    assert like.status == "archived"
+    assert not like.validate()
+    assert (len(LIKE_TYPES), len(STATUS)) == size
+
+    like.like_type = "like"
+    like.set_status("active")
+    assert like.validate()
+    assert like.to_dict()["like_type"] == "like"
+
+
+def test_extendable_table_assigns_codes():
+    table = CodeTable(extendable=True)
+    assert table.code("a") == 0 and table.code("b") == 1 and table.code("a") == 0
+    assert table.value(1) == "b"
+    assert table.find("c") == -1 and len(table) == 2
+
+
+def test_flags_are_lazy_and_settable():
+    comment = CommentInteraction("c1", "u", "v", "selam")
+    assert comment.to_dict()["flags"] == []
+    assert comment._flags is None
+
+    manager = InteractionManager()
+    manager.add_interaction(comment)
+    comment.flags = ["spam"]
+    assert comment.is_flagged()
+    assert manager.get_flagged_comments() == [comment]
+    comment.flags = []
+    assert not comment.is_flagged()
+    assert manager.get_flagged_comments() == []
+
+    restored = CommentInteraction.from_dict({**comment.to_dict(), "flags": ["spam", "link"]})
+    assert restored.flags == ["spam", "link"]
+
+
+#flags kopya döner; yalnızca bildirimli yollar bayrakları değiştirir
+def test_flags_getter_returns_copy():
+    manager = InteractionManager()
+    comment = CommentInteraction("c1", "u", "v", "selam")
+    manager.add_interaction(comment)
+    comment.flags.append("spam")
+    assert not comment.is_flagged() and comment._flags is None
+    comment.add_flag("spam")
+    comment.flags.clear()
+    assert comment.flags == ["spam"]
+    assert manager.get_flagged_comments() == [comment]
+
+
+def test_type_setters_notify():
+    changes = []
+    like = LikeInteraction("l1", "u", "v1")
+    sub = SubscriptionInteraction("s1", "u", "ch")
+    for i in (like, sub):
+        i.add_observer(lambda obj, field, old, new: changes.append((field, old, new)))
+    like.target_type = "comment"
+    like.target_type = "comment"
+    sub.action_type = "unsubscribe"
+    assert changes == [("target_type", "video", "comment"), ("action_type", "subscribe", "unsubscribe")]
+
+
+def test_table_ignores_unknown_codes():
+    pytest.importorskip("numpy")
+    from interactions.table import InteractionTable
+
+    odd = LikeInteraction("l1", "u", "v", "video", "superlike")
+    odd.status = "archived"
+    table = InteractionTable.from_interactions([odd, LikeInteraction("l2", "u", "v", "video")])
+    assert table.count_by_status() == {"active": 1, "deleted": 0, "flagged": 0}
+    assert table.count_like_types() == {"like": 1, "dislike": 0}
+    assert table.likes_by_target("playlist") == {}
@@ -0,0 +1,58 @@
+import pytest
+
+from interactions.notifications import NotificationFanout, CountingSink
+from interactions.subscribers import SubscriberTable
+from interactions.subscription import SubscriptionInteraction
+
+LEVELS = ("all", "personalized", "none")
+TIERS = ("free", "basic", "premium")
+
+
+def table(count: int = 3000) -> SubscriberTable:
+    result = SubscriberTable()
+    for n in range(count):
+        sub = SubscriptionInteraction(f"s{n}", f"u{n}", "big", "subscribe", LEVELS[n % 3])
+        sub.tier = TIERS[n % 3]
+        result.add(sub)
+    for n in range(10):
+        result.add(SubscriptionInteraction(f"x{n}", f"u{n}", "small", "subscribe", "none"))
+    return result
+
+
+#Liste yerine sınırlı kuyruk; toplam alıcı sayısı tam olmalı
+def test_publish_reaches_every_notified_subscriber():
+    fanout = NotificationFanout(table(), batch_size=128, workers=3)
+    try:
+        report = fanout.publish("big", {"video": "v1"})
+        expected = sum(1 for n in range(3000) if n % 3 != 2)
+        assert report["recipients"] == fanout.sink.delivered == expected
+        assert report["batches"] == fanout.sink.batches == -(-expected // 128)
+        assert report["subscribers"] == 3000
+        assert fanout.publish("small", {})["recipients"] == 0
+    finally:
+        fanout.close()
+
+
+def test_tier_and_personalized_filters():
+    subscribers = table()
+    fanout = NotificationFanout(subscribers, sink=CountingSink(), batch_size=50)
+    try:
+        report = fanout.publish("big", {}, tiers=["basic"])
+        assert report["recipients"] == sum(1 for n in range(3000) if n % 3 == 1)
+        assert list(fanout.recipients("big", {}, levels=["all"]))[:2] == ["u0", "u3"]
+    finally:
+        fanout.close()
+
+    picky = NotificationFanout(subscribers, personalized=lambda user, payload: user.endswith("1"))
+    try:
+        report = picky.publish("big", {})
+        assert report["recipients"] == sum(
+            1 for n in range(3000) if n % 3 == 0 or (n % 3 == 1 and str(n).endswith("1"))
+        )
+    finally:
+        picky.close()
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        NotificationFanout(SubscriberTable(), batch_size=0)
@@ -0,0 +1,113 @@
+import random
+from datetime import datetime, timedelta
+
+from interactions.manager import InteractionManager
+from interactions.reactions import ReactionStore
+from interactions.reports import InteractionReport
+from interactions.like import LikeInteraction
+
+T0 = datetime(2024, 5, 1, 12, 0)
+
+
+def like(interaction_id: str, user: str, target: str, like_type: str = "like", minutes: int = 0):
+    i = LikeInteraction(interaction_id, user, target, "video", like_type)
+    i.created_at = T0 + timedelta(minutes=minutes)
+    return i
+
+
+#Beklenen durum: her (kullanıcı, hedef) için aktif ve geçerli en yeni tepki (eşitlikte son eklenen)
+def expected_reactions(likes):
+    latest = {}
+    for order, i in enumerate(likes):
+        if not i.is_active() or i.like_type not in ("like", "dislike"):
+            continue
+        key = (i.user_id, i.target_type, i.target_id)
+        rank = (i.created_ts, order)
+        if key not in latest or rank >= latest[key][0]:
+            latest[key] = (rank, i.like_type)
+    return {key: value for key, (_, value) in latest.items()}
+
+
+def test_direct_upserts():
+    store = ReactionStore()
+    assert store.like("u1", "v1") and not store.like("u1", "v1")
+    assert store.dislike("u1", "v1")
+    assert store.counts("v1") == {"likes": 0, "dislikes": 1}
+    assert store.toggle("u1", "v1", like_type="dislike") is None
+    assert store.counts("v1") == {"likes": 0, "dislikes": 0}
+    assert store.toggle("u2", "v1") == "like" and store.likes_by_video() == {"v1": 1}
+
+
+def test_latest_reaction_wins_and_deletes_fall_back():
+    manager = InteractionManager()
+    store = ReactionStore()
+    manager.attach(store)
+    old = like("l1", "u1", "v1", "like", minutes=0)
+    new = like("l2", "u1", "v1", "dislike", minutes=5)
+    manager.add_interaction(old)
+    manager.add_interaction(new)
+    assert store.get_reaction("u1", "v1") == "dislike"
+
+    #Yeni tepki silinince önceki aktif tepkiye dönülür
+    new.mark_as_deleted()
+    assert store.get_reaction("u1", "v1") == "like"
+    assert store.counts("v1") == {"likes": 1, "dislikes": 0}
+
+    #Eski tepkinin geri yüklenmesi yenisini ezmez
+    new.restore()
+    old.mark_as_deleted()
+    old.restore()
+    assert store.get_reaction("u1", "v1") == "dislike"
+    assert store.counts("v1") == {"likes": 0, "dislikes": 1}
+
+    manager.vacuum_all()
+    manager.clear_all()
+    assert len(store) == 0
+
+
+def test_invalid_like_type_is_skipped():
+    manager = InteractionManager()
+    store = ReactionStore()
+    manager.attach(store)
+    odd = like("l1", "u1", "v1", "superlike")
+    manager.add_interaction(odd)
+    assert manager.get_by_id("l1") is odd
+    assert store.get_reaction("u1", "v1") is None and store.counts("v1") == {"likes": 0, "dislikes": 0}
+    odd.like_type = "like"
+    assert store.counts("v1") == {"likes": 1, "dislikes": 0}
+
+
+def test_store_matches_recomputation():
+    rng = random.Random(16)
+    manager = InteractionManager()
+    store = ReactionStore()
+    manager.attach(store)
+    likes = []
+    for n in range(1500):
+        i = like(f"l{n}", f"u{rng.randint(0, 9)}", f"v{rng.randint(0, 4)}",
+                 rng.choice(["like", "dislike", "superlike"]), minutes=rng.randint(0, 50))
+        manager.add_interaction(i)
+        likes.append(i)
+        o = rng.choice(likes)
+        k = rng.random()
+        if k < 0.2:
+            o.set_status(rng.choice(["active", "deleted", "flagged"]))
+        elif k < 0.35:
+            o.toggle()
+        elif k < 0.4:
+            o.created_at = T0 + timedelta(minutes=rng.randint(0, 50))
+        elif k < 0.42:
+            manager.vacuum_all()
+            likes = [i for i in likes if i in manager.interactions]
+        elif k < 0.47:
+            o.target_type = rng.choice(["video", "comment"])
+        expected = expected_reactions(manager.interactions)
+        assert store._reactions == expected
+
+    tallies = {}
+    for (_, target_type, target_id), value in expected_reactions(manager.interactions).items():
+        tally = tallies.setdefault((target_type, target_id), [0, 0])
+        tally[0 if value == "like" else 1] += 1
+    assert store.tallies() == {key: tuple(value) for key, value in tallies.items()}
+    report = InteractionReport(manager.interactions, reactions=store)
+    assert report.likes_by_video() == {key[1]: sum(value) for key, value in tallies.items() if key[0] == "video"}
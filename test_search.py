@@ -0,0 +1,42 @@
+import random
+
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.comment import CommentInteraction
+
+WORDS = "harika video http link çok güzel ses kalite düşük merhaba dünya ağ şık İzmir ılık".split()
+
+
+def build(seed: int = 9):
+    rng = random.Random(seed)
+    indexed = InteractionManager(text_index=True)
+    plain = InteractionManager()
+    for n in range(2000):
+        c = CommentInteraction(f"c{n}", "u", "v", " ".join(rng.choices(WORDS, k=rng.randint(1, 10))))
+        indexed.add_interaction(c)
+        plain.add_interaction(c)
+    #Düzenlenen yorumlar indekste güncellenir
+    for c in rng.sample(indexed.interactions, 200):
+        c.edit_comment(" ".join(rng.choices(WORDS, k=3)))
+    return indexed, plain
+
+
+def test_search_matches_substring_scan():
+    indexed, plain = build()
+    for keyword in WORDS + ["ha", "a", "rika vid", "http", "xyz", ""]:
+        assert indexed.search_comments(keyword) == plain.search_comments(keyword), keyword
+
+
+def test_turkish_case_folding():
+    indexed, plain = build(10)
+    assert indexed.search_comments("HARİKA") == plain.search_comments("harika")
+    assert indexed.search_comments("IlIK") == plain.search_comments("ılık")
+    assert indexed.search_comments("izmir") == plain.search_comments("İzmir")
+
+
+def test_report_keyword_queries():
+    indexed, _ = build(11)
+    fast = InteractionReport(indexed.interactions, search_index=indexed.search_index)
+    slow = InteractionReport(indexed.interactions)
+    assert fast.comments_with_links() == slow.comments_with_links()
+    assert fast.keyword_frequency("güzel") == slow.keyword_frequency("güzel")
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from interactions.manager import InteractionManager
+from interactions.service import AsyncIngestService
+
+
+def like(n: int):
+    return ("like", f"l{n}", "u", f"v{n % 9}", "video", "like" if n % 3 else "dislike")
+
+
+#Belirli kayıtlarda hata veren bileşen (ör. dolu disk)
+class FailingComponent:
+    def __init__(self, bad_ids):
+        self.bad_ids = set(bad_ids)
+
+    def add(self, interaction) -> None:
+        if interaction.interaction_id in self.bad_ids:
+            raise OSError("disk dolu")
+
+    def update(self, interaction, field, old, new) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+def test_batches_respect_queue_bound():
+    async def main():
+        manager = InteractionManager()
+        async with AsyncIngestService(manager, max_queue=100, batch_size=32, max_latency=0.01) as svc:
+            async def producer(p):
+                for n in range(200):
+                    await svc.submit(like(p * 1000 + n))
+            await asyncio.gather(*(producer(p) for p in range(10)))
+            await svc.flush()
+            metrics = svc.metrics()
+            assert metrics["max_queue_depth"] <= 100
+            assert metrics["accepted"] == 2000 and metrics["failed_batches"] == 0
+            await svc.submit(("comment", "c1", "u", "v", "tek"))
+            await svc.flush()
+            assert svc.metrics()["last_batch_size"] == 1
+        return manager
+
+    assert asyncio.run(main()).get_total_count() == 2001
+
+
+def test_failed_batches_do_not_stop_the_worker():
+    async def main():
+        manager = InteractionManager()
+        manager.attach(FailingComponent({"l5", "l300"}))
+        svc = AsyncIngestService(manager, max_queue=50, batch_size=20, max_latency=0.01)
+        await svc.start()
+        #Kuyruk sınırından fazla kayıt: işçi ölseydi burada sonsuza dek beklenirdi
+        await asyncio.wait_for(svc.submit_many(like(n) for n in range(400)), 5)
+        with pytest.raises(ValueError) as error:
+            await asyncio.wait_for(svc.flush(), 5)
+        assert isinstance(error.value.__cause__, OSError)
+        metrics = svc.metrics()
+        assert metrics["failed_batches"] == 2 and metrics["failed_rows"] >= 2
+        assert "disk dolu" in metrics["last_error"]
+        #Başarısız partiler manager'da yarım kalmaz
+        assert manager.get_total_count() == metrics["accepted"] == 400 - metrics["failed_rows"]
+        assert manager.get_by_id("l5") is None and manager.get_by_id("l300") is None
+        assert sum(manager.count_by_type().values()) == manager.get_total_count()
+
+        #Bildirilen hatalar tekrar yükseltilmez; servis çalışmaya devam eder
+        await svc.submit(like(1000))
+        await asyncio.wait_for(svc.flush(), 5)
+        await asyncio.wait_for(svc.stop(), 5)
+        return manager
+
+    manager = asyncio.run(main())
+    assert manager.get_by_id("l1000") is not None
+
+
+def test_stop_reports_unflushed_failures():
+    async def main():
+        manager = InteractionManager()
+        manager.attach(FailingComponent({"l0"}))
+        svc = AsyncIngestService(manager, batch_size=10, max_latency=0.01)
+        await svc.start()
+        await svc.submit_many(like(n) for n in range(10))
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(svc.stop(), 5)
+        assert svc.metrics()["failed_batches"] == 1
+        assert manager.get_total_count() == 0 and manager.count_by_type() == {}
+
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+import copy
+import pickle
+import random
+import zlib
+
+import pytest
+
+from interactions.sharding import ShardedInteractionManager, shard_of
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+
+
+def records(count: int = 3000):
+    rng = random.Random(15)
+    result = []
+    for n in range(count):
+        r = n % 3
+        user = f"u{n % 300}"
+        if r == 0:
+            result.append(("comment", f"c{n}", user, f"v{n % 50}", "metin " * (n % 7 + 1)))
+        elif r == 1:
+            result.append(("like", f"l{n}", user, f"v{n % 50}", "video", rng.choice(["like", "dislike"])))
+        else:
+            result.append(("subscription", f"s{n}", user, f"ch{n % 10}",
+                           rng.choice(["subscribe", "unsubscribe"])))
+    return result
+
+
+def test_pickled_interaction_leaves_observers_behind():
+    manager = InteractionManager()
+    for n in range(2000):
+        manager.add_interaction(LikeInteraction(f"l{n}", "u", "v"))
+    like = manager.get_by_id("l7")
+    data = pickle.dumps(like)
+    assert len(data) < 1000
+    restored = pickle.loads(data)
+    assert restored._observers == () and restored.to_dict() == like.to_dict()
+
+    comment = CommentInteraction("c1", "u", "v", "selam")
+    manager.add_interaction(comment)
+    comment.add_flag("spam")
+    clone = copy.copy(comment)
+    assert clone._observers == () and clone.flags == ["spam"]
+
+
+#Bölümleme PYTHONHASHSEED'den bağımsız olmalı
+def test_shard_of_is_stable():
+    assert shard_of("u1", 4) == 2
+    assert shard_of("video_9", 7) == zlib.crc32(b"video_9") % 7
+
+
+@pytest.mark.parametrize("key", ["user", "target"])
+def test_sharded_results_match_single_manager(key):
+    items = records()
+    ref = InteractionManager()
+    ref.add_interactions(items, workers=1)
+    report = InteractionReport(ref.interactions)
+    with ShardedInteractionManager(2, key=key) as sharded:
+        sharded.add_interactions(items)
+        assert sharded.get_total_count() == ref.get_total_count()
+        assert sharded.count_by_type() == ref.count_by_type()
+        assert sharded.count_by_status() == ref.count_by_status()
+        expected = report.export_full_report()
+        actual = sharded.export_full_report()
+        for section in ("general", "comments", "likes", "subscriptions"):
+            for name, value in expected[section].items():
+                if name != "generated_at":
+                    assert actual[section][name] == pytest.approx(value), (section, name)
+        assert sharded.likes_by_video() == report.likes_by_video()
+        assert sharded.subscribers_by_channel() == report.subscribers_by_channel()
+        assert sorted(i.interaction_id for i in sharded.get_by_user("u7")) == sorted(
+            i.interaction_id for i in ref.get_by_user("u7")
+        )
+
+        #Okumalar kopyadır; değişiklik call() ile shard üzerinde yapılır
+        copy_c3 = sharded.get_by_id("c3")
+        assert copy_c3._observers == ()
+        sharded.call("c3", "add_like")
+        assert copy_c3.like_count == 0 and sharded.get_by_id("c3").like_count == 1
+        sharded.add_interaction(CommentInteraction("cx", "u1", "v1", "selam"))
+        assert sharded.get_total_count() == ref.get_total_count() + 1
+        for _ in range(30):
+            sharded.call("c0", "add_like")
+        assert sharded.top_comments(1)[0]["interaction_id"] == "c0"
+
+
+#Hata veren shard'dan sonra diğer yanıtlar okunmuş olmalı; sonraki çağrılar kaymaz
+def test_shard_error_does_not_desync_replies():
+    with ShardedInteractionManager(3) as sharded:
+        sharded.add_interactions(records(60))
+        total = sharded.get_total_count()
+        #c6 ilk shard'dadır; kalan iki shard'ın yanıtları hatadan sonra gelir
+        assert sharded.shard_for(("comment", "c6", "u6", "v6")) == 0
+        with pytest.raises(ValueError):
+            sharded.call("c6", "edit_comment", "")
+        assert sharded.get_total_count() == total
+        assert sharded.count_by_type()["CommentInteraction"] == 20
+        with pytest.raises(ValueError):
+            sharded.call("yok", "add_like")
+        sharded.add_interaction(CommentInteraction("cx", "u1", "v1", "selam"))
+        assert sharded.get_total_count() == total + 1
+        assert sharded.get_by_id("cx").comment_text == "selam"
@@ -0,0 +1,152 @@
+import random
+
+import pytest
+
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.sketches import HyperLogLog, SpaceSaving, InteractionSketches
+
+
+def test_sparse_hll_switches_to_dense_with_same_estimates():
+    sparse = HyperLogLog(12)
+    for n in range(20):
+        sparse.add(f"u{n}")
+    assert sparse.is_sparse() and sparse.count() == 20
+    assert len(sparse.to_bytes()) < 100
+
+    #Seyrek ve yoğun gösterim aynı tahmini verir
+    dense = HyperLogLog.from_bytes(sparse.to_bytes())
+    dense._densify()
+    assert not dense.is_sparse() and dense.count() == sparse.count()
+
+    for n in range(20, 50000):
+        sparse.add(f"u{n}")
+    assert not sparse.is_sparse()
+    assert len(sparse.to_bytes()) == 1 + 4096
+    assert abs(sparse.count() - 50000) / 50000 < 0.05
+
+
+def test_hll_merge_across_representations():
+    a, b, c = HyperLogLog(10), HyperLogLog(10), HyperLogLog(10)
+    for n in range(30):
+        a.add(n)
+    for n in range(20, 5000):
+        b.add(n)
+    for n in range(10, 40):
+        c.add(n)
+    assert a.is_sparse() and not b.is_sparse()
+    union = HyperLogLog(10)
+    for n in range(40):
+        union.add(n)
+    assert HyperLogLog.from_bytes(a.to_bytes()).merge(c).to_bytes() == union.to_bytes()
+    merged = HyperLogLog.from_bytes(a.to_bytes()).merge(b)
+    assert merged.count() == HyperLogLog.from_bytes(b.to_bytes()).merge(a).count()
+    with pytest.raises(ValueError):
+        a.merge(HyperLogLog(11))
+
+
+#Heap ile seçilen kurban, en küçük sayacı tarayan yöntemle aynı sayıya sahip olmalı
+def test_space_saving_evicts_minimum():
+    rng = random.Random(20)
+    sketch = SpaceSaving(50)
+    counts, errors = {}, {}
+    for _ in range(20000):
+        key = f"k{min(int(rng.expovariate(0.02)), 500)}"
+        step = rng.randint(1, 3)
+        sketch.add(key, step)
+        if key in counts:
+            counts[key] += step
+        elif len(counts) < 50:
+            counts[key], errors[key] = step, 0
+        else:
+            floor = min(counts.values())
+            assert floor == min(c for k, c in counts.items() if k not in sketch._counts)
+            victim = next(k for k in counts if k not in sketch._counts)
+            del counts[victim], errors[victim]
+            counts[key], errors[key] = floor + step, floor
+    assert sketch._counts == counts and sketch._errors == errors
+    restored = SpaceSaving.from_bytes(sketch.to_bytes())
+    assert restored.top(10) == sketch.top(10)
+    restored.add("yeni")
+    assert len(restored._counts) == 50 and len(restored._heap) == 50
+    with pytest.raises(ValueError):
+        sketch.add("k1", 0)
+
+
+def test_interaction_sketches_roundtrip():
+    manager = InteractionManager()
+    sketches = InteractionSketches(precision=10, video_channel=lambda v: "ch" if v != "v9" else None)
+    manager.attach(sketches)
+    for n in range(3000):
+        manager.add_interaction(CommentInteraction(f"c{n}", f"u{n % 700}", f"v{n % 10}", "x"))
+        manager.add_interaction(LikeInteraction(f"l{n}", f"u{n % 40}", f"v{n % 10}"))
+    data = sketches.to_bytes()
+    assert not data.startswith(b"\x80")
+    restored = InteractionSketches.from_bytes(data)
+    for video in ("v0", "v9", "yok"):
+        assert restored.unique_commenters(video) == sketches.unique_commenters(video)
+        assert restored.unique_likers(video) == sketches.unique_likers(video)
+        assert restored.estimate_likes(video) == sketches.estimate_likes(video)
+    likers = HyperLogLog(10)
+    #v9'un kanalı yok; u9, u19, u29, u39 yalnızca v9'u beğenir
+    for n in range(40):
+        if n % 10 != 9:
+            likers.add(f"u{n}")
+    assert restored.unique_channel_likers("ch") == sketches.unique_channel_likers("ch") == likers.count()
+    assert restored.top_targets(3) == sketches.top_targets(3)
+    assert restored.to_bytes() == data
+
+
+def test_space_saving_discard():
+    sketch = SpaceSaving(3)
+    for key, count in (("a", 5), ("b", 2), ("c", 4)):
+        sketch.add(key, count)
+    sketch.discard("a", 4)
+    sketch.discard("yok")
+    #Azalan sayaç heap'te en küçük olarak bulunur
+    sketch.add("d")
+    assert sketch.top(3) == [("c", 4, 0), ("b", 2, 0), ("d", 2, 1)]
+    sketch.discard("b", 2)
+    assert "b" not in sketch._counts and len(sketch._heap) == 2
+    with pytest.raises(ValueError):
+        sketch.discard("c", 0)
+
+
+#Beğeni sayıları yalnızca aktif "like" kayıtlarını yansıtır
+def test_like_counts_follow_updates():
+    rng = random.Random(21)
+    manager = InteractionManager()
+    sketches = InteractionSketches(precision=10, heavy_hitters=64)
+    manager.attach(sketches)
+    likes = []
+    for n in range(1500):
+        like = LikeInteraction(f"l{n}", f"u{n % 90}", f"v{rng.randrange(30)}", rng.choice(["video", "comment"]),
+                               rng.choice(["like", "dislike"]))
+        if rng.random() < 0.05:
+            like.mark_as_deleted()
+        manager.add_interaction(like)
+        likes.append(like)
+        other = rng.choice(likes)
+        k = rng.random()
+        if k < 0.1:
+            other.toggle()
+        elif k < 0.15:
+            other.mark_as_deleted() if other.is_active() else other.restore()
+        elif k < 0.17:
+            other.set_status("flagged") if other.is_active() else other.restore()
+        elif k < 0.2:
+            other.target_type = rng.choice(["video", "comment"])
+    manager.purge([like.interaction_id for like in likes if like.is_deleted()])
+
+    expected = {}
+    for like in manager.get_likes():
+        if like.is_active() and like.is_like():
+            key = (like.target_type, like.target_id)
+            expected[key] = expected.get(key, 0) + 1
+    for n in range(30):
+        for kind in ("video", "comment"):
+            assert sketches.estimate_likes(f"v{n}", kind) == expected.get((kind, f"v{n}"), 0)
+    top = {(t["target_type"], t["target_id"]): t["likes"] for t in sketches.top_targets(64)}
+    assert top == expected
+    assert sketches.like_counts.total == sum(expected.values())
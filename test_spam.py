@@ -0,0 +1,69 @@
+import random
+
+from interactions.spam import is_spam, SpamRule, SpamScorer
+from interactions.comment import CommentInteraction
+
+ALPHABET = [" ", "a", "A", "İ", "I", "h", "t", "p", "\n", "\t", "x", "ş", "HTTP", "http", "  "]
+EDGE_CASES = [" " * 7, " " * 6 + "a", "a" * 8, "a" * 7, "x" + " " * 7, "x" + " " * 8, "\n" * 8, "İ" * 4, "İ" * 8]
+
+
+#Önceki karakter döngüsüyle yazılmış kontrol
+def reference(text: str) -> bool:
+    lowered = text.lower()
+    if lowered.count("http") > 2:
+        return True
+    if len(text) > 100 and len(text.split()) < 5:
+        return True
+    repeated = 0
+    last = " "
+    for c in lowered:
+        if c == last:
+            repeated += 1
+            if repeated > 6:
+                return True
+        else:
+            repeated = 0
+            last = c
+    return False
+
+
+def texts(count: int = 20000):
+    rng = random.Random(21)
+    result = []
+    for _ in range(count):
+        size = rng.choice([3, 10, 50, 120, 200])
+        result.append("".join(
+            rng.choice(ALPHABET) if rng.random() < 0.7 else rng.choice(ALPHABET) * rng.randint(1, 9)
+            for _ in range(rng.randint(0, size))
+        ))
+    return result + EDGE_CASES
+
+
+def test_batch_scoring_matches_reference():
+    items = texts()
+    expected = [reference(t) for t in items]
+    scorer = SpamScorer()
+    assert scorer.score(items) == expected
+    assert [is_spam(t) for t in items] == expected
+    assert [CommentInteraction("c", "u", "v", t).detect_basic_spam() for t in EDGE_CASES] == expected[-len(EDGE_CASES):]
+    stats = scorer.stats()
+    assert stats["scored"] == len(items) and sum(stats["hits"].values()) == sum(expected)
+
+
+def test_parallel_scoring_merges_stats():
+    items = texts(3000)
+    serial = SpamScorer()
+    parallel = SpamScorer()
+    assert parallel.score_parallel(items, 2) == serial.score(items)
+    assert parallel.stats()["hits"] == serial.stats()["hits"]
+    parallel.reset()
+    assert parallel.stats()["scored"] == 0
+
+
+#Toplu fonksiyonu olmayan kural metin başına check ile uygulanır
+def test_custom_rule_without_batch():
+    rule = SpamRule("caps", lambda text, lowered: text.isupper())
+    scorer = SpamScorer([rule])
+    assert scorer.score(["SELAM", "selam", "BAĞIR!"]) == [True, False, True]
+    assert scorer.stats()["hits"] == {"caps": 2}
+    assert is_spam("BAĞIR", [rule]) and not is_spam("http http http", [rule])
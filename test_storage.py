@@ -0,0 +1,94 @@
+import json
+import os
+import random
+
+from interactions.storage import InteractionStore, FRAME_HEADER
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+
+def mutate(manager, rng: random.Random, count: int, tag: str) -> None:
+    for k in range(count):
+        i = [
+            CommentInteraction(f"c{k}-{tag}", f"u{k % 9}", "v", "merhaba dünya"),
+            LikeInteraction(f"l{k}-{tag}", "u", "v"),
+            SubscriptionInteraction(f"s{k}-{tag}", "u", "ch"),
+        ][k % 3]
+        manager.add_interaction(i)
+        o = rng.choice(manager.interactions)
+        if isinstance(o, CommentInteraction):
+            rng.choice([o.add_like, o.add_reply, lambda: o.edit_comment("düzenlendi"),
+                        lambda: o.add_flag("f"), o.pin])()
+        elif isinstance(o, LikeInteraction):
+            o.toggle()
+        else:
+            rng.choice([lambda: o.upgrade_tier("premium"), lambda: o.set_notification_level("none"),
+                        o.process])()
+        if rng.random() < 0.05:
+            manager.remove_interaction(o.interaction_id)
+
+
+def dump(manager):
+    return [i.to_dict() for i in manager.interactions]
+
+
+def test_snapshot_and_log_round_trip(tmp_path):
+    rng = random.Random(12)
+    store = InteractionStore(str(tmp_path))
+    manager = store.recover()
+    mutate(manager, rng, 600, "a")
+    store.snapshot()
+    mutate(manager, rng, 400, "b")
+    expected = dump(manager)
+    counts = manager.count_by_status(), manager.count_likes()
+    store.close()
+
+    restored = InteractionStore(str(tmp_path)).recover()
+    assert dump(restored) == expected
+    assert (restored.count_by_status(), restored.count_likes()) == counts
+
+
+def test_torn_tail_is_truncated(tmp_path):
+    store = InteractionStore(str(tmp_path))
+    manager = store.recover()
+    mutate(manager, random.Random(13), 100, "a")
+    expected = dump(manager)
+    store.close()
+    log = sorted(name for name in os.listdir(tmp_path) if name.startswith("wal"))[-1]
+    with open(tmp_path / log, "ab") as fh:
+        fh.write(b"\x10\x00\x00\x00yarim")
+
+    store = InteractionStore(str(tmp_path))
+    manager = store.recover()
+    assert dump(manager) == expected
+    manager.add_interaction(LikeInteraction("sonra", "u", "v"))
+    store.close()
+    assert InteractionStore(str(tmp_path)).recover().get_by_id("sonra") is not None
+
+
+def test_frames_are_json(tmp_path):
+    store = InteractionStore(str(tmp_path))
+    manager = store.recover()
+    manager.add_interaction(CommentInteraction("c1", "u", "v", "çok güzel"))
+    store.close()
+    with open(tmp_path / "wal-00000000.log", "rb") as fh:
+        length, _ = FRAME_HEADER.unpack(fh.read(FRAME_HEADER.size))
+        event = json.loads(fh.read(length).decode("utf-8"))
+    assert event[0] == "add" and event[2]["comment_text"] == "çok güzel"
+
+
+def test_updates_reach_the_right_duplicate(tmp_path):
+    store = InteractionStore(str(tmp_path))
+    manager = store.recover()
+    first = CommentInteraction("c1", "u", "v", "ilk")
+    second = CommentInteraction("c1", "u", "v", "ikinci")
+    manager.add_interaction(first)
+    manager.add_interaction(second)
+    second.edit_comment("ikinci düzenlendi")
+    second.add_like()
+    store.close()
+
+    restored = InteractionStore(str(tmp_path)).recover()
+    assert [c.comment_text for c in restored.get_all_by_id("c1")] == ["ilk", "ikinci düzenlendi"]
+    assert [c.like_count for c in restored.get_all_by_id("c1")] == [0, 1]
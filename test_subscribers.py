@@ -0,0 +1,103 @@
+import random
+
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.subscribers import SubscriberTable
+from interactions.subscription import SubscriptionInteraction
+
+LEVELS = ("all", "personalized", "none")
+
+
+def subscription(interaction_id: str, user: str, channel: str, action: str = "subscribe", level: str = "all"):
+    sub = SubscriptionInteraction(interaction_id, user, channel, action, level)
+    sub.process()
+    return sub
+
+
+#Düz olay taraması: (kullanıcı, kanal) başına son geçerli olay
+def scan(interactions):
+    latest = {}
+    for i in interactions:
+        if isinstance(i, SubscriptionInteraction) and i.status not in ("deleted", "flagged"):
+            latest[(i.user_id, i.channel_id)] = i
+    subscribed = {key: sub for key, sub in latest.items() if sub.is_subscribed()}
+    channels = {}
+    levels = {}
+    for (user, channel), sub in subscribed.items():
+        channels.setdefault(channel, set()).add(user)
+        channel_levels = levels.setdefault(channel, {})
+        channel_levels[sub.notification_level] = channel_levels.get(sub.notification_level, 0) + 1
+    return channels, levels
+
+
+def assert_matches_scan(manager: InteractionManager, table: SubscriberTable) -> None:
+    channels, levels = scan(manager.interactions)
+    assert {ch: set(table.subscriber_ids(ch)) for ch in table.subscribers_by_channel()} == channels
+    assert {ch: table.level_counts(ch) for ch in channels} == levels
+    assert len(table) == sum(len(users) for users in channels.values())
+
+
+def test_restored_subscription_is_counted():
+    manager = InteractionManager(subscriber_table=True)
+    sub = subscription("s1", "u1", "ch")
+    manager.add_interaction(sub)
+    sub.mark_as_deleted()
+    assert manager.subscribers.subscriber_count("ch") == 0
+    sub.restore()
+    assert sub.is_subscribed()
+    assert manager.subscribers.subscriber_count("ch") == 1
+    assert manager.subscribers.is_subscribed("u1", "ch")
+
+
+def test_deleting_latest_falls_back_to_previous_event():
+    manager = InteractionManager(subscriber_table=True)
+    first = subscription("s1", "u1", "ch", level="none")
+    second = subscription("s2", "u1", "ch", level="all")
+    manager.add_interaction(first)
+    manager.add_interaction(second)
+    assert manager.subscribers.level_counts("ch") == {"all": 1}
+    second.mark_as_deleted()
+    assert manager.subscribers.subscriber_count("ch") == 1
+    assert manager.subscribers.get("u1", "ch") is first
+    assert manager.subscribers.level_counts("ch") == {"none": 1}
+
+    #Sonradan gelen abonelik iptali önceki aboneliği geçersiz kılar
+    manager.add_interaction(subscription("s3", "u1", "ch", action="unsubscribe"))
+    assert not manager.subscribers.is_subscribed("u1", "ch")
+
+
+def test_table_matches_event_scan():
+    rng = random.Random(17)
+    manager = InteractionManager(subscriber_table=True)
+    table = manager.subscribers
+    subs = []
+    for n in range(2000):
+        sub = subscription(f"s{n}", f"u{rng.randrange(20)}", f"ch{rng.randrange(4)}",
+                           rng.choice(["subscribe", "unsubscribe"]), rng.choice(LEVELS))
+        manager.add_interaction(sub)
+        subs.append(sub)
+        other = rng.choice(subs)
+        k = rng.random()
+        if k < 0.15:
+            other.mark_as_deleted()
+        elif k < 0.3:
+            other.restore()
+        elif k < 0.35:
+            other.set_status("flagged")
+        elif k < 0.45:
+            other.set_notification_level(rng.choice(LEVELS))
+        elif k < 0.5:
+            other.process()
+        elif k < 0.51:
+            manager.vacuum_all()
+            subs = list(manager.get_subscriptions())
+        elif k < 0.56:
+            other.action_type = rng.choice(["subscribe", "unsubscribe"])
+        if n % 50 == 0:
+            assert_matches_scan(manager, table)
+    assert_matches_scan(manager, table)
+
+    report = InteractionReport(manager.interactions, subscribers=table)
+    assert report.subscribers_by_channel() == table.subscribers_by_channel()
+    manager.clear_all()
+    assert len(table) == 0
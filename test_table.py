@@ -0,0 +1,90 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.statistics import InteractionStatistics
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+NOW = datetime(2024, 5, 1, 12, 0)
+
+
+def clock() -> datetime:
+    return NOW
+
+
+def build(seed: int = 5) -> InteractionManager:
+    rng = random.Random(seed)
+    manager = InteractionManager(columnar=True)
+    objs = []
+    for n in range(3000):
+        r = rng.random()
+        if r < 0.4:
+            i = CommentInteraction(f"c{n}", f"u{n % 50}", f"v{n % 30}", "w " * rng.randint(1, 40))
+        elif r < 0.8:
+            i = LikeInteraction(f"l{n}", "u", f"v{n % 30}", rng.choice(["video", "comment"]),
+                                rng.choice(["like", "dislike"]))
+        else:
+            i = SubscriptionInteraction(f"s{n}", "u", "ch")
+        i.created_at = NOW - timedelta(hours=rng.uniform(0, 24 * 10))
+        manager.add_interaction(i)
+        objs.append(i)
+    #Kolonların nesne değişikliklerini izlediği kontrol edilir
+    for _ in range(5000):
+        o = rng.choice(objs)
+        if isinstance(o, CommentInteraction):
+            rng.choice([
+                o.add_like, o.add_dislike, o.add_reply, o.toggle_like, o.remove_like,
+                lambda: o.add_flag("x"), o.clear_flags,
+                lambda: o.edit_comment("z" * rng.randint(1, 99)),
+            ])()
+        elif isinstance(o, LikeInteraction) and rng.random() < 0.5:
+            o.toggle()
+        elif isinstance(o, LikeInteraction) and rng.random() < 0.2:
+            o.target_type = rng.choice(["video", "comment"])
+        elif isinstance(o, SubscriptionInteraction) and rng.random() < 0.3:
+            o.action_type = rng.choice(["subscribe", "unsubscribe"])
+        else:
+            o.set_status(rng.choice(["active", "deleted", "flagged"]))
+    return manager
+
+
+def assert_same(x, y):
+    if isinstance(x, dict):
+        assert set(x) == set(y)
+        for key in x:
+            if key != "generated_at":
+                assert_same(x[key], y[key])
+    elif isinstance(x, float):
+        assert x == pytest.approx(y)
+    else:
+        assert x == y
+
+
+def test_report_matches_object_path():
+    manager = build()
+    plain = InteractionReport(manager.interactions, clock=clock)
+    columnar = InteractionReport(manager.interactions, table=manager.table, clock=clock)
+    for name in ("general_overview", "comment_overview", "like_overview", "comments_by_video",
+                 "likes_by_video", "classify_comments_by_score"):
+        assert_same(getattr(plain, name)(), getattr(columnar, name)())
+    assert plain.likes_by_target("comment") == columnar.likes_by_target("comment")
+    assert list(plain.daily_activity_map(10).items()) == list(columnar.daily_activity_map(10).items())
+    assert plain.interactions_last_hours(5) == columnar.interactions_last_hours(5)
+
+
+def test_statistics_match_object_path():
+    manager = build(6)
+    plain = InteractionStatistics(manager.interactions, clock=clock)
+    columnar = InteractionStatistics(manager.interactions, table=manager.table, clock=clock)
+    for name in ("count_by_type", "count_by_status", "total_comments", "flagged_comments",
+                 "popular_comments", "total_likes", "total_dislikes"):
+        assert getattr(plain, name)() == getattr(columnar, name)()
+    assert plain.average_comment_score() == pytest.approx(columnar.average_comment_score())
+    assert plain.interactions_last_days(3) == columnar.interactions_last_days(3)
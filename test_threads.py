@@ -0,0 +1,84 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.threads import CommentThreadIndex, THREAD_ORDERS
+
+
+def comment(n: int, video: str, parent: str | None = None, ts: int = 0) -> CommentInteraction:
+    c = CommentInteraction(f"c{n}", "u", video, "metin", parent)
+    c.created_at = datetime.fromtimestamp(1e9 + ts)
+    return c
+
+
+def walk(index: CommentThreadIndex, video: str, order: str, limit: int):
+    seen, cursor = [], None
+    while True:
+        page = index.thread_page(video, order, cursor, limit=limit, depth=0)
+        seen += [d["interaction_id"] for d in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+#Beklenen sıra: güncel anahtar, eşitlikte ekleme sırası
+def expected(manager: InteractionManager, video: str, order: str):
+    roots = [c for c in manager.get_comments()
+             if c.video_id == video and c.parent_comment_id is None and c.status != "deleted"]
+    key_of = THREAD_ORDERS[order]
+    return [c.interaction_id for c in sorted(roots, key=key_of)]
+
+
+def test_pages_follow_changing_keys():
+    rng = random.Random(19)
+    manager = InteractionManager()
+    index = CommentThreadIndex()
+    manager.attach(index)
+    ids = []
+    for n in range(1500):
+        parent = rng.choice(ids) if ids and rng.random() < 0.4 else None
+        video = f"v{n % 3}" if parent is None else manager.get_by_id(parent).video_id
+        manager.add_interaction(comment(n, video, parent, ts=rng.randint(0, 200)))
+        ids.append(f"c{n}")
+        c = manager.get_by_id(rng.choice(ids))
+        k = rng.random()
+        if k < 0.3:
+            c.add_like()
+        elif k < 0.4:
+            c.add_dislike()
+        elif k < 0.45:
+            c.created_at = datetime.fromtimestamp(1e9 + rng.randint(0, 200))
+        elif k < 0.5:
+            c.mark_as_deleted()
+        elif k < 0.52:
+            manager.remove_interaction(c.interaction_id)
+            ids.remove(c.interaction_id)
+        if n % 300 == 0:
+            manager.vacuum_all()
+            ids = [c.interaction_id for c in manager.get_comments()]
+    for order in THREAD_ORDERS:
+        for limit in (1, 7, 1000):
+            assert walk(index, "v1", order, limit) == expected(manager, "v1", order)
+
+
+def test_replies_and_render():
+    manager = InteractionManager()
+    index = CommentThreadIndex()
+    manager.attach(index)
+    manager.add_interaction(comment(0, "v", ts=0))
+    for n in range(1, 6):
+        manager.add_interaction(comment(n, "v", "c0", ts=n))
+    manager.get_by_id("c2").mark_as_deleted()
+    assert [c.interaction_id for c in index.replies("c0")] == ["c1", "c2", "c3", "c4", "c5"]
+    page = index.replies_page("c0", order="newest", limit=2)
+    assert [d["interaction_id"] for d in page["items"]] == ["c5", "c4"]
+    page = index.replies_page("c0", order="newest", cursor=page["next_cursor"], limit=2)
+    assert [d["interaction_id"] for d in page["items"]] == ["c3", "c1"] and page["next_cursor"] is None
+    root = index.thread_page("v", replies_per_thread=2)["items"][0]
+    assert [d["interaction_id"] for d in root["replies"]] == ["c1", "c3"] and root["more_replies"] == 2
+    assert index.replies_page("yok") == {"items": [], "next_cursor": None}
+    with pytest.raises(ValueError):
+        index.thread_page("v", order="rastgele")
@@ -0,0 +1,50 @@
+import random
+from datetime import datetime, timedelta
+
+from interactions.manager import InteractionManager
+from interactions.reports import InteractionReport
+from interactions.statistics import InteractionStatistics
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+
+NOW = datetime(2024, 5, 1, 12, 0)
+
+
+def clock() -> datetime:
+    return NOW
+
+
+def build(seed: int = 7) -> InteractionManager:
+    rng = random.Random(seed)
+    manager = InteractionManager()
+    for n in range(2000):
+        i = CommentInteraction(f"c{n}", "u", "v", "x") if n % 2 else LikeInteraction(f"l{n}", "u", "v")
+        i.created_at = NOW - timedelta(hours=rng.uniform(0, 24 * 10))
+        manager.add_interaction(i)
+    #Sonradan değişen zamanlar indekste yeniden sıralanır
+    for i in rng.sample(manager.interactions, 200):
+        i.created_at = NOW - timedelta(hours=rng.uniform(0, 24 * 10))
+    return manager
+
+
+def test_time_queries_match_linear_scan():
+    manager = build()
+    plain = InteractionReport(manager.interactions, clock=clock)
+    indexed = InteractionReport(manager.interactions, timeline=manager.timeline, clock=clock)
+    for hours in (1, 5, 30, 100):
+        assert plain.interactions_last_hours(hours) == indexed.interactions_last_hours(hours)
+    for days in (1, 3, 8):
+        assert plain.interactions_last_days(days) == indexed.interactions_last_days(days)
+    assert list(plain.daily_activity_map(9).items()) == list(indexed.daily_activity_map(9).items())
+    assert plain.top_interactions(7) == indexed.top_interactions(7)
+
+    stats = InteractionStatistics(manager.interactions, clock=clock)
+    indexed_stats = InteractionStatistics(manager.interactions, timeline=manager.timeline, clock=clock)
+    assert stats.daily_average(4) == indexed_stats.daily_average(4)
+
+
+def test_index_stays_sorted():
+    manager = build(8)
+    stamps = manager.timeline._ts
+    assert stamps == sorted(stamps)
+    assert len(stamps) == len(manager.interactions)
@@ -0,0 +1,106 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from interactions.manager import InteractionManager
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+from interactions.trending import TrendingEngine, TRENDING_WEIGHTS
+from interactions.reports import InteractionReport
+
+START = datetime(2026, 1, 1)
+
+
+#Her olayın ağırlığı şu anki zamana göre tek tek bozundurulur
+def brute_force(items, now: datetime, half_life: timedelta):
+    rate = math.log(2) / half_life.total_seconds()
+    videos, channels = {}, {}
+    for i in items:
+        if i.status == "deleted":
+            continue
+        if isinstance(i, LikeInteraction):
+            if i.target_type != "video":
+                continue
+            scores, key, kind = videos, i.target_id, i.like_type
+        elif isinstance(i, CommentInteraction):
+            scores, key, kind = videos, i.video_id, "comment" if i.parent_comment_id is None else "reply"
+        else:
+            scores, key, kind = channels, i.channel_id, i.action_type
+        scores[key] = scores.get(key, 0.0) + TRENDING_WEIGHTS[kind] * math.exp(-rate * (now.timestamp() - i.created_ts))
+    return videos, channels
+
+
+def assert_close(actual, expected):
+    assert len(actual) == len(expected)
+    for key, score in actual:
+        assert math.isclose(score, expected[key], rel_tol=1e-6, abs_tol=1e-12), key
+
+
+#Kısa yarılanma süresinde üs sınırı aşılır ve puanlar yeniden ölçeklenir
+@pytest.mark.parametrize("half_life", [timedelta(hours=6), timedelta(seconds=30)])
+def test_scores_match_brute_force(half_life):
+    rng = random.Random(24)
+    now = [START]
+    engine = TrendingEngine(half_life=half_life, clock=lambda: now[0])
+    manager = InteractionManager()
+    manager.attach(engine)
+    items = []
+    for step in range(1500):
+        now[0] += timedelta(seconds=rng.randint(0, 120))
+        k = rng.random()
+        if k < 0.5:
+            i = LikeInteraction(f"l{step}", f"u{step}", f"v{rng.randint(0, 20)}",
+                                rng.choice(["video", "video", "comment"]), rng.choice(["like", "dislike"]))
+        elif k < 0.8:
+            i = CommentInteraction(f"c{step}", "u", f"v{rng.randint(0, 20)}", "selam",
+                                   rng.choice([None, "c1"]))
+        else:
+            i = SubscriptionInteraction(f"s{step}", "u", f"ch{rng.randint(0, 5)}",
+                                        rng.choice(["subscribe", "subscribe", "unsubscribe"]))
+        i.created_at = now[0] - timedelta(seconds=rng.randint(0, 60))
+        items.append(i)
+        manager.add_interaction(i)
+        other = rng.choice(items)
+        k = rng.random()
+        if k < 0.05:
+            other.mark_as_deleted() if other.status != "deleted" else other.restore()
+        elif k < 0.08 and isinstance(other, LikeInteraction):
+            other.toggle()
+        elif k < 0.1:
+            other.created_at = now[0] - timedelta(seconds=rng.randint(0, 600))
+        elif k < 0.11 and isinstance(other, LikeInteraction):
+            other.target_type = rng.choice(["video", "comment"])
+        elif k < 0.12 and isinstance(other, SubscriptionInteraction):
+            other.action_type = rng.choice(["subscribe", "unsubscribe"])
+        if step % 100 == 0:
+            videos, channels = brute_force(items, now[0], half_life)
+            assert_close(engine.top_videos(1000), videos)
+            assert_close(engine.top_channels(1000), channels)
+            top = [score for _, score in engine.top_videos(5)]
+            assert top == sorted(top, reverse=True)
+
+
+def test_report_uses_engine_and_removal_reverts():
+    now = [START]
+    engine = TrendingEngine(clock=lambda: now[0])
+    manager = InteractionManager()
+    manager.attach(engine)
+    for n in range(30):
+        like = LikeInteraction(f"l{n}", f"u{n}", "v1" if n % 3 else "v2")
+        like.created_at = START
+        manager.add_interaction(like)
+    now[0] = START + timedelta(hours=6)
+    assert engine.video_score("v1") == pytest.approx(20 * TRENDING_WEIGHTS["like"] / 2)
+    plain = InteractionReport(manager.interactions, clock=lambda: now[0])
+    ranked = InteractionReport(manager.interactions, clock=lambda: now[0], trending=engine)
+    assert [v["video_id"] for v in plain.trending_videos(2)] == [v["video_id"] for v in ranked.trending_videos(2)] == ["v1", "v2"]
+
+    manager.remove_interaction("l0")
+    assert engine.video_score("v2") == pytest.approx(9 * TRENDING_WEIGHTS["like"] / 2)
+    manager.clear_all()
+    assert len(engine) == 0 and engine.top_videos() == []
+    with pytest.raises(ValueError):
+        TrendingEngine(half_life=timedelta(0))
@@ -0,0 +1,83 @@
+import random
+from datetime import datetime, timedelta
+
+from interactions.base import InteractionBase
+from interactions.manager import InteractionManager
+from interactions.storage import InteractionStore
+from interactions.comment import CommentInteraction
+from interactions.like import LikeInteraction
+from interactions.subscription import SubscriptionInteraction
+
+
+def make(rng: random.Random, n: int, duplicate_ids: bool) -> InteractionBase:
+    comment_id = f"c{n % 700}" if duplicate_ids else f"c{n}"
+    i = [
+        CommentInteraction(comment_id, f"u{n % 37}", f"v{n % 11}", f"metin {n % 13} abc"),
+        LikeInteraction(f"l{n}", f"u{n % 37}", f"v{n % 11}", rng.choice(["video", "comment"])),
+        SubscriptionInteraction(f"s{n}", f"u{n % 37}", f"ch{n % 5}"),
+    ][n % 3]
+    i.created_at = datetime.now() - timedelta(hours=rng.uniform(0, 100))
+    return i
+
+
+#Vacuum sonrası tüm türetilmiş yapılar sıfırdan kurulan bir manager ile aynı olmalı
+def assert_rebuilt_equal(manager: InteractionManager) -> None:
+    ref = InteractionManager(text_index=True)
+    for i in manager.interactions:
+        ref.add_interaction(i)
+    try:
+        assert manager.count_by_status() == ref.count_by_status()
+        assert manager.count_by_type() == ref.count_by_type()
+        assert manager.count_likes() == ref.count_likes()
+        for user in ("u1", "u5"):
+            assert manager.get_by_user(user) == ref.get_by_user(user)
+        for cls in (InteractionBase, CommentInteraction, LikeInteraction, SubscriptionInteraction):
+            assert manager.get_by_type(cls) == ref.get_by_type(cls)
+        for key in [f"c{n}" for n in range(0, 700, 37)] + ["l5"]:
+            assert manager.get_by_id(key) is ref.get_by_id(key)
+        assert manager.get_comments_by_video("v3") == ref.get_comments_by_video("v3")
+        assert manager.get_video_likes("v2") == ref.get_video_likes("v2")
+        assert manager.search_comments("metin 1") == ref.search_comments("metin 1")
+        since = datetime.now() - timedelta(hours=30)
+        assert manager.timeline.count_since(since) == ref.timeline.count_since(since)
+    finally:
+        for i in ref.interactions:
+            i.remove_observer(ref._listener)
+
+
+def run(duplicate_ids: bool, store: InteractionStore | None = None) -> InteractionManager:
+    rng = random.Random(14)
+    manager = InteractionManager(text_index=True)
+    if store is not None:
+        store.recover(manager)
+    n = 0
+    for _ in range(6):
+        for _ in range(400):
+            manager.add_interaction(make(rng, n, duplicate_ids))
+            n += 1
+        for i in rng.sample(manager.interactions, 120):
+            i.mark_as_deleted()
+        manager.vacuum(retention_seconds=3600 * 50, max_items=500)
+        assert_rebuilt_equal(manager)
+    total = manager.vacuum_all(3600 * 10)
+    assert total["done"] and total["removed"] > 0
+    assert_rebuilt_equal(manager)
+    return manager
+
+
+def test_incremental_vacuum_keeps_indexes_consistent():
+    manager = run(duplicate_ids=False)
+    assert not any(i.is_deleted() and i.created_ts <= datetime.now().timestamp() - 3600 * 10
+                   for i in manager.interactions)
+
+
+def test_vacuum_with_duplicate_ids():
+    run(duplicate_ids=True)
+
+
+def test_vacuum_is_replayed_from_log(tmp_path):
+    store = InteractionStore(str(tmp_path))
+    manager = run(duplicate_ids=False, store=store)
+    expected = [i.to_dict() for i in manager.interactions]
+    store.close()
+    assert [i.to_dict() for i in InteractionStore(str(tmp_path)).recover().interactions] == expected